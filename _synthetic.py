@@ -0,0 +1,123 @@
+"""
+Deterministic synthetic RentCast records.
+
+Records mirror the shape of real API responses (including nested agent, office,
+HOA and history objects), so ``SyntheticTransport`` serves realistic pages and
+parsing costs measured against them are representative. The same index and
+seed always produce the same record.
+"""
+from __future__ import annotations
+
+import random
+from typing import Any
+
+CITIES = [
+    ("Austin", "TX", "Travis", "78704", 30.2672, -97.7431),
+    ("San Antonio", "TX", "Bexar", "78244", 29.4241, -98.4936),
+    ("Denver", "CO", "Denver", "80205", 39.7392, -104.9903),
+    ("Phoenix", "AZ", "Maricopa", "85004", 33.4484, -112.0740),
+]
+PROPERTY_TYPES = ["Single Family", "Condo", "Townhouse", "Multi-Family", "Apartment"]
+# The rental listing model spells multi-family without the hyphen.
+RENTAL_PROPERTY_TYPES = ["Single Family", "Condo", "Townhouse", "Multi Family", "Apartment"]
+
+
+def _address(rng: random.Random, index: int) -> dict[str, Any]:
+    city, state, county, zip_code, lat, lon = CITIES[index % len(CITIES)]
+    street = f"{100 + index} {rng.choice(['Oak', 'Elm', 'Main', 'Lake'])} St"
+    formatted = f"{street}, {city}, {state} {zip_code}"
+    return {
+        "id": formatted.replace(" ", "-"),
+        "formattedAddress": formatted,
+        "addressLine1": street,
+        "addressLine2": None,
+        "city": city,
+        "state": state,
+        "zipCode": zip_code,
+        "county": county,
+        "latitude": round(lat + rng.uniform(-0.2, 0.2), 6),
+        "longitude": round(lon + rng.uniform(-0.2, 0.2), 6),
+    }
+
+
+def _listing(
+    rng: random.Random,
+    index: int,
+    price: float,
+    property_types: list[str] = PROPERTY_TYPES,
+) -> dict[str, Any]:
+    listed = f"2024-{1 + index % 12:02d}-{1 + index % 28:02d}T00:00:00.000Z"
+    return {
+        **_address(rng, index),
+        "propertyType": rng.choice(property_types),
+        "bedrooms": rng.randint(1, 5),
+        "bathrooms": rng.choice([1, 1.5, 2, 2.5, 3]),
+        "squareFootage": rng.randint(600, 4000),
+        "lotSize": rng.randint(1000, 12000),
+        "yearBuilt": rng.randint(1950, 2023),
+        "hoa": {"fee": rng.choice([None, 45.0, 150.0])},
+        "status": "Active",
+        "price": price,
+        "listingType": "Standard",
+        "listedDate": listed,
+        "removedDate": None,
+        "createdDate": listed,
+        "lastSeenDate": "2024-12-01T00:00:00.000Z",
+        "daysOnMarket": rng.randint(1, 200),
+        "mlsName": "CentralTexas",
+        "mlsNumber": str(100000 + index),
+        "listingAgent": {
+            "name": f"Agent {index}",
+            "phone": "5125551234",
+            "email": f"agent{index}@example.com",
+            "website": "https://example.com",
+        },
+        "listingOffice": {
+            "name": f"Office {index % 50}",
+            "phone": "5125554321",
+            "email": "office@example.com",
+            "website": "https://example.com",
+        },
+        "history": {
+            listed[:10]: {
+                "event": "Sale Listing",
+                "price": price,
+                "listingType": "Standard",
+                "listedDate": listed,
+                "removedDate": None,
+                "daysOnMarket": rng.randint(1, 200),
+            }
+        },
+    }
+
+
+def sale_listing(index: int, seed: int = 0) -> dict[str, Any]:
+    """A sale listing record as returned by ``/listings/sale``."""
+    rng = random.Random(seed * 1_000_003 + index)
+    return _listing(rng, index, float(rng.randint(150, 900) * 1000))
+
+
+def rental_listing(index: int, seed: int = 0) -> dict[str, Any]:
+    """A rental listing record as returned by ``/listings/rental/long-term``."""
+    rng = random.Random(seed * 1_000_003 + index)
+    return _listing(rng, index, float(rng.randint(900, 4500)), RENTAL_PROPERTY_TYPES)
+
+
+def property_record(index: int, seed: int = 0) -> dict[str, Any]:
+    """A property record as returned by ``/properties``."""
+    rng = random.Random(seed * 1_000_003 + index)
+    address = _address(rng, index)
+    return {
+        **address,
+        "propertyId": str(10_000_000 + index),
+        "address": address["formattedAddress"],
+        "propertyType": rng.choice(PROPERTY_TYPES),
+        "bedrooms": rng.randint(1, 5),
+        "bathrooms": rng.choice([1, 1.5, 2, 2.5, 3]),
+        "squareFeet": rng.randint(600, 4000),
+        "lotSize": rng.randint(1000, 12000),
+        "yearBuilt": rng.randint(1950, 2023),
+        "lastSoldDate": "2019-06-14T00:00:00.000Z",
+        "lastSoldPrice": float(rng.randint(150, 900) * 1000),
+        "ownerOccupied": rng.random() < 0.6,
+    }
@@ -0,0 +1,11 @@
+"""
+RentCast data analysis.
+
+This package provides vectorized analytics over RentCast responses.
+"""
+from .comparables import ComparablesFrame, comparables_frame
+
+__all__ = [
+    "ComparablesFrame",
+    "comparables_frame",
+]
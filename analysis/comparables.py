@@ -0,0 +1,338 @@
+"""
+Vectorized analysis of AVM comparables.
+
+``ComparablesFrame`` holds the comparables of one or many rent/value estimates
+as NumPy columns plus a ``group`` column mapping every comparable to the
+estimate it came from. Filtering, outlier trimming and (weighted) statistics
+are array operations over all estimates at once, and every statistic returns one
+value per estimate.
+
+Requires ``numpy`` (``pip install numpy``).
+"""
+from __future__ import annotations
+
+from typing import Any, Iterable, Sequence
+
+from pydantic import BaseModel
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+# Numeric comparable fields: (column name, JSON key).
+COLUMNS: list[tuple[str, str]] = [
+    ("price", "price"),
+    ("square_footage", "squareFootage"),
+    ("bedrooms", "bedrooms"),
+    ("bathrooms", "bathrooms"),
+    ("lot_size", "lotSize"),
+    ("year_built", "yearBuilt"),
+    ("days_on_market", "daysOnMarket"),
+    ("distance", "distance"),
+    ("days_old", "daysOld"),
+    ("correlation", "correlation"),
+    ("latitude", "latitude"),
+    ("longitude", "longitude"),
+]
+
+# Added to distances (in miles) before inverse-distance weighting, so a
+# comparable at the subject's own location does not get an infinite weight.
+DISTANCE_SMOOTHING = 0.1
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Comparable analysis requires numpy (pip install numpy)")
+
+
+def _comparables(estimate: Any) -> Sequence[Any]:
+    if isinstance(estimate, dict):
+        return estimate.get("comparables") or []
+    return estimate.comparables
+
+
+def _row(comparable: Any) -> tuple[Any, ...]:
+    if isinstance(comparable, dict):
+        return tuple(comparable.get(key) for _, key in COLUMNS)
+    return tuple(getattr(comparable, name, None) for name, _ in COLUMNS)
+
+
+class ComparablesFrame:
+    """
+    Columnar view over the comparables of one or more estimates.
+
+    Missing values are stored as NaN. Statistics return an array with one value
+    per estimate (NaN for estimates with no usable comparables).
+
+    Example:
+        ```python
+        frame = ComparablesFrame.from_estimates(estimates)
+        frame = frame.where(max_distance=1.0, max_days_old=180).trim_outliers()
+        ppsf = frame.mean("price_per_sqft", weights="correlation")
+        ```
+    """
+
+    def __init__(
+        self,
+        columns: dict[str, np.ndarray],
+        group: np.ndarray,
+        n_groups: int,
+        ids: np.ndarray | None = None,
+    ) -> None:
+        _require_numpy()
+        self.columns = columns
+        self.group = group
+        self.n_groups = n_groups
+        self.ids = ids if ids is not None else np.empty(len(group), dtype=object)
+
+    @classmethod
+    def from_estimates(cls, estimates: Iterable[Any]) -> ComparablesFrame:
+        """
+        Build a frame from estimate responses.
+
+        Args:
+            estimates: ``RentEstimateResponse``/``ValueEstimateResponse`` models
+                or their raw JSON objects. The position of each estimate is its
+                group number.
+        """
+        _require_numpy()
+        rows: list[tuple[Any, ...]] = []
+        groups: list[int] = []
+        ids: list[Any] = []
+        n_groups = 0
+        for n_groups, estimate in enumerate(estimates, start=1):
+            comparables = _comparables(estimate)
+            rows.extend(map(_row, comparables))
+            groups.extend([n_groups - 1] * len(comparables))
+            ids.extend(
+                c.get("id") if isinstance(c, dict) else getattr(c, "id", None)
+                for c in comparables
+            )
+
+        if rows:
+            # None becomes NaN in a float array.
+            values = np.array(rows, dtype=np.float64).T
+        else:
+            values = np.empty((len(COLUMNS), 0), dtype=np.float64)
+        columns = {name: values[i] for i, (name, _) in enumerate(COLUMNS)}
+        return cls(
+            columns,
+            np.array(groups, dtype=np.int64),
+            n_groups,
+            np.array(ids, dtype=object),
+        )
+
+    @classmethod
+    def from_estimate(cls, estimate: Any) -> ComparablesFrame:
+        """Build a frame from a single estimate response."""
+        return cls.from_estimates([estimate])
+
+    def __len__(self) -> int:
+        return len(self.group)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self._values(column)
+
+    @property
+    def price_per_sqft(self) -> np.ndarray:
+        """Price per square foot of every comparable (NaN without square footage)."""
+        square_footage = self.columns["square_footage"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(
+                square_footage > 0, self.columns["price"] / square_footage, np.nan
+            )
+
+    def _values(self, column: str) -> np.ndarray:
+        if column == "price_per_sqft":
+            return self.price_per_sqft
+        try:
+            return self.columns[column]
+        except KeyError:
+            raise ValueError(f"Invalid column: {column}") from None
+
+    def filter(self, mask: np.ndarray) -> ComparablesFrame:
+        """Keep the comparables where ``mask`` is true."""
+        return ComparablesFrame(
+            {name: values[mask] for name, values in self.columns.items()},
+            self.group[mask],
+            self.n_groups,
+            self.ids[mask],
+        )
+
+    def where(
+        self,
+        *,
+        bedrooms: float | None = None,
+        min_bedrooms: float | None = None,
+        max_bedrooms: float | None = None,
+        bathrooms: float | None = None,
+        min_bathrooms: float | None = None,
+        max_bathrooms: float | None = None,
+        max_days_old: int | None = None,
+        max_distance: float | None = None,
+        min_correlation: float | None = None,
+    ) -> ComparablesFrame:
+        """
+        Keep the comparables matching every given criterion.
+
+        Returns:
+            A new frame; comparables with a missing value for a filtered column
+            are dropped.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for column, op, bound in (
+            ("bedrooms", np.equal, bedrooms),
+            ("bedrooms", np.greater_equal, min_bedrooms),
+            ("bedrooms", np.less_equal, max_bedrooms),
+            ("bathrooms", np.equal, bathrooms),
+            ("bathrooms", np.greater_equal, min_bathrooms),
+            ("bathrooms", np.less_equal, max_bathrooms),
+            ("days_old", np.less_equal, max_days_old),
+            ("distance", np.less_equal, max_distance),
+            ("correlation", np.greater_equal, min_correlation),
+        ):
+            if bound is not None:
+                mask &= op(self.columns[column], bound)
+        return self.filter(mask)
+
+    def _sorted_by_group(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Non-NaN values sorted by (group, value), with each group's start and size."""
+        valid = ~np.isnan(values)
+        groups = self.group[valid]
+        values = values[valid]
+        order = np.lexsort((values, groups))
+        counts = np.bincount(groups, minlength=self.n_groups)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+        return values[order], starts, counts
+
+    def quantile(self, column: str, q: float) -> np.ndarray:
+        """Per-estimate quantile of a column, with linear interpolation."""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        values, starts, counts = self._sorted_by_group(self._values(column))
+        result = np.full(self.n_groups, np.nan)
+        present = counts > 0
+        position = starts[present] + q * (counts[present] - 1)
+        low = np.floor(position).astype(np.int64)
+        high = np.ceil(position).astype(np.int64)
+        fraction = position - low
+        result[present] = values[low] * (1 - fraction) + values[high] * fraction
+        return result
+
+    def median(self, column: str = "price") -> np.ndarray:
+        """Per-estimate median of a column."""
+        return self.quantile(column, 0.5)
+
+    def _weights(self, weights: str | np.ndarray | None, power: float) -> np.ndarray:
+        if weights is None:
+            return np.ones(len(self))
+        if isinstance(weights, str):
+            if weights == "distance":
+                return 1.0 / (self.columns["distance"] + DISTANCE_SMOOTHING) ** power
+            if weights == "correlation":
+                return self.columns["correlation"] ** power
+            raise ValueError("weights must be 'distance', 'correlation', an array or None")
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.shape != self.group.shape:
+            raise ValueError("weights must have one value per comparable")
+        return weights
+
+    def count(self, column: str | None = None) -> np.ndarray:
+        """Number of comparables per estimate (with a value for ``column`` if given)."""
+        groups = self.group
+        if column is not None:
+            groups = groups[~np.isnan(self._values(column))]
+        return np.bincount(groups, minlength=self.n_groups)
+
+    def mean(
+        self,
+        column: str = "price",
+        *,
+        weights: str | np.ndarray | None = None,
+        power: float = 1.0,
+    ) -> np.ndarray:
+        """
+        Per-estimate (weighted) mean of a column.
+
+        Args:
+            column: Column name, or ``"price_per_sqft"``.
+            weights: ``"distance"`` (inverse distance), ``"correlation"``, an
+                array with one weight per comparable, or None for equal weights.
+            power: Exponent applied to distance or correlation weights.
+        """
+        values = self._values(column)
+        w = self._weights(weights, power)
+        valid = ~(np.isnan(values) | np.isnan(w))
+        numerator = np.bincount(
+            self.group[valid], weights=values[valid] * w[valid], minlength=self.n_groups
+        )
+        denominator = np.bincount(self.group[valid], weights=w[valid], minlength=self.n_groups)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(denominator > 0, numerator / denominator, np.nan)
+
+    def std(
+        self,
+        column: str = "price",
+        *,
+        weights: str | np.ndarray | None = None,
+        power: float = 1.0,
+    ) -> np.ndarray:
+        """Per-estimate (weighted) population standard deviation of a column."""
+        values = self._values(column)
+        means = self.mean(column, weights=weights, power=power)
+        deviations = (values - means[self.group]) ** 2
+        w = self._weights(weights, power)
+        valid = ~(np.isnan(deviations) | np.isnan(w))
+        numerator = np.bincount(
+            self.group[valid], weights=deviations[valid] * w[valid], minlength=self.n_groups
+        )
+        denominator = np.bincount(self.group[valid], weights=w[valid], minlength=self.n_groups)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.sqrt(np.where(denominator > 0, numerator / denominator, np.nan))
+
+    def trim_outliers(self, column: str = "price_per_sqft", k: float = 1.5) -> ComparablesFrame:
+        """
+        Drop comparables outside each estimate's interquartile fences.
+
+        A comparable is kept when its value lies within
+        ``[Q1 - k * IQR, Q3 + k * IQR]`` of its own estimate. Comparables with a
+        missing value are kept.
+        """
+        values = self._values(column)
+        q1 = self.quantile(column, 0.25)
+        q3 = self.quantile(column, 0.75)
+        spread = k * (q3 - q1)
+        low = (q1 - spread)[self.group]
+        high = (q3 + spread)[self.group]
+        keep = np.isnan(values) | ((values >= low) & (values <= high))
+        return self.filter(keep)
+
+    def summary(self) -> dict[str, np.ndarray]:
+        """
+        Common per-estimate statistics.
+
+        Returns:
+            Mapping of statistic name to an array with one value per estimate.
+        """
+        return {
+            "count": self.count(),
+            "price_median": self.median("price"),
+            "price_mean": self.mean("price"),
+            "price_correlation_weighted": self.mean("price", weights="correlation"),
+            "price_distance_weighted": self.mean("price", weights="distance"),
+            "price_per_sqft_median": self.median("price_per_sqft"),
+            "price_per_sqft_correlation_weighted": self.mean(
+                "price_per_sqft", weights="correlation"
+            ),
+            "price_per_sqft_distance_weighted": self.mean("price_per_sqft", weights="distance"),
+            "distance_mean": self.mean("distance"),
+            "days_old_median": self.median("days_old"),
+        }
+
+
+def comparables_frame(estimates: BaseModel | Iterable[Any]) -> ComparablesFrame:
+    """Build a ComparablesFrame from one estimate response or an iterable of them."""
+    if isinstance(estimates, (BaseModel, dict)):
+        return ComparablesFrame.from_estimate(estimates)
+    return ComparablesFrame.from_estimates(estimates)
@@ -0,0 +1,133 @@
+"""
+Bulk request helpers for the RentCast API client.
+
+Bulk helpers run one coroutine per input item with bounded concurrency over
+the client's shared connection pool and rate limiter. Failures are captured
+per item instead of aborting the whole batch.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    TypeVar,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_CONCURRENCY = 10
+
+
+class BulkResult(Generic[T, R]):
+    """Outcome of a single item in a bulk request."""
+
+    __slots__ = ("index", "item", "value", "error")
+
+    def __init__(
+        self,
+        index: int,
+        item: T,
+        value: R | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        self.index = index
+        self.item = item
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request for this item succeeded."""
+        return self.error is None
+
+    def unwrap(self) -> R:
+        """Return the value, re-raising the captured error if the item failed."""
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def __repr__(self) -> str:
+        outcome = f"value={self.value!r}" if self.ok else f"error={self.error!r}"
+        return f"BulkResult(index={self.index}, item={self.item!r}, {outcome})"
+
+
+async def bulk_as_completed(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> AsyncIterator[BulkResult[T, R]]:
+    """
+    Run ``func`` for every item and yield results as they complete.
+
+    Items are pulled from ``items`` lazily by ``concurrency`` workers, so large
+    (or streaming) inputs never have more than ``concurrency`` requests in
+    flight or pending.
+
+    Args:
+        func: Coroutine function called once per item.
+        items: Input items.
+        concurrency: Maximum number of calls running at once.
+
+    Yields:
+        BulkResult for each item, in completion order.
+    """
+    if concurrency < 1:
+        raise ValueError("Concurrency must be at least 1")
+
+    iterator = enumerate(items)
+    results: asyncio.Queue[BulkResult[T, R] | None] = asyncio.Queue()
+
+    async def worker() -> None:
+        for index, item in iterator:
+            try:
+                result = BulkResult(index, item, value=await func(item))
+            except Exception as e:
+                result = BulkResult(index, item, error=e)
+            await results.put(result)
+
+    async def run_workers() -> None:
+        try:
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+        finally:
+            await results.put(None)
+
+    runner = asyncio.ensure_future(run_workers())
+    try:
+        while (result := await results.get()) is not None:
+            yield result
+        await runner
+    finally:
+        if not runner.done():
+            runner.cancel()
+            await asyncio.gather(runner, return_exceptions=True)
+
+
+async def bulk_map(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[BulkResult[T, R]]:
+    """
+    Run ``func`` for every item and return the results in input order.
+
+    Args:
+        func: Coroutine function called once per item.
+        items: Input items.
+        concurrency: Maximum number of calls running at once.
+
+    Returns:
+        One BulkResult per item, in the same order as ``items``.
+    """
+    results: list[Any] = []
+    async for result in bulk_as_completed(func, items, concurrency=concurrency):
+        results.append(result)
+    results.sort(key=lambda result: result.index)
+    return results
@@ -0,0 +1,315 @@
+"""
+Response caching for the RentCast API client.
+
+Every billed request that can be answered from a cache saves quota and a
+round-trip. Caches store the raw response body of successful GET requests,
+keyed on method, endpoint and normalized query parameters, with a TTL chosen
+per endpoint family and an LRU bound on the number of entries. Expired entries
+can optionally be kept for a grace period and served while the API is down.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+from ._endpoints import AVM, LISTINGS, MARKETS, OTHER, PROPERTIES, endpoint_family
+
+# Default time-to-live in seconds for each endpoint family. Listings change
+# daily, property records and AVM estimates far less often.
+DEFAULT_CACHE_TTLS: dict[str, float] = {
+    PROPERTIES: 24 * 60 * 60,
+    LISTINGS: 60 * 60,
+    AVM: 24 * 60 * 60,
+    MARKETS: 24 * 60 * 60,
+    OTHER: 60 * 60,
+}
+
+
+def make_cache_key(
+    method: str,
+    endpoint: str,
+    params: Mapping[str, Any] | None = None,
+) -> str:
+    """
+    Build a cache key for a request.
+
+    Parameters are normalized so that equivalent requests share an entry:
+    ``None`` values are dropped, values are compared as strings and keys are
+    sorted.
+    """
+    normalized = sorted(
+        (str(key), str(value).lower() if isinstance(value, bool) else str(value))
+        for key, value in (params or {}).items()
+        if value is not None
+    )
+    query = json.dumps(normalized, separators=(",", ":"))
+    return f"{method.upper()} /{endpoint.strip('/')} {query}"
+
+
+class ResponseCache(ABC):
+    """
+    Base class for response cache backends.
+
+    Backends store raw response bodies. Implementations must be safe to call
+    from multiple coroutines on the same event loop.
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] | None = None,
+        *,
+        stale_ttl: float = 0.0,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            ttls: Time-to-live in seconds per endpoint family (``"properties"``,
+                ``"listings"``, ``"avm"``, ``"markets"``, ``"other"``). Families
+                missing from the mapping use ``DEFAULT_CACHE_TTLS``; a TTL of 0
+                disables caching for that family.
+            stale_ttl: Seconds an expired entry is kept for ``get_stale``, which
+                the client uses while an endpoint's circuit breaker is open.
+        """
+        if stale_ttl < 0:
+            raise ValueError("stale_ttl must be 0 or greater")
+        self.ttls = {**DEFAULT_CACHE_TTLS, **(ttls or {})}
+        self.stale_ttl = stale_ttl
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Time-to-live in seconds for responses from ``endpoint``."""
+        return self.ttls.get(endpoint_family(endpoint), self.ttls[OTHER])
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Return the cached body for ``key``, or None if missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+
+    async def get_stale(self, key: str) -> bytes | None:
+        """
+        Return the body for ``key`` even if it has expired within ``stale_ttl``.
+
+        Backends that do not keep expired entries return None.
+        """
+        return None
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove ``key`` from the cache if present."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove every entry from the cache."""
+
+    async def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class MemoryCache(ResponseCache):
+    """In-process LRU response cache with per-entry expiry."""
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttls: Mapping[str, float] | None = None,
+        *,
+        stale_ttl: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the in-memory cache.
+
+        Args:
+            max_entries: Maximum number of responses kept; the least recently
+                used entry is evicted first.
+            ttls: Time-to-live in seconds per endpoint family.
+            stale_ttl: Seconds expired entries are kept for ``get_stale``.
+            clock: Clock used to compute expiry times.
+        """
+        super().__init__(ttls, stale_ttl=stale_ttl)
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        now = self._clock()
+        if expires_at <= now:
+            if expires_at + self.stale_ttl <= now:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    async def get_stale(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] + self.stale_ttl <= self._clock():
+            return None
+        self.stale_hits += 1
+        return entry[1]
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class SQLiteCache(ResponseCache):
+    """
+    On-disk LRU response cache backed by SQLite.
+
+    Entries survive process restarts. Lookups hit a local file through the
+    standard library ``sqlite3`` module and are fast enough to run directly on
+    the event loop.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = 100_000,
+        ttls: Mapping[str, float] | None = None,
+        *,
+        stale_ttl: float = 0.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the SQLite cache.
+
+        Args:
+            path: Path of the SQLite database file (created if missing).
+            max_entries: Maximum number of responses kept; the least recently
+                used entries are evicted first.
+            ttls: Time-to-live in seconds per endpoint family.
+            stale_ttl: Seconds expired entries are kept for ``get_stale``.
+            clock: Wall clock used for expiry, since entries outlive the process.
+        """
+        super().__init__(ttls, stale_ttl=stale_ttl)
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(str(self.path), isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+        )
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    async def get(self, key: str) -> bytes | None:
+        async with self._lock:
+            now = self._clock()
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            value, expires_at = row
+            if expires_at <= now:
+                if expires_at + self.stale_ttl <= now:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+            return bytes(value)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        async with self._lock:
+            now = self._clock()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), now + ttl, now),
+            )
+            # Counting rows is a table scan, so only enforce the bound periodically.
+            self._writes += 1
+            if self._writes % 100 == 0:
+                self._evict(now)
+
+    async def get_stale(self, key: str) -> bytes | None:
+        async with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ? AND expires_at > ?",
+                (key, self._clock() - self.stale_ttl),
+            ).fetchone()
+            if row is None:
+                return None
+            self.stale_hits += 1
+            return bytes(row[0])
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then the least recently used beyond the bound."""
+        self._conn.execute(
+            "DELETE FROM responses WHERE expires_at <= ?", (now - self.stale_ttl,)
+        )
+        excess = len(self) - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                (excess,),
+            )
+
+    async def delete(self, key: str) -> None:
+        async with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    async def clear(self) -> None:
+        async with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    async def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,242 @@
+"""
+Circuit breaking for the RentCast API client.
+
+When an endpoint family starts failing, waiting out timeouts and retry
+back-offs for every call only piles up stuck coroutines. A circuit breaker
+watches the error rate of each family (properties, listings, avm, markets) and,
+once it crosses a threshold, opens: calls fail immediately with
+``RentCastCircuitOpenError`` until a cool-down has passed. The breaker then lets
+a few probe requests through (half-open) and closes again once they succeed.
+"""
+from __future__ import annotations
+
+import math
+import time
+from typing import Callable
+
+from ._endpoints import endpoint_family
+from ._exceptions import RentCastCircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Error-rate circuit breaker for one endpoint family.
+
+    Outcomes are counted in one-second buckets over a sliding ``window``. The
+    breaker opens when at least ``min_requests`` outcomes were recorded in the
+    window and the share of failures reaches ``failure_rate``.
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        *,
+        failure_rate: float = 0.5,
+        min_requests: int = 20,
+        window: float = 30.0,
+        open_duration: float = 30.0,
+        half_open_requests: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            name: Name reported in errors, usually the endpoint family.
+            failure_rate: Share of failed requests (0-1] that opens the breaker.
+            min_requests: Requests needed in the window before the failure rate
+                is acted upon.
+            window: Length in seconds of the sliding error-rate window.
+            open_duration: Seconds the breaker stays open before probing.
+            half_open_requests: Probe requests allowed while half-open; the
+                breaker closes once that many succeed.
+            clock: Monotonic clock.
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be in (0, 1]")
+        if min_requests < 1 or half_open_requests < 1:
+            raise ValueError("min_requests and half_open_requests must be at least 1")
+        if window <= 0 or open_duration < 0:
+            raise ValueError("window must be positive and open_duration not negative")
+
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.open_duration = open_duration
+        self.half_open_requests = half_open_requests
+        self._clock = clock
+
+        self._state = CLOSED
+        self._generation = 0
+        self._opened_at = 0.0
+        # second -> [requests, failures]
+        self._buckets: dict[int, list[int]] = {}
+        self._probes = 0
+        self._probe_successes = 0
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """``"closed"``, ``"open"`` or ``"half_open"``."""
+        if self._state == OPEN and self._clock() >= self._opened_at + self.open_duration:
+            self._transition(HALF_OPEN)
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open breaker starts probing (0 if not open)."""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.open_duration - self._clock())
+
+    def _transition(self, state: str) -> None:
+        self._state = state
+        self._generation += 1
+        self._buckets.clear()
+        self._probes = 0
+        self._probe_successes = 0
+        if state == OPEN:
+            self._opened_at = self._clock()
+            self.opened += 1
+
+    def _reject(self) -> RentCastCircuitOpenError:
+        self.rejected += 1
+        return RentCastCircuitOpenError(self.name, retry_after=self.retry_after())
+
+    def check(self) -> None:
+        """
+        Raise if the breaker would reject a request right now.
+
+        Unlike ``acquire`` this reserves nothing, so it can be called before
+        sleeping for a retry to give up early.
+
+        Raises:
+            RentCastCircuitOpenError: If the breaker is open.
+        """
+        if self.state == OPEN:
+            raise self._reject()
+
+    def acquire(self) -> int:
+        """
+        Admit a request.
+
+        Returns:
+            The breaker generation, to be passed back to ``record``. Outcomes of
+            requests admitted before the last state change are ignored.
+
+        Raises:
+            RentCastCircuitOpenError: If the breaker is open, or half-open with
+                every probe slot taken.
+        """
+        state = self.state
+        if state == OPEN:
+            raise self._reject()
+        if state == HALF_OPEN:
+            if self._probes >= self.half_open_requests:
+                raise self._reject()
+            self._probes += 1
+        return self._generation
+
+    def record(self, generation: int, failed: bool | None) -> None:
+        """
+        Record the outcome of an admitted request.
+
+        Args:
+            generation: Value returned by the matching ``acquire``.
+            failed: True for a failure (5xx, timeout, connection error), False
+                for a response that shows the API is healthy, or None when the
+                request said nothing about the API's health (e.g. it was
+                cancelled); None only frees a half-open probe slot.
+        """
+        if generation != self._generation:
+            return
+        if self._state == HALF_OPEN:
+            self._probes -= 1
+            if failed:
+                self._transition(OPEN)
+            elif failed is False:
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_requests:
+                    self._transition(CLOSED)
+            return
+        if failed is None:
+            return
+
+        now = math.floor(self._clock())
+        bucket = self._buckets.get(now)
+        if bucket is None:
+            horizon = now - self.window
+            for second in [s for s in self._buckets if s <= horizon]:
+                del self._buckets[second]
+            bucket = self._buckets[now] = [0, 0]
+        bucket[0] += 1
+        bucket[1] += int(failed)
+        if not failed:
+            return
+
+        requests = sum(b[0] for b in self._buckets.values())
+        failures = sum(b[1] for b in self._buckets.values())
+        if requests >= self.min_requests and failures >= self.failure_rate * requests:
+            self._transition(OPEN)
+
+    def reset(self) -> None:
+        """Close the breaker and forget recorded outcomes."""
+        self._transition(CLOSED)
+
+    def stats(self) -> dict[str, float | int | str]:
+        """Current state, window counts and counters."""
+        return {
+            "state": self.state,
+            "requests": sum(b[0] for b in self._buckets.values()),
+            "failures": sum(b[1] for b in self._buckets.values()),
+            "opened": self.opened,
+            "rejected": self.rejected,
+            "retry_after": self.retry_after(),
+        }
+
+
+class CircuitBreakers:
+    """
+    One circuit breaker per endpoint family, created on first use.
+
+    Example:
+        ```python
+        breakers = CircuitBreakers(failure_rate=0.25, open_duration=10.0)
+        client = RentCastClient(api_key="...", circuit_breakers=breakers)
+        ```
+    """
+
+    def __init__(self, *, serve_stale: bool = True, **settings) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            serve_stale: While a breaker is open, answer GET requests with an
+                expired cache entry if the client's cache still holds one (see
+                the cache's ``stale_ttl``).
+            **settings: Keyword arguments for every ``CircuitBreaker``.
+        """
+        self.serve_stale = serve_stale
+        self._settings = settings
+        self._breakers: dict[str, CircuitBreaker] = {}
+        # Fail on invalid settings now rather than on the first request.
+        CircuitBreaker(**settings)
+
+    def __getitem__(self, family: str) -> CircuitBreaker:
+        breaker = self._breakers.get(family)
+        if breaker is None:
+            breaker = self._breakers[family] = CircuitBreaker(family, **self._settings)
+        return breaker
+
+    def for_endpoint(self, endpoint: str) -> CircuitBreaker:
+        """The breaker guarding ``endpoint``'s family."""
+        return self[endpoint_family(endpoint)]
+
+    def stats(self) -> dict[str, dict[str, float | int | str]]:
+        """Stats of every breaker created so far, by endpoint family."""
+        return {family: breaker.stats() for family, breaker in self._breakers.items()}
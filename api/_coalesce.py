@@ -0,0 +1,98 @@
+"""
+Request coalescing for the RentCast API client.
+
+When several coroutines ask for exactly the same resource at the same time,
+only one HTTP request needs to be made. ``SingleFlight`` lets concurrent
+callers with the same key share a single in-flight call and its result.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """A shared in-flight call and the number of callers waiting on it."""
+
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, future: asyncio.Future) -> None:
+        self.future = future
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """
+    Deduplicates concurrent calls that share a key.
+
+    The first caller for a key starts the call; callers arriving while it is in
+    flight wait for the same result (or exception). Once it finishes the key is
+    released, so later calls start a fresh request.
+    """
+
+    def __init__(self, clone: Callable[[T], T] | None = None) -> None:
+        """
+        Initialize the coalescer.
+
+        Args:
+            clone: Copies a result for each caller but the last one to collect
+                it, so a caller mutating its result does not affect the others
+                (e.g. ``copy.deepcopy``). Without it every caller gets the same
+                object.
+        """
+        self._inflight: dict[Hashable, _Flight] = {}
+        self._clone = clone
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``func`` once for all concurrent callers using ``key``.
+
+        One caller giving up does not cancel the call for the others, but once
+        every caller has been cancelled the call itself is cancelled, so no
+        request keeps running (and using rate-limit budget) for nobody.
+
+        Args:
+            key: Identity of the call; equal keys are coalesced.
+            func: Coroutine function performing the call.
+
+        Returns:
+            The result of the shared call, or a copy of it when ``clone`` is set
+            and other callers share the call.
+        """
+        flight = self._inflight.get(key)
+        if flight is None:
+            future = asyncio.ensure_future(func())
+            flight = self._inflight[key] = _Flight(future)
+            future.add_done_callback(lambda done: self._release(key, done))
+        flight.waiters += 1
+        try:
+            result = await asyncio.shield(flight.future)
+        except BaseException:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.future.done():
+                # The last caller left: drop the call so new callers start afresh.
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+                flight.future.cancel()
+            raise
+        flight.waiters -= 1
+        if flight.waiters and self._clone is not None:
+            # Others have yet to collect the result; the original goes to the
+            # last one, so no copy is taken from an already modified result.
+            return self._clone(result)
+        return result
+
+    def _release(self, key: Hashable, future: asyncio.Future) -> None:
+        """Forget a finished call and mark its exception as retrieved."""
+        flight = self._inflight.get(key)
+        if flight is not None and flight.future is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            # Every waiter may have been cancelled; avoid "exception was never
+            # retrieved" warnings in that case.
+            future.exception()
@@ -0,0 +1,246 @@
+"""
+Adaptive concurrency limiting for the RentCast API client.
+
+The number of requests in flight is capped by a limit that adapts to the
+API's response (AIMD): the limit grows by a fixed step each window of requests
+while it is fully used and p95 latency stays close to its baseline, and is cut
+by a factor on 429 responses, 5xx responses, timeouts and latency spikes. Bulk
+jobs therefore settle at the highest concurrency the API sustains without
+per-deployment tuning.
+
+Latency baselines are kept per endpoint family, since a valuation call is
+normally much slower than a listings page. When a family's latency stays high
+for several windows even after backing off, the shift is not caused by our
+concurrency, and the baseline is re-anchored at the new level instead of
+driving the limit down to its minimum.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+from collections import deque
+
+DEFAULT_INITIAL_LIMIT = 20
+DEFAULT_MAX_LIMIT = 256
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    """Nearest-rank percentile of a non-empty list of samples."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)]
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Async concurrency limiter with an additive-increase/multiplicative-decrease limit.
+
+    Callers take a slot with ``acquire`` before sending a request and give it
+    back with ``release``, reporting the request latency or an overload signal.
+    Waiters are served in FIFO order.
+
+    Example:
+        ```python
+        epoch = await limiter.acquire()
+        started = time.monotonic()
+        response = await send()
+        limiter.release(
+            epoch,
+            latency=time.monotonic() - started,
+            overloaded=response.status_code == 429,
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = 1,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        *,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+        min_window: int = 20,
+        smoothing: float = 0.1,
+        reanchor_windows: int = 3,
+    ) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit: Number of requests allowed in flight at first.
+            min_limit: Lowest limit the limiter backs off to.
+            max_limit: Highest limit the limiter grows to.
+            increase: Amount the limit grows by per window without congestion.
+            decrease: Factor the limit is multiplied by on congestion.
+            latency_tolerance: A window whose p95 latency exceeds the baseline p95
+                by this factor counts as a latency spike.
+            min_window: Minimum number of latency samples per window. A window is
+                also never shorter than the current limit, so the limit grows
+                about once per round trip.
+            smoothing: Weight of each new window in the baseline p95.
+            reanchor_windows: Consecutive latency-spike windows of an endpoint
+                family after which its baseline is reset to the current p95
+                instead of backing off again.
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= max_limit")
+        if increase <= 0:
+            raise ValueError("increase must be greater than 0")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        if latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be greater than 1")
+        if reanchor_windows < 1:
+            raise ValueError("reanchor_windows must be at least 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.min_window = min_window
+        self.smoothing = smoothing
+        self.reanchor_windows = reanchor_windows
+
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        # Per endpoint family: latency window, baseline p95 and spike streak.
+        self._samples: dict[str, list[float]] = {}
+        self._spikes: dict[str, int] = {}
+        self.baselines: dict[str, float] = {}
+        self._saturated = False
+        self._epoch = 0
+        self.increases = 0
+        self.decreases = 0
+        self.reanchors = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of slots currently taken."""
+        return self._in_flight
+
+    def _take(self) -> int:
+        self._in_flight += 1
+        if self._in_flight >= self.limit:
+            self._saturated = True
+        return self._epoch
+
+    async def acquire(self) -> int:
+        """
+        Wait for a free slot and take it.
+
+        Returns:
+            The limiter epoch, to be passed back to ``release``. Overload
+            signals from requests started before the last decrease are ignored,
+            so one burst of 429s only backs the limit off once.
+        """
+        if not self._waiters and self._in_flight < self.limit:
+            return self._take()
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the waiter was cancelled.
+                self._in_flight -= 1
+                self._wake()
+            else:
+                self._waiters.remove(waiter)
+            raise
+        return self._epoch
+
+    def release(
+        self,
+        epoch: int,
+        *,
+        latency: float | None = None,
+        overloaded: bool = False,
+        family: str = "",
+    ) -> None:
+        """
+        Give a slot back and adjust the limit.
+
+        Args:
+            epoch: Value returned by the matching ``acquire``.
+            latency: Response time of the request in seconds, or None if it did
+                not produce a meaningful sample (e.g. a connection error).
+            overloaded: Whether the request was throttled, failed with a 5xx
+                status or timed out.
+            family: Endpoint family of the request, whose latency baseline the
+                sample is compared with.
+        """
+        self._in_flight -= 1
+        if overloaded:
+            if epoch == self._epoch:
+                self._back_off()
+        elif latency is not None:
+            self._record(family, latency)
+        self._wake()
+
+    def _record(self, family: str, latency: float) -> None:
+        samples = self._samples.setdefault(family, [])
+        samples.append(latency)
+        if len(samples) < max(self.min_window, self.limit):
+            return
+
+        p95 = _percentile(samples, 0.95)
+        saturated = self._saturated
+        self._samples[family] = []
+        self._saturated = self._in_flight >= self.limit
+
+        baseline = self.baselines.get(family)
+        if baseline is None:
+            self.baselines[family] = p95
+        elif p95 > baseline * self.latency_tolerance:
+            spikes = self._spikes.get(family, 0) + 1
+            if spikes < self.reanchor_windows:
+                self._spikes[family] = spikes
+                self._back_off()
+                return
+            # Backing off did not bring latency down, so it is the endpoint's
+            # new normal rather than congestion we caused.
+            self.baselines[family] = p95
+            self._spikes[family] = 0
+            self.reanchors += 1
+        else:
+            self._spikes[family] = 0
+            self.baselines[family] = baseline + self.smoothing * (p95 - baseline)
+
+        if saturated and self._limit < self.max_limit:
+            self._limit = min(self.max_limit, self._limit + self.increase)
+            self.increases += 1
+
+    def _back_off(self) -> None:
+        self._limit = max(self.min_limit, self._limit * self.decrease)
+        self._epoch += 1
+        self._samples = {}
+        self._saturated = False
+        self.decreases += 1
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._take()
+                waiter.set_result(None)
+
+    def stats(self) -> dict[str, int | dict[str, float]]:
+        """Current limit, slots in use, baselines by endpoint family and counters."""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "baseline_p95": dict(self.baselines),
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "reanchors": self.reanchors,
+        }
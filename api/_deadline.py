@@ -0,0 +1,75 @@
+"""
+End-to-end deadlines for the RentCast API client.
+
+``timeout`` bounds a single HTTP attempt, so a call that retries can take many
+times longer. A deadline bounds the whole call instead, including retries,
+back-off sleeps and waits for rate-limit tokens. Deadlines are stored in a
+context variable, so one set around a block of code applies to every request
+made inside it, including those of tasks started from it, and nested deadlines
+can only shorten the budget.
+
+Example:
+    ```python
+    with deadline(2.0):
+        record = await client.property_record.get_property_by_id(property_id)
+        estimate = await client.rent_estimate.get_rent_estimate(address=address)
+    ```
+"""
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+# Absolute time.monotonic() value by which the current call must finish.
+_deadline: ContextVar[float | None] = ContextVar("rentcast_deadline", default=None)
+
+
+def current_deadline() -> float | None:
+    """The active deadline as a ``time.monotonic()`` value, or None."""
+    return _deadline.get()
+
+
+def expiry(seconds: float | None) -> float | None:
+    """
+    Absolute deadline ``seconds`` from now, never later than the active one.
+
+    Returns the active deadline (possibly None) when ``seconds`` is None.
+    """
+    current = _deadline.get()
+    if seconds is None:
+        return current
+    expires = time.monotonic() + seconds
+    return expires if current is None else min(current, expires)
+
+
+def seconds_until(expires: float | None) -> float | None:
+    """Seconds left until an absolute deadline (negative once passed), or None."""
+    return None if expires is None else expires - time.monotonic()
+
+
+def time_remaining() -> float | None:
+    """Seconds left before the active deadline (negative once passed), or None."""
+    return seconds_until(_deadline.get())
+
+
+@contextmanager
+def deadline(seconds: float | None) -> Iterator[float | None]:
+    """
+    Run a block of code with a deadline of ``seconds`` from now.
+
+    A deadline already active in the context is kept if it is earlier. With
+    ``seconds`` set to None the active deadline is left unchanged.
+
+    Yields:
+        The absolute deadline in effect inside the block.
+    """
+    if seconds is None:
+        yield _deadline.get()
+        return
+    token = _deadline.set(expiry(seconds))
+    try:
+        yield _deadline.get()
+    finally:
+        _deadline.reset(token)
@@ -0,0 +1,57 @@
+"""
+Endpoint classification for the RentCast API.
+
+Several client features (cache TTLs, resilience settings) are configured per
+endpoint family rather than per individual path.
+"""
+from __future__ import annotations
+
+PROPERTIES = "properties"
+LISTINGS = "listings"
+AVM = "avm"
+MARKETS = "markets"
+OTHER = "other"
+
+ENDPOINT_FAMILIES = (PROPERTIES, LISTINGS, AVM, MARKETS)
+
+# Endpoints that return different data for identical requests, so a response
+# must never be reused for another call.
+NON_DETERMINISTIC_ENDPOINTS = ("properties/random",)
+
+
+def endpoint_family(endpoint: str) -> str:
+    """
+    Classify an endpoint path into its family.
+
+    Args:
+        endpoint: Endpoint path, with or without a leading slash
+            (e.g. ``"/properties/123"`` or ``"avm/rent/long-term"``).
+
+    Returns:
+        One of ``"properties"``, ``"listings"``, ``"avm"``, ``"markets"`` or
+        ``"other"``.
+    """
+    path = endpoint.lstrip("/")
+    if path.startswith("properties"):
+        return PROPERTIES
+    if path.startswith("listings"):
+        return LISTINGS
+    if path.startswith(("avm", "property-value")):
+        return AVM
+    if path.startswith("market"):
+        return MARKETS
+    return OTHER
+
+
+def is_deterministic(endpoint: str) -> bool:
+    """
+    Whether identical requests to an endpoint return the same data.
+
+    Responses of non-deterministic endpoints (e.g. ``/properties/random``) are
+    neither cached nor shared between concurrent callers.
+    """
+    path = endpoint.strip("/")
+    return not any(
+        path == prefix or path.startswith(prefix + "/")
+        for prefix in NON_DETERMINISTIC_ENDPOINTS
+    )
@@ -131,4 +131,23 @@ class RentCastNotFoundError(RentCastError):
         response: dict[str, Any] | None = None,
         **kwargs,
     ) -> None:
-        super().__init__(message, status_code, response, **kwargs)
\ No newline at end of file
+        super().__init__(message, status_code, response, **kwargs)
+
+
+class RentCastCircuitOpenError(RentCastError):
+    """Raised when a request is rejected because its endpoint family's circuit is open."""
+
+    def __init__(
+        self,
+        family: str,
+        retry_after: float | None = None,
+        message: str | None = None,
+        **kwargs,
+    ) -> None:
+        self.family = family
+        self.retry_after = retry_after
+        if message is None:
+            message = f"Circuit open for {family or 'RentCast'} endpoints"
+            if retry_after:
+                message = f"{message}; retrying in {retry_after:.1f} seconds"
+        super().__init__(message, **kwargs)
@@ -0,0 +1,149 @@
+"""
+Request hedging for the RentCast API client.
+
+A hedged request sends a second, identical request when the first has not
+answered within a latency threshold, and uses whichever response arrives first.
+The threshold is a high percentile of recent latencies for the endpoint family,
+so only the slowest few requests are hedged, and a token budget caps hedges at a
+small share of all calls so they never eat a meaningful part of the rate limit.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Awaitable, Callable, TypeVar
+
+from ._retry import RetryBudget
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """
+    Adaptive hedging for idempotent requests.
+
+    Example:
+        ```python
+        client = RentCastClient(
+            api_key="...",
+            hedge_policy=HedgePolicy(percentile=0.9, max_hedge_rate=0.05),
+        )
+        listing = await client.listings.sale_by_id.get_sale_listing_by_id(id, hedge=True)
+        ```
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        *,
+        max_hedge_rate: float = 0.05,
+        initial_delay: float = 0.5,
+        min_delay: float = 0.02,
+        max_delay: float = 5.0,
+        min_samples: int = 20,
+        window: int = 500,
+    ) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            percentile: Latency percentile (0-1) after which a hedge is sent.
+            max_hedge_rate: Hedges allowed per hedgeable call (0.05 caps hedges at
+                5% of those calls).
+            initial_delay: Threshold used until ``min_samples`` latencies have
+                been observed for an endpoint family.
+            min_delay: Lower bound on the threshold, in seconds.
+            max_delay: Upper bound on the threshold, in seconds.
+            min_samples: Latencies needed before the percentile is trusted.
+            window: Number of recent latencies kept per endpoint family.
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if not 0 < min_delay <= max_delay:
+            raise ValueError("Delays must satisfy 0 < min_delay <= max_delay")
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.budget = RetryBudget(max_hedge_rate, min_tokens=1.0)
+        self._latencies: dict[str, deque[float]] = {}
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def threshold(self, family: str) -> float:
+        """Seconds to wait for a response before hedging a call to ``family``."""
+        samples = self._latencies.get(family)
+        if samples is None or len(samples) < self.min_samples:
+            delay = self.initial_delay
+        else:
+            ordered = sorted(samples)
+            delay = ordered[min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)]
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def record(self, family: str, latency: float) -> None:
+        """Add a response latency to the family's window."""
+        samples = self._latencies.get(family)
+        if samples is None:
+            samples = self._latencies[family] = deque(maxlen=self.window)
+        samples.append(latency)
+
+    async def run(
+        self,
+        family: str,
+        call: Callable[[], Awaitable[T]],
+        *,
+        can_hedge: Callable[[], bool] = lambda: True,
+    ) -> T:
+        """
+        Run ``call``, hedging it with a second call if it is slow.
+
+        Args:
+            family: Endpoint family, whose latencies set the threshold.
+            call: Factory for the request; called once, or twice when hedging.
+            can_hedge: Extra check made before hedging, e.g. that the rate
+                limiter has spare capacity.
+
+        Returns:
+            The result of whichever call succeeds first. If both fail, the
+            primary call's error is raised.
+        """
+        self.calls += 1
+        self.budget.deposit()
+        started = time.monotonic()
+        primary = asyncio.ensure_future(call())
+        hedge: asyncio.Future[T] | None = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self.threshold(family))
+            if not done and can_hedge() and self.budget.withdraw():
+                self.hedges += 1
+                hedge = asyncio.ensure_future(call())
+
+            pending = {primary} if hedge is None else {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        # For a winning hedge this is a lower bound on the primary's latency.
+                        self.record(family, time.monotonic() - started)
+                        if task is hedge:
+                            self.hedge_wins += 1
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def stats(self) -> dict[str, float | int]:
+        """Call, hedge and hedge-win counters."""
+        return {
+            "calls": self.calls,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "hedge_rate": self.hedges / self.calls if self.calls else 0.0,
+        }
@@ -0,0 +1,162 @@
+"""
+API key rotation for the RentCast API client.
+
+RentCast rate limits are enforced per API key. A key pool spreads requests over
+several keys, each with its own token bucket and back-off state, so throughput
+scales with the number of keys. Keys rejected with 401 are taken out of
+rotation.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Sequence
+
+from ._exceptions import RentCastAuthenticationError
+from ._rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+def mask_api_key(api_key: str) -> str:
+    """Mask an API key for logging, keeping only its last four characters."""
+    return f"****{api_key[-4:]}" if len(api_key) > 4 else "****"
+
+
+class APIKeyState:
+    """Rate-limit state and usage counters for a single API key."""
+
+    def __init__(self, api_key: str, limiter: TokenBucket | None) -> None:
+        self.api_key = api_key
+        self.limiter = limiter
+        # Back-off for keys without a token bucket, which otherwise never wait.
+        self._blocked_until = 0.0
+        self.active = True
+        self.requests = 0
+        self.rate_limited = 0
+        self.errors = 0
+
+    @property
+    def masked_key(self) -> str:
+        """The API key with all but its last characters masked."""
+        return mask_api_key(self.api_key)
+
+    def delay(self) -> float:
+        """Seconds until this key may send its next request."""
+        if self.limiter is not None:
+            return self.limiter.delay()
+        return max(0.0, self._blocked_until - time.monotonic())
+
+    def block(self, seconds: float) -> None:
+        """Back this key off for ``seconds`` after a 429 response."""
+        self.rate_limited += 1
+        if self.limiter is not None:
+            self.limiter.block(seconds)
+        else:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def usage(self) -> dict[str, Any]:
+        """Usage counters for this key."""
+        return {
+            "key": self.masked_key,
+            "active": self.active,
+            "requests": self.requests,
+            "rate_limited": self.rate_limited,
+            "errors": self.errors,
+        }
+
+
+class APIKeyPool:
+    """
+    Rotates requests across several API keys.
+
+    Each request goes to the active key that can send soonest, with ties broken
+    round-robin so load is spread evenly when every key has spare capacity.
+    """
+
+    def __init__(
+        self,
+        api_keys: Sequence[str],
+        rate_limit: float | None = None,
+        burst: float | None = None,
+    ) -> None:
+        """
+        Initialize the key pool.
+
+        Args:
+            api_keys: RentCast API keys to rotate across. Duplicates are ignored.
+            rate_limit: Requests per second allowed per key (None disables pacing).
+            burst: Requests each key may send back-to-back.
+        """
+        keys = list(dict.fromkeys(k for k in api_keys if k))
+        if not keys:
+            raise RentCastAuthenticationError("No API key provided and none found in config")
+
+        self._keys = [
+            APIKeyState(key, TokenBucket(rate_limit, burst) if rate_limit else None)
+            for key in keys
+        ]
+        self._cursor = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def active_keys(self) -> list[APIKeyState]:
+        """Keys still in rotation."""
+        return [state for state in self._keys if state.active]
+
+    def _select(self) -> APIKeyState:
+        """Pick the active key with the shortest wait, round-robin on ties."""
+        count = len(self._keys)
+        best: APIKeyState | None = None
+        best_delay = 0.0
+        for i in range(count):
+            state = self._keys[(self._cursor + i) % count]
+            if not state.active:
+                continue
+            delay = state.delay()
+            if best is None or delay < best_delay:
+                best, best_delay = state, delay
+                if delay == 0.0:
+                    break
+
+        if best is None:
+            raise RentCastAuthenticationError("All API keys have been rejected by RentCast")
+
+        self._cursor = (self._keys.index(best) + 1) % count
+        return best
+
+    async def acquire(self) -> APIKeyState:
+        """Wait for a key with spare rate-limit budget and reserve one request on it."""
+        state = self._select()
+        if state.limiter is not None:
+            await state.limiter.acquire()
+        else:
+            delay = state.delay()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        state.requests += 1
+        return state
+
+    def wait_time(self) -> float:
+        """Seconds until some active key could send a request."""
+        return min((state.delay() for state in self._keys if state.active), default=0.0)
+
+    def has_capacity(self) -> bool:
+        """Whether some active key could send a request without waiting."""
+        return self.wait_time() == 0.0
+
+    def disable(self, state: APIKeyState) -> None:
+        """Remove a key from rotation, e.g. after a 401 response."""
+        if state.active:
+            state.active = False
+            logger.warning(
+                "RentCast API key %s was rejected and has been removed from rotation",
+                state.masked_key,
+            )
+
+    def usage(self) -> list[dict[str, Any]]:
+        """Per-key usage counters, in the order the keys were configured."""
+        return [state.usage() for state in self._keys]
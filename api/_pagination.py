@@ -0,0 +1,96 @@
+"""
+Pagination helpers for the RentCast API.
+
+The ``/properties``, ``/listings/sale`` and ``/listings/rental/long-term``
+endpoints return at most 500 records per request and are paged with the
+``limit`` and ``offset`` query parameters. A page shorter than ``limit`` (or an
+empty page) marks the end of the results.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# Largest page size accepted by the paginated endpoints.
+MAX_PAGE_SIZE = 500
+
+PageFetcher = Callable[[int, int], Awaitable[Sequence[T]]]
+
+
+async def paginate(
+    fetch_page: PageFetcher[T],
+    *,
+    page_size: int = MAX_PAGE_SIZE,
+    offset: int = 0,
+    prefetch: int = 0,
+) -> AsyncIterator[T]:
+    """
+    Yield records from a paginated endpoint one at a time.
+
+    By default pages are requested on demand, so only one page is held in
+    memory and no request is made for a page the consumer never reaches.
+
+    With ``prefetch`` set, up to that many page requests are kept in flight
+    ahead of the consumer, which turns large pulls from latency-bound into
+    rate-limit-bound. Speculative requests stop at the first short page and any
+    still pending are cancelled. Records are always yielded in offset order.
+
+    Args:
+        fetch_page: Coroutine function called as ``fetch_page(limit, offset)``
+            that returns the records of a single page.
+        page_size: Number of records requested per page (1-500).
+        offset: Index of the first record to return.
+        prefetch: Number of page requests kept in flight while the consumer
+            works through the current page (0 fetches strictly on demand).
+
+    Yields:
+        Records in offset order.
+    """
+    if page_size < 1 or page_size > MAX_PAGE_SIZE:
+        raise ValueError(f"Page size must be between 1 and {MAX_PAGE_SIZE}")
+    if offset < 0:
+        raise ValueError("Offset must be 0 or greater")
+    if prefetch < 0:
+        raise ValueError("Prefetch must be 0 or greater")
+
+    if not prefetch:
+        while True:
+            page = await fetch_page(page_size, offset)
+            for record in page:
+                yield record
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    pending: deque[asyncio.Future[Sequence[T]]] = deque()
+    next_offset = offset
+
+    def schedule() -> None:
+        nonlocal next_offset
+        while len(pending) < prefetch:
+            pending.append(asyncio.ensure_future(fetch_page(page_size, next_offset)))
+            next_offset += page_size
+
+    try:
+        schedule()
+        while pending:
+            page = await pending.popleft()
+            if len(page) < page_size:
+                # End of results: drop the speculative requests past it.
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                pending.clear()
+            else:
+                # Keep the window full while the consumer handles this page.
+                schedule()
+            for record in page:
+                yield record
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,120 @@
+"""
+Client-side rate limiting for the RentCast API.
+
+RentCast enforces a hard limit of 20 requests per second per API key. The
+token bucket in this module paces outgoing requests so that limit is not hit
+in the first place, instead of reacting to 429 responses after the fact.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Callable
+
+# Documented RentCast limit, per API key.
+DEFAULT_RATE_LIMIT = 20.0
+
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter.
+
+    Tokens are added continuously at ``rate`` tokens per second up to ``burst``.
+    Each request consumes one token; callers that find the bucket empty wait
+    until enough tokens have accumulated. Waiters are served in FIFO order.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE_LIMIT,
+        burst: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Sustained number of requests allowed per second.
+            burst: Maximum number of requests that may be sent back-to-back.
+                Defaults to ``rate`` (one second worth of tokens).
+            clock: Monotonic clock used to measure elapsed time.
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be greater than 0")
+        if burst is not None and burst < 1:
+            raise ValueError("Burst must be at least 1")
+
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1.0, rate))
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Number of tokens currently available."""
+        self._refill(self._clock())
+        return self._tokens
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accumulated since the last update."""
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def delay(self, tokens: float = 1.0) -> float:
+        """
+        Seconds until ``tokens`` tokens would be available.
+
+        Does not consume anything; useful for picking the least loaded bucket.
+        """
+        now = self._clock()
+        self._refill(now)
+        if now < self._blocked_until:
+            return self._blocked_until - now + max(0.0, tokens - self._tokens) / self.rate
+        return max(0.0, tokens - self._tokens) / self.rate
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Wait until ``tokens`` tokens are available and consume them.
+
+        Args:
+            tokens: Number of tokens to consume.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        if tokens > self.capacity:
+            raise ValueError("Cannot acquire more tokens than the bucket capacity")
+
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._refill(now)
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                else:
+                    wait = (tokens - self._tokens) / self.rate
+                await asyncio.sleep(wait)
+                waited += wait
+
+    def block(self, seconds: float) -> None:
+        """
+        Stop handing out tokens for ``seconds`` and drain the bucket.
+
+        Called when the API answers with 429 so that every caller sharing the
+        bucket backs off together instead of retrying into the same limit.
+        """
+        now = self._clock()
+        self._refill(now)
+        self._tokens = 0.0
+        self._blocked_until = max(self._blocked_until, now + max(0.0, seconds))
+        # Tokens only start accumulating again once the block is over.
+        self._updated = max(self._updated, self._blocked_until)
@@ -0,0 +1,220 @@
+"""
+Retry policy for the RentCast API client.
+
+A ``RetryPolicy`` decides whether a failed attempt is worth repeating and how
+long to wait first. Back-off delays use decorrelated jitter, so workers that
+failed together do not retry in lockstep, and ``Retry-After`` headers are
+honoured in both their delta-seconds and HTTP-date forms. An optional
+``RetryBudget`` caps retries at a share of overall traffic, so an outage does
+not turn into a retry storm that eats the per-key request quota.
+"""
+from __future__ import annotations
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable
+
+import httpx
+
+# Statuses that indicate a transient condition on the API side.
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Transport errors worth repeating. Other request errors (too many redirects,
+# undecodable bodies, invalid URLs) fail the same way every time, and so do
+# response validation errors: re-downloading a page that does not match the
+# schema returns the same page.
+RETRYABLE_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+
+
+def parse_retry_after(
+    value: str | None,
+    *,
+    now: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+) -> float | None:
+    """
+    Parse a ``Retry-After`` header value.
+
+    Args:
+        value: Header value, either a number of seconds or an HTTP-date.
+        now: Current time, used to turn an HTTP-date into a delay.
+
+    Returns:
+        Seconds to wait (never negative), or None if the value is missing or
+        cannot be parsed.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - now()).total_seconds())
+
+
+class RetryBudget:
+    """
+    Token-based limit on retry traffic.
+
+    Every original request deposits ``ratio`` tokens and every retry withdraws
+    one, so retries stay below ``ratio`` of the request rate once the initial
+    reserve is spent. The reserve of ``min_tokens`` lets low-traffic clients
+    still retry occasional failures.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        *,
+        min_tokens: float = 10.0,
+        max_tokens: float | None = None,
+    ) -> None:
+        """
+        Initialize the budget.
+
+        Args:
+            ratio: Retries allowed per original request (0.2 caps retries at 20%
+                of traffic).
+            min_tokens: Retries allowed up front, before any deposits.
+            max_tokens: Cap on saved-up tokens, bounding the size of a retry
+                burst. Defaults to ``min_tokens`` plus 100 requests' worth.
+        """
+        if ratio < 0:
+            raise ValueError("ratio must be 0 or greater")
+        self.ratio = ratio
+        self.max_tokens = max_tokens if max_tokens is not None else min_tokens + 100 * ratio
+        self._tokens = min(min_tokens, self.max_tokens)
+        self.requests = 0
+        self.retries = 0
+        self.exhausted = 0
+
+    @property
+    def tokens(self) -> float:
+        """Number of retries currently affordable."""
+        return self._tokens
+
+    def deposit(self) -> None:
+        """Record an original (non-retry) request."""
+        self.requests += 1
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Pay for one retry.
+
+        Returns:
+            Whether the retry is within budget. A refused retry costs nothing.
+        """
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            self.retries += 1
+            return True
+        self.exhausted += 1
+        return False
+
+
+class RetryPolicy:
+    """
+    Decides which failures are retried and how long to back off.
+
+    Example:
+        ```python
+        policy = RetryPolicy(
+            max_retries=5,
+            base_delay=0.25,
+            max_delay=10.0,
+            budget=RetryBudget(ratio=0.1),
+        )
+        client = RentCastClient(api_key="...", retry_policy=policy)
+        ```
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        *,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        retry_statuses: frozenset[int] = RETRYABLE_STATUSES,
+        retry_exceptions: tuple[type[BaseException], ...] = RETRYABLE_EXCEPTIONS,
+        budget: RetryBudget | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            max_retries: Maximum number of retries per request.
+            base_delay: Shortest back-off delay in seconds.
+            max_delay: Longest back-off or ``Retry-After`` wait in seconds.
+            retry_statuses: HTTP statuses that are retried.
+            retry_exceptions: Exception classes that are retried. Any other
+                exception (including pydantic ``ValidationError``) fails at once.
+            budget: Shared limit on retry traffic; None allows every retry.
+            seed: Seed for the jitter, for reproducible delays.
+        """
+        if max_retries < 0:
+            raise ValueError("max_retries must be 0 or greater")
+        if not 0 < base_delay <= max_delay:
+            raise ValueError("Delays must satisfy 0 < base_delay <= max_delay")
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_exceptions = tuple(retry_exceptions)
+        self.budget = budget
+        self._rng = random.Random(seed)
+
+    def should_retry_status(self, status_code: int) -> bool:
+        """Whether a response with this status is worth retrying."""
+        return status_code in self.retry_statuses
+
+    def should_retry_exception(self, error: BaseException) -> bool:
+        """Whether an exception raised by an attempt is worth retrying."""
+        return isinstance(error, self.retry_exceptions)
+
+    def allow_retry(self, attempt: int) -> bool:
+        """
+        Whether another retry may be made after ``attempt`` retries.
+
+        Consumes a retry token from the budget when one is configured.
+        """
+        if attempt >= self.max_retries:
+            return False
+        return self.budget is None or self.budget.withdraw()
+
+    def backoff(self, previous: float | None = None) -> float:
+        """
+        Next back-off delay using decorrelated jitter.
+
+        Each delay is drawn uniformly between ``base_delay`` and three times
+        the previous delay, capped at ``max_delay``.
+
+        Args:
+            previous: The delay used before the last attempt, or None for the
+                first retry.
+        """
+        upper = max(self.base_delay, (previous or self.base_delay) * 3)
+        return min(self.max_delay, self._rng.uniform(self.base_delay, upper))
+
+    def retry_after(self, response: httpx.Response, default: float | None = None) -> float | None:
+        """
+        Delay requested by a response's ``Retry-After`` header, capped at ``max_delay``.
+
+        Returns ``default`` when the header is missing or invalid.
+        """
+        delay = parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            return default
+        return min(self.max_delay, delay)
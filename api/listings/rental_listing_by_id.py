@@ -6,6 +6,19 @@ from the RentCast API.
 """
 from __future__ import annotations
 
+from typing import AsyncIterator, Iterable
+
+from app.core.third_party_integrations.rent_cast.api._bulk import (
+    DEFAULT_CONCURRENCY,
+    BulkResult,
+    bulk_as_completed,
+    bulk_map,
+)
+from app.core.third_party_integrations.rent_cast.api._deadline import (
+    deadline as deadline_scope,
+    expiry,
+    seconds_until,
+)
 from app.core.third_party_integrations.rent_cast.client import RentCastClient
 from app.core.third_party_integrations.rent_cast.models.rental_listings import (
     RentalListing,
@@ -25,12 +38,22 @@ class RentalListingByIdClient:
         """
         self._client = client
 
-    async def get_rental_listing_by_id(self, listing_id: str) -> RentalListing | None:
+    async def get_rental_listing_by_id(
+        self,
+        listing_id: str,
+        *,
+        hedge: bool = False,
+        deadline: float | None = None,
+    ) -> RentalListing | None:
         """Fetch a single rental listing by its ID.
 
         Args:
             listing_id: The unique identifier of the rental listing to fetch.
                 This should be in the format "Street-Address,-City,-ST-ZIP".
+            hedge: Send a second request if the first is slower than usual and use
+                whichever answers first. Meant for latency-critical lookups.
+            deadline: Seconds the call may take in total, retries included. When it
+                cannot be met RentCastTimeoutError is raised.
 
         Returns:
             A RentalListing object if found, None otherwise.
@@ -38,12 +61,18 @@ class RentalListingByIdClient:
         Raises:
             ValueError: If the listing_id is empty or None.
             RentCastError: If the API request fails.
+            RentCastTimeoutError: If the deadline passes or cannot be met.
         """
         if not listing_id:
             raise ValueError("Listing ID cannot be empty or None")
 
         # Make the API request
-        response = await self._client.get(f"listings/rental/long-term/{listing_id}")
+        response = await self._client._request(
+            "GET",
+            f"listings/rental/long-term/{listing_id}",
+            hedge=hedge,
+            deadline=deadline,
+        )
 
         # If the response is empty, return None
         if not response:
@@ -51,3 +80,62 @@ class RentalListingByIdClient:
 
         # Parse and return the response as a RentalListing
         return RentalListing(**response)
+
+    async def get_rental_listings_by_ids(
+        self,
+        listing_ids: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        deadline: float | None = None,
+    ) -> list[BulkResult[str, RentalListing | None]]:
+        """Fetch many rental listings by ID concurrently.
+
+        Requests share the client's connection pool and rate limiter. A failed
+        lookup is captured in its result instead of failing the whole batch.
+
+        Args:
+            listing_ids: The IDs of the rental listings to fetch.
+            concurrency: The maximum number of requests in flight at once.
+            deadline: Seconds the whole batch may take. Lookups still pending when
+                it passes fail with RentCastTimeoutError.
+
+        Returns:
+            One BulkResult per ID, in input order. ``result.value`` holds the
+            listing and ``result.error`` the exception if the lookup failed.
+        """
+        with deadline_scope(deadline):
+            return await bulk_map(
+                self.get_rental_listing_by_id,
+                listing_ids,
+                concurrency=concurrency,
+            )
+
+    async def iter_rental_listings_by_ids(
+        self,
+        listing_ids: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        deadline: float | None = None,
+    ) -> AsyncIterator[BulkResult[str, RentalListing | None]]:
+        """Fetch many rental listings by ID, yielding each result as it completes.
+
+        Args:
+            listing_ids: The IDs of the rental listings to fetch.
+            concurrency: The maximum number of requests in flight at once.
+            deadline: Seconds the whole batch may take, as for ``get_rental_listings_by_ids``.
+
+        Yields:
+            BulkResult per ID in completion order; ``result.index`` is the
+            position of the ID in the input.
+        """
+        expires = expiry(deadline)
+
+        async def fetch(listing_id: str) -> RentalListing | None:
+            return await self.get_rental_listing_by_id(listing_id, deadline=seconds_until(expires))
+
+        async for result in bulk_as_completed(
+            fetch,
+            listing_ids,
+            concurrency=concurrency,
+        ):
+            yield result
@@ -5,12 +5,27 @@ This module provides access to RentCast's rental listings endpoints.
 """
 from __future__ import annotations
 
-from typing import Any, Literal
+from typing import Any, AsyncIterator, Literal
 
+from app.core.third_party_integrations.rent_cast.api._deadline import (
+    expiry,
+    seconds_until,
+)
+from app.core.third_party_integrations.rent_cast.api._pagination import (
+    MAX_PAGE_SIZE,
+    paginate,
+)
 from app.core.third_party_integrations.rent_cast.api.listings._schema import (
     RentalListingsResponse,
 )
 from app.core.third_party_integrations.rent_cast.client import RentCastClient
+from app.core.third_party_integrations.rent_cast.models.lite import (
+    LiteRentalListing,
+    page_records,
+)
+from app.core.third_party_integrations.rent_cast.models.rental_listings import (
+    RentalListing,
+)
 
 # Type aliases for better readability
 OptionalStr = str | None
@@ -53,7 +68,9 @@ class RentalListingsClient:
         days_old: OptionalInt = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> RentalListingsResponse:
+        lite: bool = False,
+        deadline: OptionalFloat = None,
+    ) -> RentalListingsResponse | list[LiteRentalListing]:
         """Search for rental listings based on various criteria.
 
         Args:
@@ -71,12 +88,19 @@ class RentalListingsClient:
             days_old: The maximum number of days since the property was listed.
             limit: The maximum number of listings to return (1-500, default 50).
             offset: The index of the first listing to return (for pagination).
+            lite: Return the page as a list of LiteRentalListing records instead.
+                Core fields are read without pydantic validation and nested objects
+                are only built when accessed, which is much cheaper for bulk ingestion.
+            deadline: Seconds the call may take in total, retries included. When it
+                cannot be met RentCastTimeoutError is raised.
 
         Returns:
-            RentalListingsResponse: The response containing matching rental listings.
+            RentalListingsResponse: The response containing matching rental listings,
+            or a list of LiteRentalListing records when ``lite`` is set.
 
         Raises:
             RentCastError: If the API request fails or returns an error.
+            RentCastTimeoutError: If the deadline passes or cannot be met.
             ValueError: If invalid parameters are provided.
         """
         # Validate parameters
@@ -116,8 +140,69 @@ class RentalListingsClient:
         if days_old is not None:
             params["daysOld"] = days_old
 
-        # Make the API request
-        response = await self._client.get("listings/rental/long-term", params=params)
+        if lite:
+            data = await self._client._request(
+                "GET", "listings/rental/long-term", params=params, deadline=deadline
+            )
+            return LiteRentalListing.from_records(page_records(data, "data"))
+
+        # Make the API request; the body is validated straight from JSON bytes
+        return await self._client._request(
+            "GET",
+            "listings/rental/long-term",
+            params=params,
+            model=RentalListingsResponse,
+            deadline=deadline,
+        )
+
+    async def iter_rental_listings(
+        self,
+        *,
+        page_size: int = MAX_PAGE_SIZE,
+        offset: int = 0,
+        prefetch: int = 0,
+        lite: bool = False,
+        deadline: OptionalFloat = None,
+        **filters: Any,
+    ) -> AsyncIterator[RentalListing | LiteRentalListing]:
+        """Iterate over every rental listing matching the search criteria.
+
+        Pages are fetched with ``limit=page_size`` until a short or empty page is
+        returned. By default each page is fetched only when it is needed; with
+        ``prefetch`` set, that many page requests are kept in flight ahead of the
+        consumer (still within the client's rate limit).
 
-        # Parse and return the response
-        return RentalListingsResponse(**response)
+        Args:
+            page_size: The number of listings requested per page (1-500).
+            offset: The index of the first listing to return.
+            prefetch: The number of page requests kept in flight ahead of the consumer.
+            lite: Yield LiteRentalListing records instead of validated models.
+            deadline: Seconds the whole iteration may take, including time spent by
+                the consumer between pages.
+            **filters: Search criteria accepted by ``get_rental_listings``
+                (everything except ``limit`` and ``offset``).
+
+        Yields:
+            RentalListing (or LiteRentalListing): Listings in result order.
+        """
+        expires = expiry(deadline)
+
+        async def fetch_page(
+            limit: int, page_offset: int
+        ) -> list[RentalListing | LiteRentalListing]:
+            response = await self.get_rental_listings(
+                limit=limit,
+                offset=page_offset,
+                lite=lite,
+                deadline=seconds_until(expires),
+                **filters,
+            )
+            return response if lite else response.data
+
+        async for listing in paginate(
+            fetch_page,
+            page_size=page_size,
+            offset=offset,
+            prefetch=prefetch,
+        ):
+            yield listing
@@ -5,14 +5,29 @@ This module provides access to RentCast's sale listings endpoints.
 """
 from __future__ import annotations
 
-from typing import Any, Literal
+from typing import Any, AsyncIterator, Literal
 
 from pydantic import BaseModel
 
+from app.core.third_party_integrations.rent_cast.api._deadline import (
+    expiry,
+    seconds_until,
+)
+from app.core.third_party_integrations.rent_cast.api._pagination import (
+    MAX_PAGE_SIZE,
+    paginate,
+)
 from app.core.third_party_integrations.rent_cast.api.listings._schema import (
     SaleListingsResponse,
 )
 from app.core.third_party_integrations.rent_cast.client import RentCastClient
+from app.core.third_party_integrations.rent_cast.models.lite import (
+    LiteSaleListing,
+    page_records,
+)
+from app.core.third_party_integrations.rent_cast.models.property_listings import (
+    SaleListing,
+)
 
 # Re-export for backward compatibility
 RentCastBaseModel = BaseModel
@@ -60,7 +75,9 @@ class SaleListingsClient:
         days_old: OptionalInt = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> SaleListingsResponse:
+        lite: bool = False,
+        deadline: OptionalFloat = None,
+    ) -> SaleListingsResponse | list[LiteSaleListing]:
         """Search for sale listings based on various criteria.
 
         Args:
@@ -78,12 +95,19 @@ class SaleListingsClient:
             days_old: The maximum number of days since the property was listed.
             limit: The maximum number of listings to return (1-500, default 50).
             offset: The index of the first listing to return (for pagination).
+            lite: Return the page as a list of LiteSaleListing records instead.
+                Core fields are read without pydantic validation and nested objects
+                are only built when accessed, which is much cheaper for bulk ingestion.
+            deadline: Seconds the call may take in total, retries included. When it
+                cannot be met RentCastTimeoutError is raised.
 
         Returns:
-            SaleListingsResponse: The response containing matching sale listings.
+            SaleListingsResponse: The response containing matching sale listings,
+            or a list of LiteSaleListing records when ``lite`` is set.
 
         Raises:
             RentCastError: If the API request fails or returns an error.
+            RentCastTimeoutError: If the deadline passes or cannot be met.
         """
         # Validate parameters
         if limit < 1 or limit > 500:
@@ -135,12 +159,69 @@ class SaleListingsClient:
         if days_old is not None:
             params["daysOld"] = days_old
         
-        # Make the API request
-        response = await self._client._request(
+        if lite:
+            data = await self._client._request(
+                "GET", "/listings/sale", params=params, deadline=deadline
+            )
+            return LiteSaleListing.from_records(page_records(data, "data"))
+
+        # Make the API request; the body is validated straight from JSON bytes
+        return await self._client._request(
             method="GET",
             endpoint="/listings/sale",
             params=params,
+            model=SaleListingsResponse,
+            deadline=deadline,
         )
-        
-        # Parse and return the response
-        return SaleListingsResponse(**response)
+
+    async def iter_sale_listings(
+        self,
+        *,
+        page_size: int = MAX_PAGE_SIZE,
+        offset: int = 0,
+        prefetch: int = 0,
+        lite: bool = False,
+        deadline: OptionalFloat = None,
+        **filters: Any,
+    ) -> AsyncIterator[SaleListing | LiteSaleListing]:
+        """Iterate over every sale listing matching the search criteria.
+
+        Pages are fetched with ``limit=page_size`` until a short or empty page is
+        returned. By default each page is fetched only when it is needed; with
+        ``prefetch`` set, that many page requests are kept in flight ahead of the
+        consumer (still within the client's rate limit).
+
+        Args:
+            page_size: The number of listings requested per page (1-500).
+            offset: The index of the first listing to return.
+            prefetch: The number of page requests kept in flight ahead of the consumer.
+            lite: Yield LiteSaleListing records instead of validated models.
+            deadline: Seconds the whole iteration may take, including time spent by
+                the consumer between pages.
+            **filters: Search criteria accepted by ``get_sale_listings``
+                (everything except ``limit`` and ``offset``).
+
+        Yields:
+            SaleListing (or LiteSaleListing): Listings in result order.
+        """
+        expires = expiry(deadline)
+
+        async def fetch_page(
+            limit: int, page_offset: int
+        ) -> list[SaleListing | LiteSaleListing]:
+            response = await self.get_sale_listings(
+                limit=limit,
+                offset=page_offset,
+                lite=lite,
+                deadline=seconds_until(expires),
+                **filters,
+            )
+            return response if lite else response.data
+
+        async for listing in paginate(
+            fetch_page,
+            page_size=page_size,
+            offset=offset,
+            prefetch=prefetch,
+        ):
+            yield listing
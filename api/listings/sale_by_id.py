@@ -5,8 +5,21 @@ This module provides access to RentCast's sale listing by ID endpoint.
 """
 from __future__ import annotations
 
+from typing import AsyncIterator, Iterable
+
 from pydantic import BaseModel, Field
 
+from app.core.third_party_integrations.rent_cast.api._bulk import (
+    DEFAULT_CONCURRENCY,
+    BulkResult,
+    bulk_as_completed,
+    bulk_map,
+)
+from app.core.third_party_integrations.rent_cast.api._deadline import (
+    deadline as deadline_scope,
+    expiry,
+    seconds_until,
+)
 from app.core.third_party_integrations.rent_cast.client import RentCastClient
 from app.core.third_party_integrations.rent_cast.models.property_listings import (
     SaleListing,
@@ -42,18 +55,26 @@ class SaleListingByIdClient:
     async def get_sale_listing_by_id(
         self,
         listing_id: str,
+        *,
+        hedge: bool = False,
+        deadline: float | None = None,
     ) -> SaleListingByIdResponse:
         """Get a single sale listing by its ID.
 
         Args:
             listing_id: The ID of the property listing to retrieve.
                 This should be in the same format as returned by other RentCast API endpoints.
+            hedge: Send a second request if the first is slower than usual and use
+                whichever answers first. Meant for latency-critical lookups.
+            deadline: Seconds the call may take in total, retries included. When it
+                cannot be met RentCastTimeoutError is raised.
 
         Returns:
             SaleListingByIdResponse: The response containing the sale listing.
 
         Raises:
             RentCastError: If the API request fails or returns an error.
+            RentCastTimeoutError: If the deadline passes or cannot be met.
             ValueError: If the listing_id is empty or None.
         """
         if not listing_id:
@@ -63,7 +84,66 @@ class SaleListingByIdClient:
         endpoint = f"listings/sale/{listing_id}"
 
         # Make the API request
-        response = await self._client.get(endpoint)
+        response = await self._client._request("GET", endpoint, hedge=hedge, deadline=deadline)
 
         # Parse and return the response
         return SaleListingByIdResponse(data=SaleListing(**response))
+
+    async def get_sale_listings_by_ids(
+        self,
+        listing_ids: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        deadline: float | None = None,
+    ) -> list[BulkResult[str, SaleListingByIdResponse]]:
+        """Fetch many sale listings by ID concurrently.
+
+        Requests share the client's connection pool and rate limiter. A failed
+        lookup is captured in its result instead of failing the whole batch.
+
+        Args:
+            listing_ids: The IDs of the sale listings to fetch.
+            concurrency: The maximum number of requests in flight at once.
+            deadline: Seconds the whole batch may take. Lookups still pending when
+                it passes fail with RentCastTimeoutError.
+
+        Returns:
+            One BulkResult per ID, in input order. ``result.value`` holds the
+            listing and ``result.error`` the exception if the lookup failed.
+        """
+        with deadline_scope(deadline):
+            return await bulk_map(
+                self.get_sale_listing_by_id,
+                listing_ids,
+                concurrency=concurrency,
+            )
+
+    async def iter_sale_listings_by_ids(
+        self,
+        listing_ids: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        deadline: float | None = None,
+    ) -> AsyncIterator[BulkResult[str, SaleListingByIdResponse]]:
+        """Fetch many sale listings by ID, yielding each result as it completes.
+
+        Args:
+            listing_ids: The IDs of the sale listings to fetch.
+            concurrency: The maximum number of requests in flight at once.
+            deadline: Seconds the whole batch may take, as for ``get_sale_listings_by_ids``.
+
+        Yields:
+            BulkResult per ID in completion order; ``result.index`` is the
+            position of the ID in the input.
+        """
+        expires = expiry(deadline)
+
+        async def fetch(listing_id: str) -> SaleListingByIdResponse:
+            return await self.get_sale_listing_by_id(listing_id, deadline=seconds_until(expires))
+
+        async for result in bulk_as_completed(
+            fetch,
+            listing_ids,
+            concurrency=concurrency,
+        ):
+            yield result
@@ -7,7 +7,6 @@ in the RentCast Market Data API.
 from __future__ import annotations
 
 from datetime import date
-from typing import list
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -7,21 +7,36 @@ from __future__ import annotations
 
 import logging
 from datetime import date
+from typing import AsyncIterator, Iterable, Union
 
 from pydantic import ValidationError
 
-from ...api._exceptions import RentCastError
+from ...api._bulk import DEFAULT_CONCURRENCY, BulkResult, bulk_as_completed
+from ...api._deadline import expiry, seconds_until
+from ...api._exceptions import RentCastCircuitOpenError, RentCastError, RentCastTimeoutError
 from ...client import RentCastClient
 from ...models.market_data import (
     MarketDataInterval,
     MarketDataMetric,
     MarketDataResponse,
 )
-from ._exceptions import InvalidRequestError, MarketDataError
+from ._exceptions import DataNotAvailableError, InvalidRequestError, MarketDataError
 from ._schema import MarketDataRequest
 
 logger = logging.getLogger(__name__)
 
+# A zip code, or a (city, state) pair.
+MarketLocation = Union[str, tuple[str, str]]
+
+
+def location_params(location: MarketLocation) -> dict[str, str]:
+    """Convert a zip code or (city, state) pair to ``get_market_data`` arguments."""
+    if isinstance(location, str):
+        return {"zip_code": location}
+    city, state = location
+    return {"city": city, "state": state}
+
+
 class MarketDataClient:
     """Client for interacting with the RentCast Market Data API."""
     
@@ -44,7 +59,8 @@ class MarketDataClient:
         metrics: list[MarketDataMetric] = None,
         interval: MarketDataInterval = MarketDataInterval.MONTHLY,
         start_date: date,
-        end_date: date
+        end_date: date,
+        deadline: float | None = None,
     ) -> MarketDataResponse:
         """Get market data for a specific location and time period.
         
@@ -57,13 +73,17 @@ class MarketDataClient:
             interval: Time interval for the data points
             start_date: Start date for the data range
             end_date: End date for the data range
+            deadline: Seconds the call may take in total, retries included
             
         Returns:
             MarketDataResponse containing the requested market data
             
         Raises:
             InvalidRequestError: If the request parameters are invalid
+            DataNotAvailableError: If there is no market data for the location
             MarketDataError: If there's an error fetching the market data
+            RentCastTimeoutError: If the deadline passes or cannot be met
+            RentCastCircuitOpenError: If the circuit breaker for the endpoint is open
         """
         try:
             # Build and validate the request
@@ -79,9 +99,11 @@ class MarketDataClient:
             )
             
             # Make the API request
-            response = await self._client.get(
+            response = await self._client._request(
+                "GET",
                 self._base_path,
-                params=request.dict(by_alias=True, exclude_none=True)
+                params=request.dict(by_alias=True, exclude_none=True),
+                deadline=deadline,
             )
             
             # Parse and return the response
@@ -90,9 +112,64 @@ class MarketDataClient:
         except ValidationError as e:
             logger.error(f"Validation error in market data request: {e}")
             raise InvalidRequestError(f"Invalid market data request: {e}") from e
+        except (RentCastTimeoutError, RentCastCircuitOpenError):
+            raise
         except RentCastError as e:
+            if e.status_code == 404:
+                raise DataNotAvailableError(
+                    f"No market data available for {zip_code or f'{city}, {state}'}"
+                ) from e
             logger.error(f"Error fetching market data: {e}")
             raise MarketDataError(f"Failed to fetch market data: {e}") from e
         except Exception as e:
             logger.error(f"Unexpected error in market data client: {e}")
-            raise MarketDataError(f"Unexpected error: {e}") from e
\ No newline at end of file
+            raise MarketDataError(f"Unexpected error: {e}") from e
+
+    async def iter_market_data(
+        self,
+        locations: Iterable[MarketLocation],
+        *,
+        property_types: list[str] = None,
+        metrics: list[MarketDataMetric] = None,
+        interval: MarketDataInterval = MarketDataInterval.MONTHLY,
+        start_date: date,
+        end_date: date,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        deadline: float | None = None,
+    ) -> AsyncIterator[BulkResult[MarketLocation, MarketDataResponse]]:
+        """Get market data for many locations, yielding results as they finish.
+
+        Requests run concurrently under the client's shared rate limit. Errors,
+        including ``DataNotAvailableError`` for locations without statistics,
+        are captured per result instead of stopping the batch.
+
+        Args:
+            locations: Zip codes and/or (city, state) pairs
+            property_types: List of property types to include
+            metrics: List of metrics to retrieve
+            interval: Time interval for the data points
+            start_date: Start date for the data range
+            end_date: End date for the data range
+            concurrency: Maximum number of requests in flight at once
+            deadline: Seconds the whole batch may take; locations still pending
+                when it passes fail with RentCastTimeoutError
+
+        Yields:
+            BulkResult per location in completion order, holding the
+            MarketDataResponse or the error
+        """
+        expires = expiry(deadline)
+
+        async def fetch(location: MarketLocation) -> MarketDataResponse:
+            return await self.get_market_data(
+                **location_params(location),
+                property_types=property_types,
+                metrics=metrics,
+                interval=interval,
+                start_date=start_date,
+                end_date=end_date,
+                deadline=seconds_until(expires),
+            )
+
+        async for result in bulk_as_completed(fetch, locations, concurrency=concurrency):
+            yield result
@@ -0,0 +1,420 @@
+"""
+Market data time series with local caching and resampling.
+
+``MarketTimeSeriesCache`` keeps every series fetched through
+``MarketDataClient.get_market_data`` in memory, keyed by location, metric and
+property type, and remembers which months have already been requested. A later
+request only fetches the months that are still missing, so changing the date
+window of a chart usually needs no API call at all. Points are stored in
+contiguous ``array`` columns rather than one pydantic object per point, and
+monthly series can be resampled to quarterly or annual periods locally.
+"""
+from __future__ import annotations
+
+import calendar
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Callable, Iterable
+
+from ...api._deadline import deadline as deadline_scope
+from ...models.market_data import (
+    MarketDataInterval,
+    MarketDataMetric,
+    MarketDataPoint,
+    MarketDataResponse,
+)
+from .statistics import MarketDataClient
+
+# Point fields stored as float columns (None is stored as NaN).
+FIELDS = ("value", "count", "min", "max", "median", "avg")
+
+_PERIOD_MONTHS = {
+    MarketDataInterval.MONTHLY: 1,
+    MarketDataInterval.QUARTERLY: 3,
+    MarketDataInterval.ANNUAL: 12,
+}
+
+
+def month_index(day: date) -> int:
+    """Number of months since year 0 for the month containing ``day``."""
+    return day.year * 12 + day.month - 1
+
+
+def month_start(index: int) -> date:
+    """First day of the month with the given month index."""
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_end(index: int) -> date:
+    """Last day of the month with the given month index."""
+    year, month = index // 12, index % 12 + 1
+    return date(year, month, calendar.monthrange(year, month)[1])
+
+
+def _nan_if_none(value: float | None) -> float:
+    return math.nan if value is None else float(value)
+
+
+class MarketTimeSeries:
+    """
+    A market data series stored as contiguous columns.
+
+    ``months`` holds the month index (see ``month_index``) of the first month of
+    every period, in ascending order; each name in ``FIELDS`` maps to a float
+    column in ``columns``. Columns support the buffer protocol, so
+    ``numpy.asarray(series.columns["value"])`` is a zero-copy view.
+    """
+
+    __slots__ = ("metric", "property_type", "interval", "months", "columns")
+
+    def __init__(
+        self,
+        metric: MarketDataMetric | str,
+        property_type: str,
+        interval: MarketDataInterval = MarketDataInterval.MONTHLY,
+        months: array | None = None,
+        columns: dict[str, array] | None = None,
+    ) -> None:
+        self.metric = MarketDataMetric(metric)
+        self.property_type = property_type
+        self.interval = MarketDataInterval(interval)
+        self.months = months if months is not None else array("i")
+        self.columns = columns or {name: array("d") for name in FIELDS}
+
+    def __len__(self) -> int:
+        return len(self.months)
+
+    def __repr__(self) -> str:
+        return (
+            f"MarketTimeSeries(metric={self.metric.value!r}, "
+            f"property_type={self.property_type!r}, interval={self.interval.value!r}, "
+            f"points={len(self)})"
+        )
+
+    @property
+    def dates(self) -> list[date]:
+        """Start date of every period."""
+        return [month_start(index) for index in self.months]
+
+    @property
+    def values(self) -> array:
+        """The ``value`` column."""
+        return self.columns["value"]
+
+    def merge(self, points: Iterable[MarketDataPoint]) -> None:
+        """Insert points, replacing any existing point for the same month."""
+        rows = {
+            index: tuple(column[i] for column in self.columns.values())
+            for i, index in enumerate(self.months)
+        }
+        for point in points:
+            rows[month_index(point.date)] = tuple(
+                _nan_if_none(getattr(point, name)) for name in FIELDS
+            )
+        ordered = sorted(rows)
+        self.months = array("i", ordered)
+        self.columns = {
+            name: array("d", (rows[index][i] for index in ordered))
+            for i, name in enumerate(FIELDS)
+        }
+
+    def slice(self, start: date, end: date) -> MarketTimeSeries:
+        """Periods starting between ``start`` and ``end`` (inclusive, by month)."""
+        low = bisect_left(self.months, month_index(start))
+        high = bisect_right(self.months, month_index(end))
+        return MarketTimeSeries(
+            self.metric,
+            self.property_type,
+            self.interval,
+            self.months[low:high],
+            {name: column[low:high] for name, column in self.columns.items()},
+        )
+
+    def resample(
+        self,
+        interval: MarketDataInterval | str,
+        how: str = "mean",
+    ) -> MarketTimeSeries:
+        """
+        Aggregate the series into longer periods.
+
+        ``value`` is aggregated with ``how`` (``"mean"``, ``"last"`` or
+        ``"sum"``). ``count`` is summed, ``min``/``max`` take the extremes and
+        ``median``/``avg`` are averaged. Missing values are skipped.
+
+        Args:
+            interval: Target interval; must not be shorter than the current one.
+            how: Aggregation used for ``value``.
+
+        Returns:
+            A new series with one point per period that has any data.
+        """
+        interval = MarketDataInterval(interval)
+        size = _PERIOD_MONTHS[interval]
+        if size < _PERIOD_MONTHS[self.interval]:
+            raise ValueError(f"Cannot resample {self.interval.value} data to {interval.value}")
+        if how not in ("mean", "last", "sum"):
+            raise ValueError("how must be 'mean', 'last' or 'sum'")
+
+        value_agg = {"mean": _mean, "last": _last, "sum": _sum}[how]
+        aggregators: dict[str, Callable[[list[float]], float]] = {
+            "value": value_agg,
+            "count": _sum,
+            "min": _min,
+            "max": _max,
+            "median": _mean,
+            "avg": _mean,
+        }
+
+        result = MarketTimeSeries(self.metric, self.property_type, interval)
+        start = 0
+        while start < len(self.months):
+            period = self.months[start] // size * size
+            end = start
+            while end < len(self.months) and self.months[end] // size * size == period:
+                end += 1
+            result.months.append(period)
+            for name, column in self.columns.items():
+                present = [v for v in column[start:end] if not math.isnan(v)]
+                result.columns[name].append(aggregators[name](present))
+            start = end
+        return result
+
+    def to_points(self) -> list[MarketDataPoint]:
+        """
+        Convert the series back to MarketDataPoint models.
+
+        Periods without a ``value`` are left out, since a point requires one.
+        """
+        values = self.columns["value"]
+        return [
+            MarketDataPoint(
+                date=month_start(index),
+                **{
+                    name: self.columns[name][i]
+                    for name in FIELDS
+                    if not math.isnan(self.columns[name][i])
+                },
+            )
+            for i, index in enumerate(self.months)
+            if not math.isnan(values[i])
+        ]
+
+
+def _mean(values: list[float]) -> float:
+    return sum(values) / len(values) if values else math.nan
+
+
+def _last(values: list[float]) -> float:
+    return values[-1] if values else math.nan
+
+
+def _sum(values: list[float]) -> float:
+    return sum(values) if values else math.nan
+
+
+def _min(values: list[float]) -> float:
+    return min(values) if values else math.nan
+
+
+def _max(values: list[float]) -> float:
+    return max(values) if values else math.nan
+
+
+def _add_range(ranges: list[tuple[int, int]], low: int, high: int) -> list[tuple[int, int]]:
+    """Add an inclusive month range to a sorted list of disjoint ranges."""
+    merged = []
+    for start, end in sorted([*ranges, (low, high)]):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _gaps(ranges: list[tuple[int, int]], low: int, high: int) -> list[tuple[int, int]]:
+    """Inclusive month ranges within ``[low, high]`` not covered by ``ranges``."""
+    gaps = []
+    cursor = low
+    for start, end in ranges:
+        if end < cursor:
+            continue
+        if start > high:
+            break
+        if start > cursor:
+            gaps.append((cursor, start - 1))
+        cursor = max(cursor, end + 1)
+    if cursor <= high:
+        gaps.append((cursor, high))
+    return gaps
+
+
+SeriesKey = tuple[str, MarketDataMetric, str]
+
+
+class MarketTimeSeriesCache:
+    """
+    In-memory cache of monthly market data series that fetches only missing months.
+
+    Series are keyed by (location, metric, property type), where the location is
+    the zip code or ``"City, ST"``. The current month is never marked as fetched,
+    because its statistics are still changing.
+
+    Example:
+        ```python
+        cache = MarketTimeSeriesCache(client.market_data)
+        series = await cache.get_series(
+            zip_code="78704",
+            metrics=[MarketDataMetric.MEDIAN_RENT],
+            property_types=["Single Family"],
+            start_date=date(2020, 1, 1),
+            end_date=date(2024, 12, 31),
+            interval="quarterly",
+        )
+        rent = series[(MarketDataMetric.MEDIAN_RENT, "Single Family")]
+        ```
+    """
+
+    def __init__(
+        self,
+        client: MarketDataClient,
+        *,
+        today: Callable[[], date] = date.today,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            client: Market data client used for missing months.
+            today: Date source used to find the current (incomplete) month.
+        """
+        self.client = client
+        self._today = today
+        self._series: dict[SeriesKey, MarketTimeSeries] = {}
+        self._fetched: dict[SeriesKey, list[tuple[int, int]]] = {}
+        self.requests = 0
+
+    @staticmethod
+    def _location(city: str | None, state: str | None, zip_code: str | None) -> str:
+        if zip_code:
+            return zip_code
+        if city and state:
+            return f"{city}, {state}"
+        raise ValueError("Either zip_code or both city and state are required")
+
+    def missing_months(self, key: SeriesKey, start: date, end: date) -> list[tuple[date, date]]:
+        """Date ranges of a series that would have to be fetched from the API."""
+        return [
+            (month_start(low), month_end(high))
+            for low, high in _gaps(self._fetched.get(key, []), month_index(start), month_index(end))
+        ]
+
+    def _store(
+        self,
+        response: MarketDataResponse,
+        location: str,
+        keys: list[SeriesKey],
+        low: int,
+        high: int,
+    ) -> None:
+        for series in response.series:
+            key = (location, MarketDataMetric(series.metric), series.property_type)
+            cached = self._series.get(key)
+            if cached is None:
+                cached = self._series[key] = MarketTimeSeries(key[1], key[2])
+            cached.merge(series.data)
+
+        # Only completed months are final.
+        high = min(high, month_index(self._today()) - 1)
+        if high >= low:
+            for key in keys:
+                self._fetched[key] = _add_range(self._fetched.get(key, []), low, high)
+
+    async def get_series(
+        self,
+        *,
+        city: str | None = None,
+        state: str | None = None,
+        zip_code: str | None = None,
+        metrics: list[MarketDataMetric],
+        property_types: list[str],
+        start_date: date,
+        end_date: date,
+        interval: MarketDataInterval | str = MarketDataInterval.MONTHLY,
+        how: str = "mean",
+        deadline: float | None = None,
+    ) -> dict[tuple[MarketDataMetric, str], MarketTimeSeries]:
+        """
+        Get market data series for a date window, fetching only missing months.
+
+        Args:
+            city: City name (required if zip_code not provided)
+            state: Two-letter state code (required if zip_code not provided)
+            zip_code: ZIP code (required if city/state not provided)
+            metrics: Metrics to return
+            property_types: Property types to return
+            start_date: Start date for the data range
+            end_date: End date for the data range
+            interval: Interval of the returned series; monthly data is resampled
+                locally to quarterly or annual periods
+            how: Aggregation of ``value`` when resampling (see
+                ``MarketTimeSeries.resample``)
+            deadline: Seconds all the API requests needed for the window may take
+
+        Returns:
+            Series keyed by (metric, property type). Series with no data in the
+            window are returned empty.
+
+        Raises:
+            InvalidRequestError: If the request parameters are invalid
+            MarketDataError: If there's an error fetching the market data
+            RentCastTimeoutError: If the deadline passes or cannot be met
+        """
+        if end_date < start_date:
+            raise ValueError("end_date must not be before start_date")
+        location = self._location(city, state, zip_code)
+        metrics = [MarketDataMetric(metric) for metric in metrics]
+        keys = [
+            (location, metric, property_type)
+            for metric in metrics
+            for property_type in property_types
+        ]
+
+        # Fetch the union of the missing ranges of every requested series.
+        gaps: list[tuple[int, int]] = []
+        for key in keys:
+            for low, high in _gaps(
+                self._fetched.get(key, []), month_index(start_date), month_index(end_date)
+            ):
+                gaps = _add_range(gaps, low, high)
+
+        with deadline_scope(deadline):
+            for low, high in gaps:
+                response = await self.client.get_market_data(
+                    city=city,
+                    state=state,
+                    zip_code=zip_code,
+                    property_types=property_types,
+                    metrics=metrics,
+                    interval=MarketDataInterval.MONTHLY,
+                    start_date=month_start(low),
+                    end_date=month_end(high),
+                )
+                self.requests += 1
+                self._store(response, location, keys, low, high)
+
+        result = {}
+        for key in keys:
+            cached = self._series.get(key) or MarketTimeSeries(key[1], key[2])
+            series = cached.slice(start_date, end_date)
+            if MarketDataInterval(interval) != MarketDataInterval.MONTHLY:
+                series = series.resample(interval, how)
+            result[key[1:]] = series
+        return result
+
+    def clear(self) -> None:
+        """Drop every cached series."""
+        self._series.clear()
+        self._fetched.clear()
@@ -8,7 +8,7 @@ from __future__ import annotations
 import logging
 from typing import overload
 
-from pydantic import Field, ValidationError
+from pydantic import BaseModel, Field, ValidationError
 
 from ...api._exceptions import RentCastValidationError
 from ...client import RentCastClient
@@ -17,7 +17,7 @@ from ...models import Property, PropertySearchResponse
 logger = logging.getLogger(__name__)
 
 
-class RandomPropertyParams:
+class RandomPropertyParams(BaseModel):
     """Parameters for the random properties endpoint."""
     limit: int = Field(
         default=5,
@@ -39,6 +39,7 @@ class RandomPropertyClient(RentCastClient):
         self,
         *,
         params: RandomPropertyParams,
+        deadline: float | None = None,
     ) -> PropertySearchResponse:
         ...
 
@@ -47,12 +48,15 @@ class RandomPropertyClient(RentCastClient):
         self,
         *,
         limit: int = 5,
+        deadline: float | None = None,
     ) -> PropertySearchResponse:
         ...
 
     async def get_random_properties(
         self,
         params: RandomPropertyParams | None = None,
+        *,
+        deadline: float | None = None,
         **kwargs,
     ) -> PropertySearchResponse:
         """Get a list of randomly selected property records.
@@ -60,12 +64,14 @@ class RandomPropertyClient(RentCastClient):
         Args:
             params: RandomPropertyParams instance with search parameters
             limit: Number of random properties to return (1-500)
+            deadline: Seconds the call may take in total, retries included
 
         Returns:
             PropertySearchResponse containing the list of random properties
 
         Raises:
             RentCastValidationError: If input validation fails
+            RentCastTimeoutError: If the deadline passes or cannot be met
             RentCastError: For other API errors
         """
         if params is None:
@@ -78,7 +84,9 @@ class RandomPropertyClient(RentCastClient):
                 ) from e
 
         query_params = params.to_query_params()
-        data = await self._request("GET", "/properties/random", params=query_params)
+        data = await self._request(
+            "GET", "/properties/random", params=query_params, deadline=deadline
+        )
 
         # The API returns a list of properties, but we need to wrap it in a PropertySearchResponse
         if isinstance(data, list):
@@ -6,10 +6,23 @@ This module provides a client for fetching property records by ID from the RentC
 from __future__ import annotations
 
 import logging
+from typing import AsyncIterator, Iterable
 
 from pydantic import ValidationError
 
-from ...api._exceptions import RentCastError, RentCastValidationError
+from ...api._bulk import (
+    DEFAULT_CONCURRENCY,
+    BulkResult,
+    bulk_as_completed,
+    bulk_map,
+)
+from ...api._deadline import deadline as deadline_scope, expiry, seconds_until
+from ...api._exceptions import (
+    RentCastCircuitOpenError,
+    RentCastError,
+    RentCastTimeoutError,
+    RentCastValidationError,
+)
 from ...client import RentCastClient
 from ...models import Property
 
@@ -22,6 +35,9 @@ class PropertyRecordClient(RentCastClient):
     async def get_property_by_id(
         self,
         property_id: str,
+        *,
+        hedge: bool = False,
+        deadline: float | None = None,
     ) -> Property:
         """
         Fetch a property record by its ID.
@@ -30,12 +46,18 @@ class PropertyRecordClient(RentCastClient):
             property_id: The unique identifier for the property.
                         This is typically in the format "Street-Address,-City,-State-Zip"
                         (e.g., "5500-Grand-Lake-Dr,-San-Antonio,-TX-78244")
+            hedge: Send a second request if the first is slower than usual and use
+                whichever answers first. Meant for latency-critical lookups.
+            deadline: Seconds the call may take in total, retries included. When it
+                cannot be met RentCastTimeoutError is raised.
 
         Returns:
             Property: A Property model instance containing the property details.
 
         Raises:
             RentCastValidationError: If the property_id is empty or invalid.
+            RentCastTimeoutError: If the deadline passes or cannot be met.
+            RentCastCircuitOpenError: If the circuit breaker for the endpoint is open.
             RentCastError: For other API errors or if the property is not found.
 
         Example:
@@ -53,6 +75,8 @@ class PropertyRecordClient(RentCastClient):
             data = await self._request(
                 "GET",
                 f"/properties/{property_id}",
+                hedge=hedge,
+                deadline=deadline,
             )
 
             # Validate and parse the response into a Property model
@@ -61,7 +85,75 @@ class PropertyRecordClient(RentCastClient):
         except ValidationError as e:
             logger.error("Failed to validate property data: %s", str(e))
             raise RentCastValidationError("Invalid property data received from API") from e
+        except (RentCastTimeoutError, RentCastCircuitOpenError):
+            raise
         except Exception as e:
             logger.error("Failed to fetch property by ID: %s", str(e))
             raise RentCastError(f"Failed to fetch property: {str(e)}") from e
 
+    async def get_properties_by_ids(
+        self,
+        property_ids: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        deadline: float | None = None,
+    ) -> list[BulkResult[str, Property]]:
+        """
+        Fetch many property records by ID concurrently.
+
+        Requests share the client's connection pool and rate limiter. A failed
+        lookup is captured in its result instead of failing the whole batch.
+
+        Args:
+            property_ids: The property IDs to fetch.
+            concurrency: Maximum number of requests in flight at once.
+            deadline: Seconds the whole batch may take. Lookups still pending when
+                it passes fail with RentCastTimeoutError.
+
+        Returns:
+            One BulkResult per ID, in input order. ``result.value`` holds the
+            Property and ``result.error`` the exception if the lookup failed.
+
+        Example:
+            ```python
+            results = await client.get_properties_by_ids(ids, concurrency=10)
+            found = [r.value for r in results if r.ok]
+            ```
+        """
+        with deadline_scope(deadline):
+            return await bulk_map(
+                self.get_property_by_id,
+                property_ids,
+                concurrency=concurrency,
+            )
+
+    async def iter_properties_by_ids(
+        self,
+        property_ids: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        deadline: float | None = None,
+    ) -> AsyncIterator[BulkResult[str, Property]]:
+        """
+        Fetch many property records by ID, yielding each result as it completes.
+
+        Args:
+            property_ids: The property IDs to fetch.
+            concurrency: Maximum number of requests in flight at once.
+            deadline: Seconds the whole batch may take, as for ``get_properties_by_ids``.
+
+        Yields:
+            BulkResult per ID in completion order; ``result.index`` is the
+            position of the ID in the input.
+        """
+        expires = expiry(deadline)
+
+        async def fetch(property_id: str) -> Property:
+            return await self.get_property_by_id(property_id, deadline=seconds_until(expires))
+
+        async for result in bulk_as_completed(
+            fetch,
+            property_ids,
+            concurrency=concurrency,
+        ):
+            yield result
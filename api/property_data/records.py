@@ -6,11 +6,13 @@ This module provides a client for interacting with the RentCast Properties API e
 from __future__ import annotations
 
 import logging
-from typing import Any, overload
+from typing import Any, AsyncIterator, overload
 
 from pydantic import ValidationError
 
+from ...api._deadline import expiry, seconds_until
 from ...api._exceptions import RentCastValidationError
+from ...api._pagination import MAX_PAGE_SIZE, paginate
 from ...client import RentCastClient
 from ...models import (
     Property,
@@ -18,6 +20,7 @@ from ...models import (
     PropertySearchResponse,
     PropertyType,
 )
+from ...models.lite import LiteProperty, page_records
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +35,7 @@ class PropertiesClient(RentCastClient):
         self,
         *,
         search_params: PropertySearchParams,
+        deadline: float | None = None,
         **kwargs,
     ) -> PropertySearchResponse:
         ...
@@ -53,6 +57,7 @@ class PropertiesClient(RentCastClient):
         sale_date_range: int | None = None,
         limit: int = 50,
         offset: int = 0,
+        deadline: float | None = None,
         **kwargs,
     ) -> PropertySearchResponse:
         ...
@@ -60,10 +65,18 @@ class PropertiesClient(RentCastClient):
     async def search_properties(
         self,
         search_params: PropertySearchParams | None = None,
+        *,
+        lite: bool = False,
+        deadline: float | None = None,
         **kwargs,
-    ) -> PropertySearchResponse:
+    ) -> PropertySearchResponse | list[LiteProperty]:
         """
         Search for property records in the RentCast database.
+
+        With ``lite=True`` the page is returned as a list of LiteProperty records:
+        core fields are read without pydantic validation and everything else is
+        converted only when accessed. ``deadline`` bounds the whole call, retries
+        included, in seconds; RentCastTimeoutError is raised when it cannot be met.
         """
         if search_params is None:
             try:
@@ -75,8 +88,72 @@ class PropertiesClient(RentCastClient):
                 ) from e
 
         params = search_params.to_query_params()
-        data = await self._request("GET", "/properties", params=params)
-        return PropertySearchResponse.model_validate(data)
+        if lite:
+            data = await self._request("GET", "/properties", params=params, deadline=deadline)
+            return LiteProperty.from_records(page_records(data, "properties"))
+        return await self._request(
+            "GET",
+            "/properties",
+            params=params,
+            model=PropertySearchResponse,
+            deadline=deadline,
+        )
+
+    async def iter_properties(
+        self,
+        search_params: PropertySearchParams | None = None,
+        *,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: int = 0,
+        lite: bool = False,
+        deadline: float | None = None,
+        **kwargs,
+    ) -> AsyncIterator[Property | LiteProperty]:
+        """
+        Iterate over every property record matching a search, one at a time.
+
+        Pages are fetched with ``limit=page_size``, starting at the search's
+        ``offset``, until a short or empty page is returned.
+
+        Args:
+            search_params: PropertySearchParams instance with search parameters.
+                Its ``limit`` is replaced by ``page_size``.
+            page_size: Number of records requested per page (1-500).
+            prefetch: Number of page requests kept in flight ahead of the consumer
+                (0 fetches each page only when it is needed).
+            lite: Yield LiteProperty records instead of validated Property models.
+            deadline: Seconds the whole iteration may take, including time spent by
+                the consumer between pages.
+            **kwargs: Search parameters, used when ``search_params`` is not given.
+
+        Yields:
+            Property (or LiteProperty) records in result order.
+        """
+        if search_params is None:
+            try:
+                search_params = PropertySearchParams(**kwargs)
+            except ValidationError as e:
+                raise RentCastValidationError(
+                    "Invalid search parameters",
+                    errors=e.errors(),
+                ) from e
+
+        expires = expiry(deadline)
+
+        async def fetch_page(limit: int, offset: int) -> list[Property | LiteProperty]:
+            page_params = search_params.model_copy(update={"limit": limit, "offset": offset})
+            response = await self.search_properties(
+                search_params=page_params, lite=lite, deadline=seconds_until(expires)
+            )
+            return response if lite else response.properties
+
+        async for record in paginate(
+            fetch_page,
+            page_size=page_size,
+            offset=search_params.offset,
+            prefetch=prefetch,
+        ):
+            yield record
 
     async def get_property(
         self,
@@ -0,0 +1,212 @@
+"""
+Batch valuation helpers for the RentCast API.
+
+This module runs rent or value estimates for a whole portfolio concurrently under
+the client's rate limit, streams results as they finish and records progress in
+a checkpoint file so an interrupted run can resume where it stopped.
+"""
+from __future__ import annotations
+
+import csv
+import json
+import logging
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, TypeVar
+
+from pydantic import ValidationError
+
+from ...api._bulk import DEFAULT_CONCURRENCY, BulkResult, bulk_as_completed
+from ...api._exceptions import RentCastValidationError
+from ...models.property_valuation import BaseEstimateParams, BaseEstimateResponse
+
+logger = logging.getLogger(__name__)
+
+P = TypeVar("P", bound=BaseEstimateParams)
+R = TypeVar("R", bound=BaseEstimateResponse)
+
+
+def estimate_key(params: BaseEstimateParams) -> str:
+    """Stable identity of an estimate request, used to track checkpoint progress."""
+    return json.dumps(sorted(params.to_query_params().items()), separators=(",", ":"))
+
+
+class InvalidRow:
+    """A file row that could not be converted to estimate parameters."""
+
+    __slots__ = ("line", "row", "error")
+
+    def __init__(self, line: int, row: dict[str, Any], error: RentCastValidationError) -> None:
+        self.line = line
+        self.row = row
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f"InvalidRow(line={self.line}, row={self.row!r})"
+
+
+def read_estimate_params(
+    path: str | Path,
+    params_cls: type[P],
+) -> Iterator[P]:
+    """
+    Read estimate parameters from a CSV or Parquet file, one row at a time.
+
+    Columns are matched against the parameter field names or their API aliases
+    (e.g. ``square_footage`` or ``squareFootage``); empty cells are ignored.
+    Parquet input requires ``pyarrow``.
+
+    Args:
+        path: Path of a ``.csv`` or ``.parquet`` file.
+        params_cls: RentEstimateParams or ValueEstimateParams.
+
+    Yields:
+        One parameters instance per row.
+
+    Raises:
+        RentCastValidationError: If a row cannot be converted to parameters.
+    """
+    for item in _read_rows(path, params_cls):
+        if isinstance(item, InvalidRow):
+            raise item.error
+        yield item
+
+
+def _read_rows(path: str | Path, params_cls: type[P]) -> Iterator[P | InvalidRow]:
+    """Like ``read_estimate_params``, but yield invalid rows instead of raising."""
+    path = Path(path)
+    if path.suffix.lower() == ".parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Reading Parquet files requires pyarrow (pip install pyarrow)"
+            ) from e
+        rows: Iterable[dict[str, Any]] = (
+            row
+            for batch in pq.ParquetFile(path).iter_batches()
+            for row in batch.to_pylist()
+        )
+        yield from _rows_to_params(rows, params_cls)
+        return
+
+    with path.open(newline="", encoding="utf-8") as f:
+        yield from _rows_to_params(csv.DictReader(f), params_cls)
+
+
+def _rows_to_params(
+    rows: Iterable[dict[str, Any]],
+    params_cls: type[P],
+) -> Iterator[P | InvalidRow]:
+    """Convert raw rows to parameter models, accepting field names or aliases."""
+    # The parameter models validate by alias, so map both spellings onto it.
+    names = {}
+    for name, field in params_cls.model_fields.items():
+        names[name] = field.alias or name
+        if field.alias:
+            names[field.alias] = field.alias
+
+    for line, row in enumerate(rows, start=1):
+        values = {
+            names[column]: value
+            for column, value in row.items()
+            if column in names and value not in (None, "")
+        }
+        try:
+            params = params_cls.model_validate(values)
+        except ValidationError as e:
+            error = RentCastValidationError(
+                f"Invalid estimate parameters in row {line}",
+                errors=e.errors(),
+            )
+            error.__cause__ = e
+            yield InvalidRow(line, row, error)
+            continue
+        yield params
+
+
+class EstimateCheckpoint:
+    """
+    Append-only record of finished estimates.
+
+    Each successful estimate is written as one JSON line holding its request key
+    and the response, so a later run can skip everything already done.
+    Failed items are not recorded and are retried on resume.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.completed: set[str] = set()
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        self.completed.add(json.loads(line)["key"])
+                    except (ValueError, KeyError):
+                        # A partially written last line from an interrupted run.
+                        continue
+        self._file = self.path.open("a", encoding="utf-8")
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.completed
+
+    def record(self, key: str, response: BaseEstimateResponse) -> None:
+        """Persist a finished estimate."""
+        entry = {"key": key, "response": response.model_dump(mode="json", by_alias=True)}
+        self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self.completed.add(key)
+
+    def close(self) -> None:
+        """Close the checkpoint file."""
+        self._file.close()
+
+
+async def run_estimates(
+    estimate: Callable[[P], Awaitable[R]],
+    params: Iterable[P] | str | Path,
+    params_cls: type[P],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    checkpoint: str | Path | None = None,
+) -> AsyncIterator[BulkResult[P | InvalidRow, R]]:
+    """
+    Run an estimate for every set of parameters, yielding results as they finish.
+
+    Args:
+        estimate: Single-estimate coroutine (e.g. ``get_rent_estimate``).
+        params: Parameters to estimate, or the path of a CSV/Parquet file of them.
+        params_cls: Parameter model used when reading ``params`` from a file.
+        concurrency: Maximum number of estimate requests in flight at once.
+        checkpoint: Optional path of a checkpoint file. Items already recorded in
+            it are skipped, and every new success is appended to it.
+
+    Yields:
+        BulkResult per estimate in completion order. Errors are captured per item;
+        a file row that is not valid parameters yields a failed result whose
+        ``item`` is an ``InvalidRow`` with its row number, and the run goes on.
+    """
+    if isinstance(params, (str, Path)):
+        params = _read_rows(params, params_cls)
+
+    async def run(item: P | InvalidRow) -> R:
+        if isinstance(item, InvalidRow):
+            raise item.error
+        return await estimate(item)
+
+    if checkpoint is None:
+        async for result in bulk_as_completed(run, params, concurrency=concurrency):
+            yield result
+        return
+
+    done = EstimateCheckpoint(checkpoint)
+    if done.completed:
+        logger.info("Resuming batch estimate run; %d items already done", len(done.completed))
+
+    pending = (p for p in params if isinstance(p, InvalidRow) or estimate_key(p) not in done)
+    try:
+        async for result in bulk_as_completed(run, pending, concurrency=concurrency):
+            if result.ok:
+                done.record(estimate_key(result.item), result.value)
+            yield result
+    finally:
+        done.close()
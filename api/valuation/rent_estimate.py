@@ -6,10 +6,11 @@ rental listings from the RentCast API.
 """
 from __future__ import annotations
 
-from typing import Any
-
-from httpx import AsyncClient
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable
 
+from ...api._bulk import DEFAULT_CONCURRENCY, BulkResult
+from ...api._deadline import expiry, seconds_until
 from ...api._exceptions import RentCastValidationError
 from ...client import RentCastClient
 from ...models.property_valuation import (
@@ -17,6 +18,7 @@ from ...models.property_valuation import (
     RentEstimateParams,
     RentEstimateResponse,
 )
+from .batch import InvalidRow, run_estimates
 
 
 class RentEstimateClient(RentCastClient):
@@ -24,24 +26,18 @@ class RentEstimateClient(RentCastClient):
 
     BASE_ENDPOINT = "avm/rent/long-term"
 
-    def __init__(self, client: AsyncClient, api_key: str) -> None:
-        """Initialize the RentEstimateClient.
-
-        Args:
-            client: The async HTTP client to use for requests
-            api_key: The RentCast API key
-        """
-        super().__init__(client, api_key)
-
     async def get_rent_estimate(
         self,
         params: RentEstimateParams,
+        *,
+        deadline: float | None = None,
     ) -> RentEstimateResponse:
         """
         Get a property rent estimate with comparable rental listings.
 
         Args:
             params: Parameters for the rent estimate request
+            deadline: Seconds the call may take in total, retries included
 
         Returns:
             RentEstimateResponse containing the estimated rent and comparables
@@ -49,6 +45,7 @@ class RentEstimateClient(RentCastClient):
         Raises:
             RentCastValidationError: If the request parameters are invalid
             RentCastAPIError: If the API request fails
+            RentCastTimeoutError: If the deadline passes or cannot be met
         """
         # Validate that either address or lat/long is provided
         if not params.address and not (params.latitude and params.longitude):
@@ -60,15 +57,60 @@ class RentEstimateClient(RentCastClient):
         query_params = params.to_query_params()
         
         # Make the API request
-        response = await self._make_request(
+        response = await self._request(
             "GET",
             self.BASE_ENDPOINT,
             params=query_params,
+            deadline=deadline,
         )
 
         # Process and validate the response
         return self._process_rent_estimate_response(response)
 
+    async def iter_rent_estimates(
+        self,
+        params: Iterable[RentEstimateParams] | str | Path,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        checkpoint: str | Path | None = None,
+        deadline: float | None = None,
+    ) -> AsyncIterator[BulkResult[RentEstimateParams | InvalidRow, RentEstimateResponse]]:
+        """
+        Get rent estimates for many properties, yielding results as they finish.
+
+        Requests run concurrently under the client's rate limit. Failed items are
+        captured per result instead of stopping the batch.
+
+        Args:
+            params: Parameters for each estimate, or the path of a CSV/Parquet
+                file with one property per row (columns named after the parameter
+                fields, e.g. ``address``, ``bedrooms``, ``squareFootage``)
+            concurrency: Maximum number of estimate requests in flight at once
+            checkpoint: Optional path of a checkpoint file. Finished estimates are
+                appended to it, and items already in it are skipped, so an
+                interrupted run resumes where it stopped
+            deadline: Seconds the whole batch may take; estimates still pending
+                when it passes fail with RentCastTimeoutError
+
+        Yields:
+            BulkResult per property in completion order, holding the
+            RentEstimateResponse or the error. Invalid file rows yield a failed
+            result whose ``item`` is an InvalidRow carrying the row number
+        """
+        expires = expiry(deadline)
+
+        async def estimate(item: RentEstimateParams) -> RentEstimateResponse:
+            return await self.get_rent_estimate(item, deadline=seconds_until(expires))
+
+        async for result in run_estimates(
+            estimate,
+            params,
+            RentEstimateParams,
+            concurrency=concurrency,
+            checkpoint=checkpoint,
+        ):
+            yield result
+
     def _process_rent_estimate_response(
         self, response_data: dict[str, Any]
     ) -> RentEstimateResponse:
@@ -101,15 +143,14 @@ class RentEstimateClient(RentCastClient):
 
     @classmethod
     def create(
-        cls, client: AsyncClient, api_key: str
+        cls, client: RentCastClient
     ) -> "RentEstimateClient":
         """Create a new instance of RentEstimateClient.
 
         Args:
-            client: The async HTTP client to use for requests
-            api_key: The RentCast API key
+            client: The RentCastClient whose connection pool should be shared
 
         Returns:
             A new instance of RentEstimateClient
         """
-        return cls(client, api_key)
+        return cls(**client._sub_client_kwargs())
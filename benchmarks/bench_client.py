@@ -0,0 +1,93 @@
+"""
+End-to-end client benchmarks against ``SyntheticTransport``.
+
+Measures the full request pipeline (URL building, pacing, retries, decoding and
+validation) without a network: single lookups, paginated iteration, by-ID
+throughput at increasing concurrency and peak memory for large pages.
+"""
+from __future__ import annotations
+
+import tracemalloc
+
+import pytest
+
+from app.core.third_party_integrations.rent_cast._synthetic import sale_listing
+
+PAGE_SIZE = 500
+TOTAL = 5_000
+LOOKUPS = 256
+# Simulated server time per request for the concurrency benchmarks, in seconds.
+LATENCY = 0.005
+
+
+@pytest.mark.benchmark(group="single")
+def bench_sale_listing_by_id(benchmark, make_client, run):
+    client = make_client(total=TOTAL)
+    listing_id = sale_listing(42)["id"]
+    response = benchmark(lambda: run(client.listings.sale_by_id.get_sale_listing_by_id(listing_id)))
+    assert response.data.id == listing_id
+
+
+@pytest.mark.benchmark(group="single")
+def bench_sale_listings_page(benchmark, make_client, run):
+    client = make_client(total=TOTAL)
+    page = benchmark(
+        lambda: run(client.listings.sale.get_sale_listings(state="TX", limit=PAGE_SIZE))
+    )
+    assert len(page.data) == PAGE_SIZE
+
+
+@pytest.mark.benchmark(group="paginate")
+@pytest.mark.parametrize("lite", [False, True], ids=["models", "lite"])
+@pytest.mark.parametrize("prefetch", [1, 4])
+def bench_iter_sale_listings(benchmark, make_client, run, prefetch, lite):
+    client = make_client(total=TOTAL)
+
+    async def drain() -> int:
+        count = 0
+        async for _ in client.listings.sale.iter_sale_listings(
+            state="TX", page_size=PAGE_SIZE, prefetch=prefetch, lite=lite
+        ):
+            count += 1
+        return count
+
+    benchmark.extra_info["records"] = TOTAL
+    assert benchmark.pedantic(lambda: run(drain()), rounds=5, iterations=1) == TOTAL
+
+
+@pytest.mark.benchmark(group="concurrency")
+@pytest.mark.parametrize("concurrency", [1, 4, 16, 64, 256])
+def bench_by_id_throughput(benchmark, make_client, run, concurrency):
+    client = make_client(total=TOTAL, latency=LATENCY)
+    ids = [sale_listing(i)["id"] for i in range(LOOKUPS)]
+    lookups = client.listings.sale_by_id.get_sale_listings_by_ids
+
+    benchmark.extra_info["requests"] = LOOKUPS
+    results = benchmark.pedantic(
+        lambda: run(lookups(ids, concurrency=concurrency)), rounds=3, iterations=1
+    )
+    assert all(result.ok for result in results)
+    if benchmark.stats is not None:  # None with --benchmark-disable
+        benchmark.extra_info["requests_per_second"] = LOOKUPS / benchmark.stats.stats.mean
+
+
+@pytest.mark.benchmark(group="memory")
+@pytest.mark.parametrize("lite", [False, True], ids=["models", "lite"])
+@pytest.mark.parametrize("page_size", [50, 500])
+def bench_large_page_memory(benchmark, make_client, run, page_size, lite):
+    client = make_client(total=page_size)
+
+    def fetch():
+        tracemalloc.start()
+        try:
+            page = run(
+                client.listings.sale.get_sale_listings(state="TX", limit=page_size, lite=lite)
+            )
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["peak_memory_bytes"] = peak
+        return page
+
+    page = benchmark.pedantic(fetch, rounds=3, iterations=1)
+    assert len(page if lite else page.data) == page_size
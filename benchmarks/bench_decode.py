@@ -0,0 +1,61 @@
+"""
+Benchmark response decoding for a 500-listing page.
+
+Compares the previous two-pass decode (``json.loads`` followed by
+``model_validate``) with the single-pass path used by ``RentCastClient._decode``
+(``model_validate_json`` on the raw bytes), plus ``orjson`` as the dict decoder.
+
+Run from the application root:
+
+    python -m app.core.third_party_integrations.rent_cast.benchmarks.bench_decode
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+
+from app.core.third_party_integrations.rent_cast.api.listings._schema import (
+    RentalListingsResponse,
+    SaleListingsResponse,
+)
+from app.core.third_party_integrations.rent_cast.benchmarks.fixtures import (
+    listings_page_bytes,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=500, help="Listings per page")
+    parser.add_argument("--repeat", type=int, default=20, help="Decodes per measurement")
+    args = parser.parse_args()
+
+    for kind, model in (("sale", SaleListingsResponse), ("rental", RentalListingsResponse)):
+        body = listings_page_bytes(kind, args.size)
+        cases = {
+            "json.loads + model_validate": lambda: model.model_validate(json.loads(body)),
+            "model_validate_json": lambda: model.model_validate_json(body),
+        }
+        if orjson is not None:
+            cases["orjson.loads + model_validate"] = lambda: model.model_validate(
+                orjson.loads(body)
+            )
+
+        print(f"{kind} page: {args.size} listings, {len(body) / 1024:.0f} KiB")
+        baseline = None
+        for name, func in cases.items():
+            best = min(timeit.repeat(func, number=args.repeat, repeat=5)) / args.repeat
+            baseline = baseline or best
+            print(
+                f"  {name:32s} {best * 1000:8.2f} ms/page "
+                f"{args.size / best:10.0f} records/s  x{baseline / best:.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Parse benchmarks: model validation throughput and query parameter building.
+
+Run with pytest-benchmark (see ``pytest.ini``); each benchmark validates a
+batch of ``BATCH`` records so results can be read as records per second.
+"""
+from __future__ import annotations
+
+import pytest
+
+from app.core.third_party_integrations.rent_cast._synthetic import (
+    property_record,
+    rental_listing,
+    sale_listing,
+)
+from app.core.third_party_integrations.rent_cast.api.listings._schema import (
+    RentalListingsResponse,
+    SaleListingsResponse,
+)
+from app.core.third_party_integrations.rent_cast.benchmarks.fixtures import listings_page_bytes
+from app.core.third_party_integrations.rent_cast.models.lite import (
+    LiteProperty,
+    LiteRentalListing,
+    LiteSaleListing,
+)
+from app.core.third_party_integrations.rent_cast.models.property_data import Property
+from app.core.third_party_integrations.rent_cast.models.property_listings import SaleListing
+from app.core.third_party_integrations.rent_cast.models.property_valuation import (
+    RentEstimateParams,
+    ValueEstimateParams,
+)
+from app.core.third_party_integrations.rent_cast.models.rental_listings import RentalListing
+
+BATCH = 500
+
+MODELS = {
+    "property": (Property, LiteProperty, property_record),
+    "sale": (SaleListing, LiteSaleListing, sale_listing),
+    "rental": (RentalListing, LiteRentalListing, rental_listing),
+}
+
+ESTIMATE_PARAMS = {
+    "address": "5500 Grand Lake Dr, San Antonio, TX 78244",
+    "propertyType": "Single Family",
+    "bedrooms": 3,
+    "bathrooms": 2,
+    "squareFootage": 1600,
+    "maxRadius": 5,
+    "daysOld": 270,
+    "compCount": 20,
+}
+
+
+@pytest.mark.benchmark(group="validate")
+@pytest.mark.parametrize("kind", list(MODELS))
+def bench_model_validate(benchmark, kind):
+    model, _, factory = MODELS[kind]
+    records = [factory(i) for i in range(BATCH)]
+    benchmark.extra_info["records"] = BATCH
+    result = benchmark(lambda: [model.model_validate(record) for record in records])
+    assert len(result) == BATCH
+
+
+@pytest.mark.benchmark(group="validate")
+@pytest.mark.parametrize("kind", list(MODELS))
+def bench_lite_records(benchmark, kind):
+    _, lite, factory = MODELS[kind]
+    records = [factory(i) for i in range(BATCH)]
+    benchmark.extra_info["records"] = BATCH
+    result = benchmark(lite.from_records, records)
+    assert len(result) == BATCH
+
+
+@pytest.mark.benchmark(group="decode-page")
+@pytest.mark.parametrize(
+    "kind, model", [("sale", SaleListingsResponse), ("rental", RentalListingsResponse)]
+)
+def bench_page_validate_json(benchmark, kind, model):
+    body = listings_page_bytes(kind, BATCH)
+    benchmark.extra_info["records"] = BATCH
+    benchmark.extra_info["bytes"] = len(body)
+    page = benchmark(model.model_validate_json, body)
+    assert len(page.data) == BATCH
+
+
+@pytest.mark.benchmark(group="query-params")
+@pytest.mark.parametrize("model", [RentEstimateParams, ValueEstimateParams])
+def bench_to_query_params(benchmark, model):
+    params = model.model_validate(ESTIMATE_PARAMS)
+    query = benchmark(params.to_query_params)
+    assert query["compCount"] == "20"
+
+
+@pytest.mark.benchmark(group="query-params")
+@pytest.mark.parametrize("model", [RentEstimateParams, ValueEstimateParams])
+def bench_build_query_params(benchmark, model):
+    """Validation plus conversion, as done for every estimate request."""
+    query = benchmark(lambda: model.model_validate(ESTIMATE_PARAMS).to_query_params())
+    assert query["compCount"] == "20"
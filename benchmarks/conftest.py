@@ -0,0 +1,62 @@
+"""
+Shared fixtures for the benchmark suite.
+
+End-to-end benchmarks run the real client against ``SyntheticTransport``, so
+no network access or API key is needed and results are reproducible.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Iterator
+
+import pytest
+
+from app.core.third_party_integrations.rent_cast.client import RentCastClient
+from app.core.third_party_integrations.rent_cast.transports import SyntheticTransport
+
+# RentCastConfig requires a key even when one is passed explicitly.
+os.environ.setdefault("RENT_CAST_API_KEY", "benchmark")
+
+
+@pytest.fixture
+def event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def run(event_loop: asyncio.AbstractEventLoop) -> Callable[[Awaitable[Any]], Any]:
+    """Run a coroutine to completion on the benchmark's event loop."""
+    return event_loop.run_until_complete
+
+
+@pytest.fixture
+def make_client(
+    run: Callable[[Awaitable[Any]], Any],
+) -> Iterator[Callable[..., RentCastClient]]:
+    """
+    Factory for clients backed by a synthetic transport.
+
+    Keyword arguments are passed to ``SyntheticTransport``. Client-side rate
+    limiting, caching and request coalescing are disabled so the benchmarks
+    measure the request pipeline itself.
+    """
+    clients: list[RentCastClient] = []
+
+    def make(**transport_kwargs: Any) -> RentCastClient:
+        client = RentCastClient(
+            api_key="benchmark",
+            rate_limit=None,
+            coalesce_requests=False,
+            max_connections=None,
+            max_keepalive_connections=None,
+            transport=SyntheticTransport(**transport_kwargs),
+        )
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        run(client.close())
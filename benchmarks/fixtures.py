@@ -0,0 +1,28 @@
+"""
+Deterministic RentCast response fixtures for benchmarks.
+
+Single records come from the package's synthetic record generators, which also
+back ``SyntheticTransport``; this module adds whole serialized pages.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from app.core.third_party_integrations.rent_cast._synthetic import rental_listing, sale_listing
+
+
+def listings_page(kind: str = "sale", size: int = 500, seed: int = 0) -> dict[str, Any]:
+    """A ``{"data": [...], "total", "page", "limit"}`` listings page."""
+    make = sale_listing if kind == "sale" else rental_listing
+    return {
+        "data": [make(i, seed) for i in range(size)],
+        "total": size,
+        "page": 1,
+        "limit": max(1, size),
+    }
+
+
+def listings_page_bytes(kind: str = "sale", size: int = 500, seed: int = 0) -> bytes:
+    """A listings page serialized as a JSON response body."""
+    return json.dumps(listings_page(kind, size, seed)).encode()
@@ -7,9 +7,13 @@ This module provides the main client class for interacting with the RentCast API
 from __future__ import annotations
 
 import asyncio
+import copy
+import json
 import logging
+import math
 import os
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Sequence
 
 import httpx
 from pydantic import BaseModel, ValidationError
@@ -17,22 +21,48 @@ from pydantic import BaseModel, ValidationError
 from .api._exceptions import (
     RentCastAPIError,
     RentCastAuthenticationError,
+    RentCastCircuitOpenError,
     RentCastError,
     RentCastRateLimitError,
+    RentCastTimeoutError,
     RentCastValidationError,
 )
-from .api.listings.rental_listings import RentalListingsClient
-from .api.listings.rental_listing_by_id import RentalListingByIdClient
-from .api.listings.sale import SaleListingsClient
-from .api.listings.sale_by_id import SaleListingByIdClient
-from .api.market_data.statistics import MarketDataClient
-from .api.property_data.random_records import RandomPropertyClient
-from .api.property_data.record_by_id import PropertyRecordClient
-from .api.property_data.records import PropertiesClient
-from .api.valuation.rent_estimate import RentEstimateClient
-from .api.valuation.valuation import PropertyValuationClient
+from .api._cache import ResponseCache, make_cache_key
+from .api._circuit_breaker import CircuitBreaker, CircuitBreakers
+from .api._coalesce import SingleFlight
+from .api._concurrency import (
+    DEFAULT_INITIAL_LIMIT,
+    DEFAULT_MAX_LIMIT,
+    AdaptiveConcurrencyLimiter,
+)
+from .api._deadline import deadline as deadline_scope
+from .api._deadline import time_remaining
+from .api._endpoints import endpoint_family, is_deterministic
+from .api._hedging import HedgePolicy
+from .api._key_pool import APIKeyPool
+from .api._rate_limit import DEFAULT_RATE_LIMIT
+from .api._retry import RetryBudget, RetryPolicy
 from .config import RentCastConfig
 
+if TYPE_CHECKING:
+    # Sub-client modules import RentCastClient themselves, so they are only
+    # imported lazily at runtime (see the accessor properties below).
+    from .api.listings.rental_listing_by_id import RentalListingByIdClient
+    from .api.listings.rental_listings import RentalListingsClient
+    from .api.listings.sale import SaleListingsClient
+    from .api.listings.sale_by_id import SaleListingByIdClient
+    from .api.market_data.statistics import MarketDataClient
+    from .api.property_data.random_records import RandomPropertyClient
+    from .api.property_data.record_by_id import PropertyRecordClient
+    from .api.property_data.records import PropertiesClient
+    from .api.valuation.rent_estimate import RentEstimateClient
+    from .api.valuation.valuation import PropertyValuationClient
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,6 +72,10 @@ class RentCastClient:
 
     This client handles authentication, request/response processing, and error handling
     for all RentCast API endpoints.
+
+    All sub-clients returned by the accessor properties (``property_data``,
+    ``valuation``, ``listings.sale`` and so on) route their requests through the
+    client that created them, so they share a single HTTP connection pool.
     """
 
     def __init__(
@@ -50,6 +84,22 @@ class RentCastClient:
         base_url: str = "https://api.rentcast.io/v1",
         timeout: float = 30.0,
         max_retries: int = 3,
+        *,
+        api_keys: Sequence[str] | None = None,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        rate_limit: float | None = DEFAULT_RATE_LIMIT,
+        rate_limit_burst: float | None = None,
+        cache: ResponseCache | None = None,
+        coalesce_requests: bool = True,
+        adaptive_concurrency: bool = True,
+        max_concurrency: int | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakers | bool = True,
+        hedge_policy: HedgePolicy | None = None,
+        parent: RentCastClient | None = None,
         **kwargs,
     ):
         """
@@ -60,19 +110,89 @@ class RentCastClient:
                 environment variables or config.
             base_url: Base URL for the RentCast API.
             timeout: Request timeout in seconds.
-            max_retries: Maximum number of retries for failed requests.
+            max_retries: Maximum number of retries for failed requests. Ignored when
+                ``retry_policy`` is given.
+            api_keys: Several RentCast API keys to rotate requests across. Each key
+                gets its own rate limit and 429 back-off state, and keys rejected with
+                401 are dropped from rotation. Takes precedence over ``api_key``.
+            max_connections: Maximum number of concurrent connections in the pool
+                (None for no limit).
+            max_keepalive_connections: Maximum number of idle connections kept alive
+                in the pool (None for no limit).
+            keepalive_expiry: Seconds an idle keep-alive connection is retained.
+            http2: Enable HTTP/2 (requires the ``h2`` package, ``httpx[http2]``).
+            rate_limit: Maximum requests per second sent with each API key. Requests
+                are paced client-side with token buckets shared by all sub-clients.
+                Defaults to the documented limit of 20 req/s; None disables pacing.
+            rate_limit_burst: Maximum number of requests sent back-to-back before
+                pacing kicks in. Defaults to one second worth of requests.
+            cache: Response cache for GET requests (e.g. ``MemoryCache()`` or
+                ``SQLiteCache("rentcast.db")``). Entries are keyed on method,
+                endpoint and normalized parameters and expire per endpoint family.
+            coalesce_requests: Share a single in-flight HTTP call between concurrent
+                identical GET requests. Each caller receives its own copy of the
+                result. Non-deterministic endpoints are never coalesced.
+            adaptive_concurrency: Cap the number of requests in flight with a limit
+                that grows while latency stays flat and halves on 429 responses, 5xx
+                responses, timeouts and latency spikes. Callers beyond the limit
+                wait for a free slot.
+            max_concurrency: Highest in-flight limit the adaptive limiter may reach.
+                Defaults to ``max_connections`` (or 256 without a connection limit).
+            retry_policy: Which failures are retried and how long to back off. The
+                default retries 429, 5xx and transient transport errors up to
+                ``max_retries`` times with decorrelated jitter, never retries
+                response validation errors, and caps retries at 20% of traffic.
+            circuit_breakers: Per endpoint family circuit breakers. When half of
+                the recent requests to a family fail (5xx or transport errors),
+                its calls fail fast with ``RentCastCircuitOpenError`` for a
+                cool-down, then a few probes decide whether to close again. Pass
+                a ``CircuitBreakers`` instance to tune them, or False to disable.
+            hedge_policy: Settings for calls made with ``hedge=True``: a second,
+                identical request is sent when the first is slower than the p95
+                latency of its endpoint family, capped at 5% of hedged calls.
+            parent: Client whose connection pool and request pipeline this client
+                should use. Set by the accessor properties; when given, this client
+                never opens a pool of its own.
             **kwargs: Additional arguments to pass to the HTTP client.
         """
-        self.config = RentCastConfig()
+        self._parent = parent
+        if parent is not None:
+            self.config = parent.config
+            api_key = api_key or parent.api_key
+        else:
+            self.config = RentCastConfig()
+        if api_keys:
+            api_key = api_keys[0]
         self.api_key = api_key or self.config.api_key
         if not self.api_key:
             raise RentCastAuthenticationError("No API key provided and none found in config")
 
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.max_retries = max_retries
-        self._client = None
-        
+        self._retry_policy = retry_policy or RetryPolicy(max_retries, budget=RetryBudget())
+        self.max_retries = self._retry_policy.max_retries
+        self._client: httpx.AsyncClient | None = None
+        self._key_pool = (
+            APIKeyPool(api_keys or [self.api_key], rate_limit, rate_limit_burst)
+            if parent is None
+            else None
+        )
+        self._cache = cache
+        self._single_flight = SingleFlight(copy.deepcopy) if coalesce_requests else None
+        self._breakers: CircuitBreakers | None = None
+        if circuit_breakers and parent is None:
+            self._breakers = (
+                CircuitBreakers() if circuit_breakers is True else circuit_breakers
+            )
+        self._hedge_policy = (hedge_policy or HedgePolicy()) if parent is None else None
+        self._concurrency: AdaptiveConcurrencyLimiter | None = None
+        if adaptive_concurrency and parent is None:
+            max_limit = max_concurrency or max_connections or DEFAULT_MAX_LIMIT
+            self._concurrency = AdaptiveConcurrencyLimiter(
+                initial_limit=min(DEFAULT_INITIAL_LIMIT, max_limit),
+                max_limit=max_limit,
+            )
+
         # Initialize client instances
         self._property_data = None
         self._property_record = None
@@ -84,11 +204,18 @@ class RentCastClient:
         self._sale_listing = None
         self._property_valuation = None
         self._rent_estimate = None
+        self._listings_client = None
 
         # Configure HTTP client
         self.client_params = {
             "base_url": self.base_url,
             "timeout": timeout,
+            "limits": httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            "http2": http2,
             "headers": {
                 "Authorization": f"Bearer {self.api_key}",
                 "Accept": "application/json",
@@ -108,152 +235,137 @@ class RentCastClient:
 
     async def start(self) -> None:
         """Initialize the HTTP client session."""
-        if self._client is None:
+        if self._parent is not None:
+            await self._parent.start()
+        elif self._client is None:
             self._client = httpx.AsyncClient(**self.client_params)
 
+    def key_usage(self) -> list[dict[str, Any]]:
+        """
+        Per-key request counters for this client's API keys.
+
+        Returns:
+            One entry per configured key with its masked value, whether it is still
+            in rotation, and its request, rate-limited and error counts.
+        """
+        if self._parent is not None:
+            return self._parent.key_usage()
+        return self._key_pool.usage()
+
+    def concurrency_stats(self) -> dict[str, Any] | None:
+        """
+        State of the adaptive concurrency limiter.
+
+        Returns:
+            The current in-flight limit, slots in use, waiting callers, baseline
+            p95 latency per endpoint family and adjustment counters, or None when adaptive
+            concurrency is disabled.
+        """
+        if self._parent is not None:
+            return self._parent.concurrency_stats()
+        return self._concurrency.stats() if self._concurrency is not None else None
+
+    def circuit_breaker_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        State of the circuit breakers.
+
+        Returns:
+            Per endpoint family that has been called: the breaker state, the
+            requests and failures in its window, and how often it opened and
+            rejected calls. Empty when circuit breaking is disabled.
+        """
+        if self._parent is not None:
+            return self._parent.circuit_breaker_stats()
+        return self._breakers.stats() if self._breakers is not None else {}
+
+    def hedge_stats(self) -> dict[str, Any]:
+        """Counters of calls made with ``hedge=True``, hedges sent and hedges that won."""
+        if self._parent is not None:
+            return self._parent.hedge_stats()
+        return self._hedge_policy.stats()
+
+    def _sub_client_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for sub-clients that share this client's pool."""
+        return {
+            "api_key": self.api_key,
+            "base_url": self.base_url,
+            "timeout": self.timeout,
+            "max_retries": self.max_retries,
+            "parent": self,
+        }
+
     @property
     def property_data(self) -> PropertiesClient:
         """Access the properties API client."""
         if self._property_data is None:
-            self._property_data = PropertiesClient(
-                api_key=self.api_key,
-                base_url=self.base_url,
-                timeout=self.timeout,
-                max_retries=self.max_retries
-            )
+            from .api.property_data.records import PropertiesClient
+
+            self._property_data = PropertiesClient(**self._sub_client_kwargs())
         return self._property_data
 
     @property
     def property_record(self) -> PropertyRecordClient:
         """Access the property record by ID API client."""
         if self._property_record is None:
-            self._property_record = PropertyRecordClient(
-                api_key=self.api_key,
-                base_url=self.base_url,
-                timeout=self.timeout,
-                max_retries=self.max_retries
-            )
+            from .api.property_data.record_by_id import PropertyRecordClient
+
+            self._property_record = PropertyRecordClient(**self._sub_client_kwargs())
         return self._property_record
 
     @property
     def random_properties(self) -> RandomPropertyClient:
         """Access the random properties API client."""
         if self._random_properties is None:
-            self._random_properties = RandomPropertyClient(
-                api_key=self.api_key,
-                base_url=self.base_url,
-                timeout=self.timeout,
-                max_retries=self.max_retries
-            )
+            from .api.property_data.random_records import RandomPropertyClient
+
+            self._random_properties = RandomPropertyClient(**self._sub_client_kwargs())
         return self._random_properties
 
     @property
     def market_data(self) -> MarketDataClient:
         """Access the market data API client."""
         if self._market_data is None:
-            self._market_data = MarketDataClient(
-                api_key=self.api_key,
-                base_url=self.base_url,
-                timeout=self.timeout,
-                max_retries=self.max_retries
-            )
+            from .api.market_data.statistics import MarketDataClient
+
+            self._market_data = MarketDataClient(self)
         return self._market_data
-        
+
     @property
     def valuation(self) -> PropertyValuationClient:
         """Access the property valuation API client."""
         if self._property_valuation is None:
-            self._property_valuation = PropertyValuationClient(
-                api_key=self.api_key,
-                base_url=self.base_url,
-                timeout=self.timeout,
-                max_retries=self.max_retries
-            )
+            from .api.valuation.valuation import PropertyValuationClient
+
+            self._property_valuation = PropertyValuationClient(**self._sub_client_kwargs())
         return self._property_valuation
-        
+
     @property
     def rent_estimate(self) -> RentEstimateClient:
         """Access the rent estimate API client."""
         if self._rent_estimate is None:
-            self._rent_estimate = RentEstimateClient(
-                api_key=self.api_key,
-                base_url=self.base_url,
-                timeout=self.timeout,
-                max_retries=self.max_retries
-            )
-        return self._rent_estimate
-
-class ListingsClient:
-    """Client for accessing listing-related endpoints."""
+            from .api.valuation.rent_estimate import RentEstimateClient
 
-    def __init__(self, client: RentCastClient) -> None:
-        self._client = client
+            self._rent_estimate = RentEstimateClient(**self._sub_client_kwargs())
+        return self._rent_estimate
 
     @property
     def listings(self) -> ListingsClient:
         """Access the listings API clients."""
-        class ListingsClient:
-            def __init__(self, client: RentCastClient) -> None:
-                self._client = client
-
-            @property
-            def rental(self) -> RentalListingsClient:
-                """Access the rental listings client."""
-                if self._client._rental_listings is None:
-                    self._client._rental_listings = RentalListingsClient(
-                        api_key=self._client.api_key,
-                        base_url=self._client.base_url,
-                        timeout=self._client.timeout,
-                        max_retries=self._client.max_retries
-                    )
-                return self._client._rental_listings
-
-            @property
-            def rental_by_id(self) -> RentalListingByIdClient:
-                """Access the rental listing by ID client."""
-                if self._client._rental_listing is None:
-                    self._client._rental_listing = RentalListingByIdClient(
-                        api_key=self._client.api_key,
-                        base_url=self._client.base_url,
-                        timeout=self._client.timeout,
-                        max_retries=self._client.max_retries
-                    )
-                return self._client._rental_listing
-
-            @property
-            def sale(self) -> SaleListingsClient:
-                """Access the sale listings client."""
-                if self._client._sale_listings is None:
-                    self._client._sale_listings = SaleListingsClient(
-                        api_key=self._client.api_key,
-                        base_url=self._client.base_url,
-                        timeout=self._client.timeout,
-                        max_retries=self._client.max_retries
-                    )
-                return self._client._sale_listings
-
-            @property
-            def sale_by_id(self) -> SaleListingByIdClient:
-                """Access the sale listing by ID client."""
-                if self._client._sale_listing is None:
-                    self._client._sale_listing = SaleListingByIdClient(
-                        api_key=self._client.api_key,
-                        base_url=self._client.base_url,
-                        timeout=self._client.timeout,
-                        max_retries=self._client.max_retries
-                    )
-                return self._client._sale_listing
-
-        if not hasattr(self, '_listings_client'):
+        if self._listings_client is None:
             self._listings_client = ListingsClient(self)
         return self._listings_client
 
     async def close(self) -> None:
-        """Close the HTTP client session and all sub-clients."""
+        """Close the HTTP client session and all sub-clients.
+
+        Sub-clients created by the accessor properties share this client's
+        connection pool, so closing the root client releases every connection.
+        Closing a sub-client only detaches it; the shared pool stays open.
+        """
         if self._client:
             await self._client.aclose()
             self._client = None
-            
+
         # Clear cached clients
         self._property_data = None
         self._property_record = None
@@ -263,6 +375,9 @@ class ListingsClient:
         self._rental_listing = None
         self._sale_listings = None
         self._sale_listing = None
+        self._property_valuation = None
+        self._rent_estimate = None
+        self._listings_client = None
 
     async def _request(
         self,
@@ -272,6 +387,9 @@ class ListingsClient:
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
         model: type[BaseModel] | None = None,
+        use_cache: bool = True,
+        hedge: bool = False,
+        deadline: float | None = None,
     ) -> Any:
         """
         Make an HTTP request to the RentCast API.
@@ -282,17 +400,130 @@ class ListingsClient:
             params: Query parameters
             json_data: Request body as JSON
             model: Pydantic model to parse response into
+            use_cache: Whether a GET request may be answered from, and stored in,
+                the client's response cache. Non-deterministic endpoints such as
+                ``/properties/random`` are never cached.
+            hedge: Send a second, identical GET request if the first is slow and
+                use whichever answers first (see ``HedgePolicy``)
+            deadline: Seconds the whole call, including retries and back-off, may
+                take. A deadline set with ``api._deadline.deadline`` also applies;
+                the earlier of the two wins.
 
         Returns:
             Parsed response data or model instance
 
         Raises:
             RentCastError: For request/response handling errors
+            RentCastTimeoutError: When the deadline passes or cannot be met
             RentCastValidationError: For response validation errors
             RentCastRateLimitError: When rate limited
             RentCastAuthenticationError: For authentication failures
             RentCastAPIError: For other API errors
         """
+        if deadline is not None:
+            with deadline_scope(deadline):
+                return await self._request(
+                    method,
+                    endpoint,
+                    params=params,
+                    json_data=json_data,
+                    model=model,
+                    use_cache=use_cache,
+                    hedge=hedge,
+                )
+
+        if self._parent is not None:
+            return await self._parent._request(
+                method,
+                endpoint,
+                params=params,
+                json_data=json_data,
+                model=model,
+                use_cache=use_cache,
+                hedge=hedge,
+            )
+
+        idempotent = method.upper() == "GET" and json_data is None
+        cache_key = None
+        if use_cache and self._cache is not None and idempotent and is_deterministic(endpoint):
+            cache_key = make_cache_key(method, endpoint, params)
+            cached = await self._cache.get(cache_key)
+            if cached is not None:
+                try:
+                    return self._decode(cached, model)
+                except ValueError:
+                    # Unreadable entry (e.g. the model changed); refetch it.
+                    await self._cache.delete(cache_key)
+
+        def send() -> Any:
+            return self._send(
+                method,
+                endpoint,
+                params=params,
+                json_data=json_data,
+                model=model,
+                cache_key=cache_key,
+            )
+
+        if hedge and idempotent:
+            # The hedge goes straight to _send so it is not coalesced with the
+            # request it is racing.
+            unhedged = send
+
+            def send() -> Any:
+                return self._hedge_policy.run(
+                    endpoint_family(endpoint),
+                    unhedged,
+                    can_hedge=self._key_pool.has_capacity,
+                )
+
+        try:
+            if self._single_flight is not None and idempotent and is_deterministic(endpoint):
+                # Identical concurrent requests share one HTTP call.
+                flight_key = (cache_key or make_cache_key(method, endpoint, params), model)
+                led = False
+
+                def lead() -> Any:
+                    nonlocal led
+                    led = True
+                    return send()
+
+                try:
+                    return await self._within_deadline(self._single_flight.do(flight_key, lead))
+                except RentCastTimeoutError:
+                    remaining = time_remaining()
+                    if led or (remaining is not None and remaining <= 0):
+                        raise
+                    # The shared call ran out of another caller's deadline, not ours.
+                    return await self._within_deadline(send())
+
+            return await self._within_deadline(send())
+        except RentCastCircuitOpenError:
+            # While the API is failing, an expired response beats no response.
+            if cache_key is None or not self._breakers.serve_stale:
+                raise
+            stale = await self._cache.get_stale(cache_key)
+            if stale is None:
+                raise
+            logger.info("Serving stale cached response for %s (circuit open)", endpoint)
+            return self._decode(stale, model)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: dict[str, Any] | None,
+        json_data: dict[str, Any] | None,
+        model: type[BaseModel] | None,
+        cache_key: str | None,
+    ) -> Any:
+        """
+        Send a request with retries and decode the response.
+
+        Successful responses are stored in the response cache under
+        ``cache_key`` when one is given. See ``_request`` for the errors raised.
+        """
         if self._client is None:
             await self.start()
 
@@ -309,42 +540,70 @@ class ListingsClient:
         if json_data is not None:
             request_kwargs["json"] = json_data
 
-        last_exception = None
-
-        for attempt in range(self.max_retries + 1):
+        breaker = self._breakers.for_endpoint(endpoint) if self._breakers is not None else None
+        family = endpoint_family(endpoint)
+        policy = self._retry_policy
+        if policy.budget is not None:
+            policy.budget.deposit()
+        attempt = 0
+        delay = None
+
+        while True:
+            self._check_deadline()
+            key = await self._key_pool.acquire()
+            headers["Authorization"] = f"Bearer {key.api_key}"
             try:
-                response = await self._client.request(**request_kwargs)
+                response = await self._transmit(request_kwargs, breaker, family)
                 response.raise_for_status()
-                data = response.json()
-
-                if model is not None:
-                    return model.model_validate(data)
-                return data
+                result = self._decode(response.content, model)
+                if cache_key is not None:
+                    await self._cache.set(
+                        cache_key, response.content, self._cache.ttl_for(endpoint)
+                    )
+                return result
 
             except httpx.HTTPStatusError as e:
                 status_code = e.response.status_code
                 error_data = e.response.json() if e.response.content else {}
+                key.errors += 1
 
                 if status_code == 401:
+                    self._key_pool.disable(key)
+                    if self._key_pool.active_keys:
+                        # Retry straight away with one of the remaining keys.
+                        continue
                     raise RentCastAuthenticationError(
                         "Invalid API key or authentication failed",
                         status_code=status_code,
                         response=error_data,
                     ) from e
                 elif status_code == 429:
-                    retry_after = int(e.response.headers.get("Retry-After", "60"))
-                    if attempt < self.max_retries:
-                        await asyncio.sleep(retry_after)
+                    # RentCast limits requests per second, so without a Retry-After
+                    # header a one second back-off is enough to clear the window.
+                    retry_after = policy.retry_after(e.response, default=1.0)
+                    # Pause every caller using this key, not just this one. With
+                    # several keys the retry goes to whichever key is free first,
+                    # and waits only if every key is blocked.
+                    key.block(retry_after)
+                    if policy.should_retry_status(status_code) and policy.allow_retry(attempt):
+                        attempt += 1
+                        wait = self._key_pool.wait_time()
+                        if wait > 0:
+                            await self._sleep_before_retry(wait, breaker)
                         continue
                     raise RentCastRateLimitError(
                         "Rate limit exceeded",
                         status_code=status_code,
-                        retry_after=retry_after,
+                        retry_after=math.ceil(retry_after),
                         response=error_data,
                     ) from e
                 elif status_code >= 500:
-                    if attempt < self.max_retries:
-                        await asyncio.sleep(2**attempt)  # Exponential backoff
+                    if policy.should_retry_status(status_code) and policy.allow_retry(attempt):
+                        delay = policy.backoff(delay)
+                        # A 503 may say how long the outage lasts.
+                        delay = max(delay, policy.retry_after(e.response, default=0.0))
+                        await self._sleep_before_retry(delay, breaker)
+                        attempt += 1
                         continue
                     raise RentCastAPIError(
                         "Server error",
@@ -366,9 +625,13 @@ class ListingsClient:
                     ) from e
 
             except (httpx.RequestError, ValidationError) as e:
-                last_exception = e
-                if attempt < self.max_retries:
-                    await asyncio.sleep(2**attempt)  # Exponential backoff
+                key.errors += 1
+                # Validation errors are not retried by default: the same body
+                # would be downloaded and rejected again.
+                if policy.should_retry_exception(e) and policy.allow_retry(attempt):
+                    delay = policy.backoff(delay)
+                    await self._sleep_before_retry(delay, breaker)
+                    attempt += 1
                     continue
                 if isinstance(e, ValidationError):
                     raise RentCastValidationError(
@@ -377,9 +640,157 @@ class ListingsClient:
                     ) from e
                 raise RentCastError(f"Request failed: {str(e)}") from e
 
-        raise RentCastError(
-            f"Max retries ({self.max_retries}) exceeded. Last error: {str(last_exception)}"
-        ) from last_exception
+    async def _transmit(
+        self,
+        request_kwargs: dict[str, Any],
+        breaker: CircuitBreaker | None = None,
+        family: str = "",
+    ) -> httpx.Response:
+        """
+        Send a single HTTP request through the circuit breaker and concurrency limit.
+
+        The outcome is reported to the breaker (5xx and transport errors count as
+        failures) and the latency, or the overload signal of a 429, 5xx or
+        timeout, to the adaptive limiter under the endpoint ``family``. Decoding
+        happens after the slot is released, so it does not count towards the
+        latency.
+
+        Raises:
+            RentCastCircuitOpenError: If the breaker rejects the request.
+        """
+        limiter = self._concurrency
+        generation = breaker.acquire() if breaker is not None else 0
+        epoch = None
+        latency = None
+        failed = None
+        overloaded = False
+        try:
+            if limiter is not None:
+                epoch = await limiter.acquire()
+            started = time.monotonic()
+            response = await self._client.request(**request_kwargs)
+            latency = time.monotonic() - started
+            status_code = response.status_code
+            # A 429 reflects our own quota, not the health of the endpoint.
+            failed = None if status_code == 429 else status_code >= 500
+            overloaded = status_code == 429 or status_code >= 500
+            return response
+        except httpx.TimeoutException:
+            failed = overloaded = True
+            raise
+        except httpx.TransportError:
+            failed = True
+            raise
+        finally:
+            if breaker is not None:
+                breaker.record(generation, failed)
+            if epoch is not None:
+                limiter.release(
+                    epoch, latency=latency, overloaded=overloaded, family=family
+                )
+
+    async def _sleep_before_retry(
+        self,
+        seconds: float,
+        breaker: CircuitBreaker | None,
+    ) -> None:
+        """
+        Back off before a retry.
+
+        Gives up at once if the circuit has opened, or if the retry could not be
+        made before the deadline.
+        """
+        if breaker is not None:
+            breaker.check()
+        self._check_deadline(seconds)
+        await asyncio.sleep(seconds)
+
+    @staticmethod
+    def _check_deadline(wait: float = 0.0) -> None:
+        """Raise RentCastTimeoutError if waiting ``wait`` seconds would miss the deadline."""
+        remaining = time_remaining()
+        if remaining is not None and wait >= remaining:
+            raise RentCastTimeoutError(
+                "Request deadline exceeded"
+                if remaining <= 0
+                else f"Request deadline would be exceeded ({remaining:.2f}s left, "
+                f"next attempt in {wait:.2f}s)"
+            )
+
+    @staticmethod
+    async def _within_deadline(awaitable: Awaitable[Any]) -> Any:
+        """Await ``awaitable``, raising RentCastTimeoutError if the deadline passes first."""
+        remaining = time_remaining()
+        if remaining is None:
+            return await awaitable
+        try:
+            return await asyncio.wait_for(awaitable, max(0.0, remaining))
+        except asyncio.TimeoutError as e:
+            raise RentCastTimeoutError("Request deadline exceeded") from e
+
+    @staticmethod
+    def _decode(content: bytes, model: type[BaseModel] | None = None) -> Any:
+        """
+        Decode a JSON response body, validating it into ``model`` if given.
+
+        Models are validated directly from the raw bytes with
+        ``model_validate_json``, which parses and validates in a single pass
+        instead of building intermediate dicts first. Untyped responses are
+        decoded with ``orjson`` when it is installed.
+        """
+        if model is not None:
+            return model.model_validate_json(content)
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
+
+
+class ListingsClient:
+    """Client for accessing listing-related endpoints.
+
+    Every listing client is bound to the parent ``RentCastClient`` and therefore
+    shares its connection pool.
+    """
+
+    def __init__(self, client: RentCastClient) -> None:
+        self._client = client
+
+    @property
+    def rental(self) -> RentalListingsClient:
+        """Access the rental listings client."""
+        if self._client._rental_listings is None:
+            from .api.listings.rental_listings import RentalListingsClient
+
+            self._client._rental_listings = RentalListingsClient(self._client)
+        return self._client._rental_listings
+
+    @property
+    def rental_by_id(self) -> RentalListingByIdClient:
+        """Access the rental listing by ID client."""
+        if self._client._rental_listing is None:
+            from .api.listings.rental_listing_by_id import RentalListingByIdClient
+
+            self._client._rental_listing = RentalListingByIdClient(self._client)
+        return self._client._rental_listing
+
+    @property
+    def sale(self) -> SaleListingsClient:
+        """Access the sale listings client."""
+        if self._client._sale_listings is None:
+            from .api.listings.sale import SaleListingsClient
+
+            self._client._sale_listings = SaleListingsClient(self._client)
+        return self._client._sale_listings
+
+    @property
+    def sale_by_id(self) -> SaleListingByIdClient:
+        """Access the sale listing by ID client."""
+        if self._client._sale_listing is None:
+            from .api.listings.sale_by_id import SaleListingByIdClient
+
+            self._client._sale_listing = SaleListingByIdClient(self._client)
+        return self._client._sale_listing
+
 
 def get_rentcast_client():
     """Dependency to get RentCast client instance."""
@@ -0,0 +1,33 @@
+"""
+RentCast data export.
+
+This package converts RentCast records and market statistics into columnar
+formats for analytics.
+"""
+from .arrow import (
+    ArrowBatchBuilder,
+    arrow_schema,
+    ato_record_batches,
+    to_record_batches,
+    to_table,
+    write_parquet,
+)
+from .market_data import (
+    MarketDataTableBuilder,
+    market_data_schema,
+    market_data_table,
+    write_market_data_parquet,
+)
+
+__all__ = [
+    "ArrowBatchBuilder",
+    "MarketDataTableBuilder",
+    "arrow_schema",
+    "ato_record_batches",
+    "market_data_schema",
+    "market_data_table",
+    "to_record_batches",
+    "to_table",
+    "write_market_data_parquet",
+    "write_parquet",
+]
@@ -0,0 +1,340 @@
+"""
+Columnar export of RentCast records to Apache Arrow and Parquet.
+
+Records are converted straight into Arrow record batches with a fixed schema per
+record type, so every batch (and every Parquet file) has the same column types
+regardless of which optional fields happen to be present in a page. Records can
+be raw JSON objects, lite records or pydantic models, and can come from a list,
+a page or an auto-paginating async iterator; memory stays bounded by the batch
+size.
+
+Requires ``pyarrow`` (``pip install pyarrow``).
+"""
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, AsyncIterable, Iterable, Iterator
+
+from pydantic import BaseModel
+
+from ..models.lite import LiteRecord
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is an optional dependency
+    pa = None
+    pq = None
+
+DEFAULT_BATCH_SIZE = 50_000
+
+# Column specs: (column name, path of JSON keys, column type). Types are named
+# rather than given as pyarrow types so the specs load without pyarrow.
+Column = tuple[str, tuple[str, ...], str]
+
+_ADDRESS_COLUMNS: list[Column] = [
+    ("id", ("id",), "string"),
+    ("formatted_address", ("formattedAddress",), "string"),
+    ("address_line1", ("addressLine1",), "string"),
+    ("address_line2", ("addressLine2",), "string"),
+    ("city", ("city",), "string"),
+    ("state", ("state",), "string"),
+    ("zip_code", ("zipCode",), "string"),
+    ("county", ("county",), "string"),
+    ("latitude", ("latitude",), "float64"),
+    ("longitude", ("longitude",), "float64"),
+    ("property_type", ("propertyType",), "string"),
+    ("bedrooms", ("bedrooms",), "float64"),
+    ("bathrooms", ("bathrooms",), "float64"),
+]
+
+LISTING_COLUMNS: list[Column] = [
+    *_ADDRESS_COLUMNS,
+    ("square_footage", ("squareFootage",), "int64"),
+    ("lot_size", ("lotSize",), "int64"),
+    ("year_built", ("yearBuilt",), "int64"),
+    ("hoa_fee", ("hoa", "fee"), "float64"),
+    ("status", ("status",), "string"),
+    ("price", ("price",), "float64"),
+    ("listing_type", ("listingType",), "string"),
+    ("listed_date", ("listedDate",), "timestamp"),
+    ("removed_date", ("removedDate",), "timestamp"),
+    ("created_date", ("createdDate",), "timestamp"),
+    ("last_seen_date", ("lastSeenDate",), "timestamp"),
+    ("days_on_market", ("daysOnMarket",), "int64"),
+    ("mls_name", ("mlsName",), "string"),
+    ("mls_number", ("mlsNumber",), "string"),
+    ("listing_agent_name", ("listingAgent", "name"), "string"),
+    ("listing_agent_phone", ("listingAgent", "phone"), "string"),
+    ("listing_agent_email", ("listingAgent", "email"), "string"),
+    ("listing_office_name", ("listingOffice", "name"), "string"),
+    ("listing_office_phone", ("listingOffice", "phone"), "string"),
+    ("listing_office_email", ("listingOffice", "email"), "string"),
+    ("history", ("history",), "json"),
+]
+
+SALE_LISTING_COLUMNS = LISTING_COLUMNS
+RENTAL_LISTING_COLUMNS = LISTING_COLUMNS
+
+PROPERTY_COLUMNS: list[Column] = [
+    *_ADDRESS_COLUMNS,
+    ("property_id", ("propertyId",), "string"),
+    ("square_feet", ("squareFeet",), "int64"),
+    ("lot_size", ("lotSize",), "float64"),
+    ("year_built", ("yearBuilt",), "int64"),
+    ("status", ("status",), "string"),
+    ("last_sold_date", ("lastSoldDate",), "timestamp"),
+    ("last_sold_price", ("lastSoldPrice",), "float64"),
+    ("price", ("price",), "float64"),
+    ("price_per_square_foot", ("pricePerSquareFoot",), "float64"),
+    ("tax_amount", ("tax", "amount"), "float64"),
+    ("owner_occupied", ("ownerOccupied",), "bool"),
+    ("owner_names", ("owner", "names"), "json"),
+]
+
+COMPARABLE_COLUMNS: list[Column] = [
+    *_ADDRESS_COLUMNS,
+    ("square_footage", ("squareFootage",), "int64"),
+    ("lot_size", ("lotSize",), "int64"),
+    ("year_built", ("yearBuilt",), "int64"),
+    ("price", ("price",), "float64"),
+    ("listing_type", ("listingType",), "string"),
+    ("listed_date", ("listedDate",), "timestamp"),
+    ("removed_date", ("removedDate",), "timestamp"),
+    ("last_seen_date", ("lastSeenDate",), "timestamp"),
+    ("days_on_market", ("daysOnMarket",), "int64"),
+    ("distance", ("distance",), "float64"),
+    ("days_old", ("daysOld",), "int64"),
+    ("correlation", ("correlation",), "float64"),
+]
+
+RECORD_COLUMNS: dict[str, list[Column]] = {
+    "property": PROPERTY_COLUMNS,
+    "sale_listing": SALE_LISTING_COLUMNS,
+    "rental_listing": RENTAL_LISTING_COLUMNS,
+    "comparable": COMPARABLE_COLUMNS,
+}
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("Columnar export requires pyarrow (pip install pyarrow)")
+
+
+def _arrow_type(name: str) -> Any:
+    return {
+        "string": pa.string(),
+        "json": pa.string(),
+        "float64": pa.float64(),
+        "int64": pa.int64(),
+        "bool": pa.bool_(),
+        "timestamp": pa.timestamp("ms", tz="UTC"),
+    }[name]
+
+
+def arrow_schema(record_type: str) -> pa.Schema:
+    """
+    Arrow schema for a record type.
+
+    Args:
+        record_type: ``"property"``, ``"sale_listing"``, ``"rental_listing"`` or
+            ``"comparable"``.
+    """
+    _require_pyarrow()
+    return pa.schema(
+        [pa.field(name, _arrow_type(kind)) for name, _, kind in _columns(record_type)]
+    )
+
+
+def _columns(record_type: str) -> list[Column]:
+    try:
+        return RECORD_COLUMNS[record_type]
+    except KeyError:
+        raise ValueError(
+            f"Unknown record type {record_type!r}; expected one of {sorted(RECORD_COLUMNS)}"
+        ) from None
+
+
+def _as_json(record: Any) -> dict[str, Any]:
+    """Return the API (camelCase) representation of a record."""
+    if isinstance(record, dict):
+        return record
+    if isinstance(record, LiteRecord):
+        return record.raw
+    if isinstance(record, BaseModel):
+        return record.model_dump(by_alias=True)
+    raise TypeError(f"Cannot export record of type {type(record).__name__}")
+
+
+def _convert(value: Any, kind: str) -> Any:
+    """Coerce a JSON value to the Python value expected by the column type."""
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        value = value.value
+    if kind == "string":
+        return str(value)
+    if kind == "float64":
+        return float(value)
+    if kind == "int64":
+        return int(value)
+    if kind == "bool":
+        return bool(value)
+    if kind == "timestamp":
+        return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    # json: nested values are stored as JSON text
+    return json.dumps(value, default=_json_default, separators=(",", ":"))
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", by_alias=True)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ArrowBatchBuilder:
+    """
+    Accumulates records column by column and emits Arrow record batches.
+
+    Example:
+        ```python
+        builder = ArrowBatchBuilder("sale_listing")
+        builder.extend(page.data)
+        batch = builder.flush()
+        ```
+    """
+
+    def __init__(self, record_type: str) -> None:
+        _require_pyarrow()
+        self.record_type = record_type
+        self.schema = arrow_schema(record_type)
+        self._specs = _columns(record_type)
+        self._columns: list[list[Any]] = [[] for _ in self._specs]
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    def append(self, record: Any) -> None:
+        """Add one record (raw JSON object, lite record or pydantic model)."""
+        data = _as_json(record)
+        for values, (_, path, kind) in zip(self._columns, self._specs):
+            value: Any = data
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+                if value is None:
+                    break
+            values.append(_convert(value, kind))
+
+    def extend(self, records: Iterable[Any]) -> None:
+        """Add several records."""
+        for record in records:
+            self.append(record)
+
+    def flush(self) -> pa.RecordBatch:
+        """Return the accumulated records as a record batch and reset the builder."""
+        arrays = [
+            pa.array(values, type=field.type)
+            for values, field in zip(self._columns, self.schema)
+        ]
+        self._columns = [[] for _ in self._specs]
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+
+def to_record_batches(
+    records: Iterable[Any],
+    record_type: str,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[pa.RecordBatch]:
+    """
+    Convert records into Arrow record batches of at most ``batch_size`` rows.
+
+    Args:
+        records: Records to convert.
+        record_type: ``"property"``, ``"sale_listing"``, ``"rental_listing"`` or
+            ``"comparable"``.
+        batch_size: Maximum rows per batch.
+
+    Yields:
+        Record batches sharing the schema of ``record_type``.
+    """
+    builder = ArrowBatchBuilder(record_type)
+    for record in records:
+        builder.append(record)
+        if len(builder) >= batch_size:
+            yield builder.flush()
+    if len(builder):
+        yield builder.flush()
+
+
+async def ato_record_batches(
+    records: AsyncIterable[Any],
+    record_type: str,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncIterable[pa.RecordBatch]:
+    """Async variant of ``to_record_batches`` for auto-paginating iterators."""
+    builder = ArrowBatchBuilder(record_type)
+    async for record in records:
+        builder.append(record)
+        if len(builder) >= batch_size:
+            yield builder.flush()
+    if len(builder):
+        yield builder.flush()
+
+
+def to_table(records: Iterable[Any], record_type: str) -> pa.Table:
+    """Convert records into a single Arrow table."""
+    _require_pyarrow()
+    return pa.Table.from_batches(
+        list(to_record_batches(records, record_type)),
+        schema=arrow_schema(record_type),
+    )
+
+
+async def write_parquet(
+    records: Iterable[Any] | AsyncIterable[Any],
+    path: str | Path,
+    record_type: str,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    compression: str = "zstd",
+) -> int:
+    """
+    Stream records into a Parquet file, one row group per batch.
+
+    Only one batch is held in memory at a time, so whole-state dumps can be
+    written straight from ``iter_sale_listings`` and friends.
+
+    Args:
+        records: Records to write, synchronous or asynchronous.
+        path: Destination Parquet file.
+        record_type: ``"property"``, ``"sale_listing"``, ``"rental_listing"`` or
+            ``"comparable"``.
+        batch_size: Rows per row group.
+        compression: Parquet compression codec.
+
+    Returns:
+        The number of rows written.
+    """
+    _require_pyarrow()
+    rows = 0
+    with pq.ParquetWriter(
+        str(path), arrow_schema(record_type), compression=compression
+    ) as writer:
+        if isinstance(records, AsyncIterable):
+            async for batch in ato_record_batches(records, record_type, batch_size=batch_size):
+                writer.write_batch(batch)
+                rows += batch.num_rows
+        else:
+            for batch in to_record_batches(records, record_type, batch_size=batch_size):
+                writer.write_batch(batch)
+                rows += batch.num_rows
+    return rows
@@ -0,0 +1,188 @@
+"""
+Columnar export of market data statistics.
+
+Market data responses are flattened to one row per location, metric, property
+type and date, so the statistics of thousands of zip codes can be streamed into
+a single Arrow table or Parquet file keyed by location and date. Results of
+``MarketDataClient.iter_market_data`` can be fed in directly: locations without
+data are skipped and counted, and other failures are logged and counted.
+
+Requires ``pyarrow`` (``pip install pyarrow``).
+"""
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any, AsyncIterable, Iterable
+
+from ..api._bulk import BulkResult
+from ..api.market_data._exceptions import DataNotAvailableError
+from ..models.market_data import MarketDataResponse
+from .arrow import DEFAULT_BATCH_SIZE, _require_pyarrow, pa, pq
+
+logger = logging.getLogger(__name__)
+
+_POINT_FIELDS = ("value", "count", "min", "max", "median", "avg")
+
+
+def market_data_schema() -> pa.Schema:
+    """Arrow schema of flattened market data rows."""
+    _require_pyarrow()
+    return pa.schema([
+        pa.field("location", pa.string()),
+        pa.field("zip_code", pa.string()),
+        pa.field("city", pa.string()),
+        pa.field("state", pa.string()),
+        pa.field("metric", pa.string()),
+        pa.field("property_type", pa.string()),
+        pa.field("date", pa.date32()),
+        pa.field("value", pa.float64()),
+        pa.field("count", pa.int64()),
+        pa.field("min", pa.float64()),
+        pa.field("max", pa.float64()),
+        pa.field("median", pa.float64()),
+        pa.field("avg", pa.float64()),
+    ])
+
+
+def _location_key(item: Any, response: MarketDataResponse) -> str:
+    if isinstance(item, str):
+        return item
+    if isinstance(item, tuple):
+        return f"{item[0]}, {item[1]}"
+    return response.zip_code or f"{response.city}, {response.state}"
+
+
+class MarketDataTableBuilder:
+    """
+    Accumulates market data responses column by column.
+
+    Attributes:
+        locations: Number of responses added.
+        not_available: Locations skipped because RentCast has no data for them.
+        failed: Results that failed with any other error.
+
+    Example:
+        ```python
+        builder = MarketDataTableBuilder()
+        async for result in client.market_data.iter_market_data(zips, **window):
+            builder.add(result)
+        table = builder.to_table()
+        ```
+    """
+
+    def __init__(self) -> None:
+        _require_pyarrow()
+        self.schema = market_data_schema()
+        self._columns: dict[str, list[Any]] = {name: [] for name in self.schema.names}
+        self.locations = 0
+        self.not_available: list[Any] = []
+        self.failed: list[BulkResult] = []
+
+    def __len__(self) -> int:
+        return len(self._columns["location"])
+
+    def add(self, result: BulkResult | MarketDataResponse) -> None:
+        """Add a response, or a bulk result holding a response or an error."""
+        item = None
+        if isinstance(result, BulkResult):
+            if isinstance(result.error, DataNotAvailableError):
+                self.not_available.append(result.item)
+                return
+            if result.error is not None:
+                logger.warning("Market data for %r failed: %s", result.item, result.error)
+                self.failed.append(result)
+                return
+            item, result = result.item, result.value
+
+        self.locations += 1
+        location = _location_key(item, result)
+        columns = self._columns
+        for series in result.series:
+            metric = getattr(series.metric, "value", series.metric)
+            for point in series.data:
+                columns["location"].append(location)
+                columns["zip_code"].append(result.zip_code)
+                columns["city"].append(result.city)
+                columns["state"].append(result.state)
+                columns["metric"].append(metric)
+                columns["property_type"].append(series.property_type)
+                columns["date"].append(point.date)
+                for name in _POINT_FIELDS:
+                    columns[name].append(getattr(point, name))
+
+    def flush(self) -> pa.RecordBatch:
+        """Return the accumulated rows as a record batch and reset the rows."""
+        arrays = [
+            pa.array(self._columns[field.name], type=field.type) for field in self.schema
+        ]
+        self._columns = {name: [] for name in self.schema.names}
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+    def to_table(self) -> pa.Table:
+        """Return every accumulated row as a table."""
+        return pa.Table.from_batches([self.flush()], schema=self.schema)
+
+
+async def market_data_table(
+    results: Iterable[Any] | AsyncIterable[Any],
+) -> pa.Table:
+    """
+    Collect market data results into a single Arrow table.
+
+    Args:
+        results: Responses or bulk results, synchronous or asynchronous.
+
+    Returns:
+        Table with one row per location, metric, property type and date.
+    """
+    builder = MarketDataTableBuilder()
+    if isinstance(results, AsyncIterable):
+        async for result in results:
+            builder.add(result)
+    else:
+        for result in results:
+            builder.add(result)
+    return builder.to_table()
+
+
+async def write_market_data_parquet(
+    results: Iterable[Any] | AsyncIterable[Any],
+    path: str | Path,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    compression: str = "zstd",
+) -> MarketDataTableBuilder:
+    """
+    Stream market data results into a Parquet file.
+
+    Rows are written in row groups of about ``batch_size`` rows as results
+    arrive, so memory stays bounded for national fan-outs.
+
+    Args:
+        results: Responses or bulk results, synchronous or asynchronous.
+        path: Destination Parquet file.
+        batch_size: Approximate rows per row group.
+        compression: Parquet compression codec.
+
+    Returns:
+        The builder, whose ``locations``, ``not_available`` and ``failed``
+        attributes summarize the run.
+    """
+    builder = MarketDataTableBuilder()
+    with pq.ParquetWriter(str(path), builder.schema, compression=compression) as writer:
+
+        def add(result: Any) -> None:
+            builder.add(result)
+            if len(builder) >= batch_size:
+                writer.write_batch(builder.flush())
+
+        if isinstance(results, AsyncIterable):
+            async for result in results:
+                add(result)
+        else:
+            for result in results:
+                add(result)
+        if len(builder):
+            writer.write_batch(builder.flush())
+    return builder
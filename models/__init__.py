@@ -6,6 +6,7 @@ This module contains Pydantic models that represent the data structures used in
 from .property_data import *
 from .property_listings import *  # noqa: F403
 from .common import *  # noqa: F403
+from .lite import LiteProperty, LiteRecord, LiteRentalListing, LiteSaleListing
 
 __all__ = [
     # Property Data Models
@@ -31,4 +32,10 @@ __all__ = [
     'ListingHistory',
     'SaleListing',
     'SaleListingsResponse',
+
+    # Lightweight records
+    'LiteRecord',
+    'LiteProperty',
+    'LiteSaleListing',
+    'LiteRentalListing',
 ]
@@ -0,0 +1,196 @@
+"""
+Lightweight record types for bulk RentCast responses.
+
+Validating a full pydantic model for every row of a 500-row page (nested agent,
+office, HOA and history objects included) dominates the cost of large ingestion
+jobs that only read a handful of fields. The records in this module copy the
+core fields into ``__slots__`` without any validation and keep the decoded JSON
+object around, so everything else is only converted when it is accessed.
+
+Core date fields are kept as the ISO 8601 strings returned by the API.
+"""
+from __future__ import annotations
+
+from typing import Any, ClassVar, Iterable
+
+from pydantic import BaseModel, TypeAdapter
+
+from .property_data import Property
+from .property_listings import SaleListing
+from .rental_listings import RentalListing
+
+
+class LiteRecord:
+    """
+    Base class for lightweight records.
+
+    Subclasses list their core fields in ``__slots__`` and map each one to its
+    JSON key in ``_core_fields``. Any other field of ``_model`` can still be read
+    as an attribute; it is validated (including nested models) on access.
+    """
+
+    __slots__ = ("_raw",)
+
+    _model: ClassVar[type[BaseModel]]
+    _core_fields: ClassVar[dict[str, str]] = {}
+    _adapters: ClassVar[dict[str, tuple[str, TypeAdapter]]]
+
+    def __init__(self, raw: dict[str, Any]) -> None:
+        self._raw = raw
+        for name, key in self._core_fields.items():
+            setattr(self, name, raw.get(key))
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._adapters = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]]) -> list[LiteRecord]:
+        """Wrap decoded JSON objects without validating them."""
+        return [cls(raw) for raw in records]
+
+    @classmethod
+    def _adapter(cls, name: str) -> tuple[str, TypeAdapter]:
+        """JSON key and validator for a non-core model field."""
+        adapter = cls._adapters.get(name)
+        if adapter is None:
+            field = cls._model.model_fields.get(name)
+            if field is None:
+                raise AttributeError(f"{cls.__name__!r} object has no attribute {name!r}")
+            adapter = (field.alias or name, TypeAdapter(field.annotation))
+            cls._adapters[name] = adapter
+        return adapter
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes that are not core slots.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        key, adapter = self._adapter(name)
+        value = self._raw.get(key)
+        return None if value is None else adapter.validate_python(value)
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """The decoded JSON object for this record."""
+        return self._raw
+
+    def to_model(self) -> BaseModel:
+        """Validate the full record into its pydantic model."""
+        return self._model.model_validate(self._raw)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self._raw.get('id')!r})"
+
+
+class LiteSaleListing(LiteRecord):
+    """Lightweight view of a SaleListing."""
+
+    __slots__ = (
+        "id",
+        "formatted_address",
+        "city",
+        "state",
+        "zip_code",
+        "latitude",
+        "longitude",
+        "property_type",
+        "bedrooms",
+        "bathrooms",
+        "square_footage",
+        "price",
+        "status",
+        "listing_type",
+        "listed_date",
+        "last_seen_date",
+        "days_on_market",
+    )
+
+    _model = SaleListing
+    _core_fields = {
+        "id": "id",
+        "formatted_address": "formattedAddress",
+        "city": "city",
+        "state": "state",
+        "zip_code": "zipCode",
+        "latitude": "latitude",
+        "longitude": "longitude",
+        "property_type": "propertyType",
+        "bedrooms": "bedrooms",
+        "bathrooms": "bathrooms",
+        "square_footage": "squareFootage",
+        "price": "price",
+        "status": "status",
+        "listing_type": "listingType",
+        "listed_date": "listedDate",
+        "last_seen_date": "lastSeenDate",
+        "days_on_market": "daysOnMarket",
+    }
+
+    def to_model(self) -> SaleListing:
+        return SaleListing.model_validate(self._raw)
+
+
+class LiteRentalListing(LiteRecord):
+    """Lightweight view of a RentalListing."""
+
+    __slots__ = LiteSaleListing.__slots__
+
+    _model = RentalListing
+    _core_fields = LiteSaleListing._core_fields
+
+    def to_model(self) -> RentalListing:
+        return RentalListing.model_validate(self._raw)
+
+
+class LiteProperty(LiteRecord):
+    """Lightweight view of a Property record."""
+
+    __slots__ = (
+        "id",
+        "formatted_address",
+        "city",
+        "state",
+        "zip_code",
+        "latitude",
+        "longitude",
+        "property_type",
+        "bedrooms",
+        "bathrooms",
+        "square_feet",
+        "year_built",
+        "last_sold_date",
+        "last_sold_price",
+    )
+
+    _model = Property
+    _core_fields = {
+        "id": "id",
+        "formatted_address": "formattedAddress",
+        "city": "city",
+        "state": "state",
+        "zip_code": "zipCode",
+        "latitude": "latitude",
+        "longitude": "longitude",
+        "property_type": "propertyType",
+        "bedrooms": "bedrooms",
+        "bathrooms": "bathrooms",
+        "square_feet": "squareFeet",
+        "year_built": "yearBuilt",
+        "last_sold_date": "lastSoldDate",
+        "last_sold_price": "lastSoldPrice",
+    }
+
+    def to_model(self) -> Property:
+        return Property.model_validate(self._raw)
+
+
+def page_records(data: Any, key: str) -> list[dict[str, Any]]:
+    """
+    Extract the list of records from a decoded page.
+
+    Accepts both a bare JSON array and an object wrapping the records under
+    ``key`` (``"data"`` for listings, ``"properties"`` for property records).
+    """
+    if isinstance(data, list):
+        return data
+    return data.get(key) or []
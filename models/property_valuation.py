@@ -8,12 +8,15 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 from pydantic import BaseModel, Field, field_validator
 
 from .common import PropertyType
 
+if TYPE_CHECKING:
+    from ..analysis.comparables import ComparablesFrame
+
 # Generic type for response data (rent or price)
 T = TypeVar('T', int, float)
 
@@ -214,6 +217,19 @@ class BaseEstimateResponse(BaseModel, Generic[T]):
             reverse=descending
         )
 
+    def comparables_frame(self) -> ComparablesFrame:
+        """
+        Get a NumPy-backed view of the comparables for vectorized analysis.
+
+        Requires numpy. See ``analysis.comparables.ComparablesFrame``.
+
+        Returns:
+            ComparablesFrame holding the comparables of this estimate
+        """
+        from ..analysis.comparables import ComparablesFrame
+
+        return ComparablesFrame.from_estimate(self)
+
 
 class ValueEstimateResponse(BaseEstimateResponse[int]):
     """Response model for property value estimate."""
@@ -279,6 +295,26 @@ class BaseEstimateParams(BaseModel):
         le=25
     )
 
+    def to_query_params(self) -> dict[str, str]:
+        """Convert the model to query parameters for the API request."""
+        params = {}
+        for field_name, field in self.model_fields.items():
+            value = getattr(self, field_name)
+            if value is not None:
+                # Convert enum values to their string representation
+                if hasattr(value, 'value'):
+                    value = value.value
+                # Convert boolean to lowercase string
+                elif isinstance(value, bool):
+                    value = str(value).lower()
+                # Convert other values to string
+                else:
+                    value = str(value)
+                # Use the field's alias if available, otherwise use the field name
+                param_name = field.alias or field_name
+                params[param_name] = value
+        return params
+
 
 class ValueEstimateParams(BaseEstimateParams):
     """Parameters for requesting a property value estimate."""
@@ -302,23 +338,3 @@ class RentEstimateParams(BaseEstimateParams):
             except ValueError:
                 return v
         return v
-
-    def to_query_params(self) -> dict[str, str]:
-        """Convert the model to query parameters for the API request."""
-        params = {}
-        for field_name, field in self.model_fields.items():
-            value = getattr(self, field_name)
-            if value is not None:
-                # Convert enum values to their string representation
-                if hasattr(value, 'value'):
-                    value = value.value
-                # Convert boolean to lowercase string
-                elif isinstance(value, bool):
-                    value = str(value).lower()
-                # Convert other values to string
-                else:
-                    value = str(value)
-                # Use the field's alias if available, otherwise use the field name
-                param_name = field.alias or field_name
-                params[param_name] = value
-        return params
\ No newline at end of file
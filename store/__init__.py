@@ -0,0 +1,20 @@
+"""
+Local RentCast data store.
+
+This package mirrors RentCast listings and property records into a local SQLite
+database, answers searches from it and keeps it up to date with incremental syncs.
+Records already in memory can also be indexed by location for radius queries.
+"""
+from .listings import RENTAL, SALE, ListingStore
+from .spatial import CachedRadiusSearch, SpatialIndex
+from .sync import ListingSync, SyncResult
+
+__all__ = [
+    "RENTAL",
+    "SALE",
+    "CachedRadiusSearch",
+    "ListingStore",
+    "ListingSync",
+    "SpatialIndex",
+    "SyncResult",
+]
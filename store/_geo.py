@@ -0,0 +1,40 @@
+"""
+Geographic helpers shared by the local store modules.
+"""
+from __future__ import annotations
+
+import math
+
+EARTH_RADIUS_MILES = 3958.8
+
+
+def haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points, in miles."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(
+    latitude: float, longitude: float, radius: float
+) -> tuple[float, float, float, float]:
+    """
+    Latitude/longitude box containing every point within ``radius`` miles.
+
+    Returns:
+        ``(min_lat, max_lat, min_lon, max_lon)``. Longitudes are not wrapped, so
+        boxes crossing the antimeridian are widened to the full range.
+    """
+    dlat = math.degrees(radius / EARTH_RADIUS_MILES)
+    min_lat = max(-90.0, latitude - dlat)
+    max_lat = min(90.0, latitude + dlat)
+    cos_lat = math.cos(math.radians(latitude))
+    if cos_lat <= 1e-12 or min_lat <= -90.0 or max_lat >= 90.0:
+        return min_lat, max_lat, -180.0, 180.0
+    dlon = math.degrees(radius / (EARTH_RADIUS_MILES * cos_lat))
+    if dlon >= 180.0 or longitude - dlon < -180.0 or longitude + dlon > 180.0:
+        return min_lat, max_lat, -180.0, 180.0
+    return min_lat, max_lat, longitude - dlon, longitude + dlon
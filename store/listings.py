@@ -0,0 +1,721 @@
+"""
+Local SQLite store for RentCast listings and property records.
+
+The store keeps the latest API representation of every sale listing, rental
+listing and property record it has seen, keyed by ID. The fields used by the
+search endpoints (location, property type, bedrooms/bathrooms, price and dates)
+are copied into indexed columns, so the ``query_*`` methods answer the same
+searches as ``get_sale_listings``/``get_rental_listings``/``search_properties``
+locally in milliseconds without spending API quota. A sync watermark per market
+lets refreshes pull only what changed since the last run (see ``store.sync``).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+from pydantic import BaseModel
+
+from ..models.lite import LiteProperty, LiteRecord, LiteRentalListing, LiteSaleListing
+from ..models.property_data import Property
+from ..models.property_listings import SaleListing
+from ..models.rental_listings import RentalListing
+from ._geo import bounding_box, haversine_miles
+
+SALE = "sale"
+RENTAL = "rental"
+LISTING_KINDS = (SALE, RENTAL)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    market TEXT,
+    status TEXT,
+    active INTEGER NOT NULL,
+    formatted_address TEXT,
+    city TEXT,
+    state TEXT,
+    zip_code TEXT,
+    latitude REAL,
+    longitude REAL,
+    property_type TEXT,
+    bedrooms REAL,
+    bathrooms REAL,
+    price REAL,
+    listed_date TEXT,
+    removed_date TEXT,
+    last_seen_date TEXT,
+    data TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    synced_at TEXT NOT NULL,
+    PRIMARY KEY (kind, id)
+);
+CREATE INDEX IF NOT EXISTS listings_market ON listings (kind, market, active);
+CREATE INDEX IF NOT EXISTS listings_zip ON listings (kind, zip_code);
+CREATE INDEX IF NOT EXISTS listings_city ON listings (kind, state, city);
+CREATE INDEX IF NOT EXISTS listings_type ON listings (kind, property_type);
+CREATE INDEX IF NOT EXISTS listings_rooms ON listings (kind, bedrooms, bathrooms);
+CREATE INDEX IF NOT EXISTS listings_price ON listings (kind, price);
+CREATE INDEX IF NOT EXISTS listings_listed ON listings (kind, listed_date);
+CREATE INDEX IF NOT EXISTS listings_location ON listings (kind, latitude, longitude);
+
+CREATE TABLE IF NOT EXISTS properties (
+    id TEXT PRIMARY KEY,
+    formatted_address TEXT,
+    city TEXT,
+    state TEXT,
+    zip_code TEXT,
+    latitude REAL,
+    longitude REAL,
+    property_type TEXT,
+    bedrooms REAL,
+    bathrooms REAL,
+    square_feet INTEGER,
+    year_built INTEGER,
+    last_sold_date TEXT,
+    last_sold_price REAL,
+    data TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    synced_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS properties_zip ON properties (zip_code);
+CREATE INDEX IF NOT EXISTS properties_city ON properties (state, city);
+CREATE INDEX IF NOT EXISTS properties_type ON properties (property_type);
+CREATE INDEX IF NOT EXISTS properties_rooms ON properties (bedrooms, bathrooms);
+CREATE INDEX IF NOT EXISTS properties_price ON properties (last_sold_price);
+CREATE INDEX IF NOT EXISTS properties_sold ON properties (last_sold_date);
+CREATE INDEX IF NOT EXISTS properties_location ON properties (latitude, longitude);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    kind TEXT NOT NULL,
+    market TEXT NOT NULL,
+    watermark TEXT NOT NULL,
+    full_refresh TEXT,
+    PRIMARY KEY (kind, market)
+);
+"""
+
+# Indexed columns and the JSON keys they are copied from.
+_LISTING_FIELDS = {
+    "status": "status",
+    "formatted_address": "formattedAddress",
+    "city": "city",
+    "state": "state",
+    "zip_code": "zipCode",
+    "latitude": "latitude",
+    "longitude": "longitude",
+    "property_type": "propertyType",
+    "bedrooms": "bedrooms",
+    "bathrooms": "bathrooms",
+    "price": "price",
+    "listed_date": "listedDate",
+    "removed_date": "removedDate",
+    "last_seen_date": "lastSeenDate",
+}
+
+_PROPERTY_FIELDS = {
+    "formatted_address": "formattedAddress",
+    "city": "city",
+    "state": "state",
+    "zip_code": "zipCode",
+    "latitude": "latitude",
+    "longitude": "longitude",
+    "property_type": "propertyType",
+    "bedrooms": "bedrooms",
+    "bathrooms": "bathrooms",
+    "square_feet": "squareFeet",
+    "year_built": "yearBuilt",
+    "last_sold_date": "lastSoldDate",
+    "last_sold_price": "lastSoldPrice",
+}
+
+_LISTING_MODELS: dict[str, tuple[type[BaseModel], type[LiteRecord]]] = {
+    SALE: (SaleListing, LiteSaleListing),
+    RENTAL: (RentalListing, LiteRentalListing),
+}
+
+# SQLite limits the number of bound parameters per statement.
+_CHUNK = 500
+
+
+def utcnow() -> datetime:
+    """Current time as an aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+def _as_json(record: Any) -> dict[str, Any]:
+    """Return the API (camelCase) representation of a record."""
+    if isinstance(record, dict):
+        return record
+    if isinstance(record, LiteRecord):
+        return record.raw
+    if isinstance(record, BaseModel):
+        return record.model_dump(mode="json", by_alias=True)
+    raise TypeError(f"Cannot store record of type {type(record).__name__}")
+
+
+def _digest(record: dict[str, Any]) -> str:
+    """Content hash used to detect changed records."""
+    encoded = json.dumps(record, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+def _is_active(record: dict[str, Any]) -> bool:
+    return record.get("status", "Active") == "Active" and not record.get("removedDate")
+
+
+def _check_kind(kind: str) -> None:
+    if kind not in LISTING_KINDS:
+        raise ValueError(f"Listing kind must be one of {LISTING_KINDS}, got {kind!r}")
+
+
+def _date_cutoff(days: int) -> str:
+    """ISO timestamp ``days`` ago, comparable with the API's date strings."""
+    return (utcnow() - timedelta(days=days)).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+class ListingStore:
+    """
+    SQLite-backed store of sale listings, rental listings and property records.
+
+    Records are stored as their raw API JSON objects (camelCase keys) and can be
+    returned as validated models or as lite records. Raw dicts, lite records and
+    pydantic models are all accepted on insert.
+
+    Example:
+        ```python
+        store = ListingStore("rentcast.db")
+        store.upsert_listings("sale", page.data)
+        listings = store.query_sale_listings(zip_code="78704", bedrooms=3, limit=100)
+        ```
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        """
+        Open (or create) a store.
+
+        Args:
+            path: SQLite database file, or ``":memory:"`` for a temporary store.
+        """
+        self.path = str(path)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.row_factory = sqlite3.Row
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(sync_state)")}
+        if "full_refresh" not in columns:
+            # Stores created before full refreshes were tracked.
+            self._conn.execute("ALTER TABLE sync_state ADD COLUMN full_refresh TEXT")
+
+    def __enter__(self) -> ListingStore:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def _existing_digests(self, table: str, ids: list[str], kind: str | None) -> dict[str, str]:
+        existing: dict[str, str] = {}
+        prefix = (kind,) if kind is not None else ()
+        kind_clause = "kind = ? AND " if kind is not None else ""
+        for start in range(0, len(ids), _CHUNK):
+            chunk = ids[start:start + _CHUNK]
+            rows = self._conn.execute(
+                f"SELECT id, digest FROM {table} WHERE {kind_clause}"
+                f"id IN ({', '.join('?' * len(chunk))})",
+                (*prefix, *chunk),
+            )
+            existing.update((row["id"], row["digest"]) for row in rows)
+        return existing
+
+    def upsert_listings(
+        self,
+        kind: str,
+        records: Iterable[Any],
+        *,
+        market: str | None = None,
+        synced_at: datetime | None = None,
+    ) -> dict[str, int]:
+        """
+        Insert new listings and update changed ones, keyed by listing ID.
+
+        Args:
+            kind: ``"sale"`` or ``"rental"``.
+            records: Listings as raw JSON objects, lite records or models.
+            market: Market the listings were synced for. Left unchanged for
+                existing listings when omitted.
+            synced_at: Time of the sync run (defaults to now).
+
+        Returns:
+            Counts of ``"inserted"``, ``"updated"`` and ``"unchanged"`` listings.
+        """
+        _check_kind(kind)
+        synced = (synced_at or utcnow()).isoformat()
+        batch = {data["id"]: data for data in map(_as_json, records)}
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+        if not batch:
+            return counts
+
+        existing = self._existing_digests("listings", list(batch), kind)
+        changed = []
+        unchanged = []
+        for listing_id, data in batch.items():
+            digest = _digest(data)
+            if existing.get(listing_id) == digest:
+                unchanged.append(listing_id)
+                continue
+            counts["updated" if listing_id in existing else "inserted"] += 1
+            changed.append((
+                kind,
+                listing_id,
+                market,
+                int(_is_active(data)),
+                *(data.get(key) for key in _LISTING_FIELDS.values()),
+                json.dumps(data, separators=(",", ":"), default=str),
+                digest,
+                synced,
+            ))
+        counts["unchanged"] = len(unchanged)
+
+        columns = [
+            "kind", "id", "market", "active", *_LISTING_FIELDS, "data", "digest", "synced_at"
+        ]
+        updates = ", ".join(
+            f"{column} = excluded.{column}" for column in columns[3:]
+        )
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT INTO listings ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' * len(columns))}) "
+                f"ON CONFLICT (kind, id) DO UPDATE SET {updates}, "
+                f"market = COALESCE(excluded.market, listings.market)",
+                changed,
+            )
+            # Unchanged listings were still seen in this run.
+            self._conn.executemany(
+                "UPDATE listings SET synced_at = ? WHERE kind = ? AND id = ?",
+                [(synced, kind, listing_id) for listing_id in unchanged],
+            )
+        return counts
+
+    def upsert_properties(
+        self,
+        records: Iterable[Any],
+        *,
+        synced_at: datetime | None = None,
+    ) -> dict[str, int]:
+        """
+        Insert new property records and update changed ones, keyed by ID.
+
+        Args:
+            records: Properties as raw JSON objects, lite records or models.
+            synced_at: Time the records were fetched (defaults to now).
+
+        Returns:
+            Counts of ``"inserted"``, ``"updated"`` and ``"unchanged"`` records.
+        """
+        synced = (synced_at or utcnow()).isoformat()
+        batch = {data["id"]: data for data in map(_as_json, records)}
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+        if not batch:
+            return counts
+
+        existing = self._existing_digests("properties", list(batch), None)
+        changed = []
+        for property_id, data in batch.items():
+            digest = _digest(data)
+            if existing.get(property_id) == digest:
+                counts["unchanged"] += 1
+                continue
+            counts["updated" if property_id in existing else "inserted"] += 1
+            changed.append((
+                property_id,
+                *(data.get(key) for key in _PROPERTY_FIELDS.values()),
+                json.dumps(data, separators=(",", ":"), default=str),
+                digest,
+                synced,
+            ))
+
+        columns = ["id", *_PROPERTY_FIELDS, "data", "digest", "synced_at"]
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO properties ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' * len(columns))})",
+                changed,
+            )
+        return counts
+
+    def deactivate_stale(
+        self,
+        kind: str,
+        market: str,
+        last_seen_before: datetime,
+        *,
+        synced_since: datetime | None = None,
+    ) -> int:
+        """
+        Mark active listings inactive when RentCast has not seen them recently.
+
+        A stored ``lastSeenDate`` only moves forward when the listing is fetched
+        again, so it says nothing about listings that were not re-fetched. Pass
+        ``synced_since`` to judge only listings fetched since then.
+
+        Args:
+            kind: ``"sale"`` or ``"rental"``.
+            market: Market to check.
+            last_seen_before: Listings whose ``lastSeenDate`` is older are
+                considered gone from the market.
+            synced_since: Only consider listings synced at or after this time
+                (None considers every active listing).
+
+        Returns:
+            The number of listings deactivated.
+        """
+        _check_kind(kind)
+        sql = (
+            "UPDATE listings SET active = 0 WHERE kind = ? AND market = ? "
+            "AND active = 1 AND last_seen_date IS NOT NULL "
+            "AND julianday(last_seen_date) < julianday(?)"
+        )
+        args: list[Any] = [kind, market, last_seen_before.isoformat()]
+        if synced_since is not None:
+            sql += " AND synced_at >= ?"
+            args.append(synced_since.isoformat())
+        with self._conn:
+            cursor = self._conn.execute(sql, args)
+        return cursor.rowcount
+
+    def deactivate_missing(self, kind: str, market: str, synced_before: datetime) -> int:
+        """
+        Mark active listings inactive when a full refresh did not return them.
+
+        Args:
+            kind: ``"sale"`` or ``"rental"``.
+            market: Market that was fully refreshed.
+            synced_before: Start of the full refresh; active listings not touched
+                since then have disappeared from the market.
+
+        Returns:
+            The number of listings deactivated.
+        """
+        _check_kind(kind)
+        with self._conn:
+            cursor = self._conn.execute(
+                "UPDATE listings SET active = 0 WHERE kind = ? AND market = ? "
+                "AND active = 1 AND synced_at < ?",
+                (kind, market, synced_before.isoformat()),
+            )
+        return cursor.rowcount
+
+    def get_listing(self, kind: str, listing_id: str) -> dict[str, Any] | None:
+        """Return the stored JSON object for a listing, or None."""
+        row = self._conn.execute(
+            "SELECT data FROM listings WHERE kind = ? AND id = ?", (kind, listing_id)
+        ).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def get_property(self, property_id: str) -> dict[str, Any] | None:
+        """Return the stored JSON object for a property record, or None."""
+        row = self._conn.execute(
+            "SELECT data FROM properties WHERE id = ?", (property_id,)
+        ).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def count(self, kind: str, market: str | None = None, *, active: bool | None = None) -> int:
+        """Number of stored listings, optionally filtered by market and activity."""
+        sql = "SELECT COUNT(*) FROM listings WHERE kind = ?"
+        args: list[Any] = [kind]
+        if market is not None:
+            sql += " AND market = ?"
+            args.append(market)
+        if active is not None:
+            sql += " AND active = ?"
+            args.append(int(active))
+        return self._conn.execute(sql, args).fetchone()[0]
+
+    def _search(
+        self,
+        table: str,
+        where: list[str],
+        args: list[Any],
+        *,
+        order_by: str,
+        latitude: float | None,
+        longitude: float | None,
+        radius: float | None,
+        limit: int | None,
+        offset: int,
+    ) -> list[dict[str, Any]]:
+        """Run a search and return the matching JSON objects."""
+        if offset < 0:
+            raise ValueError("Offset must be 0 or greater")
+        if (latitude is not None or longitude is not None) and radius is None:
+            raise ValueError("Radius is required when using latitude/longitude")
+        if (latitude is None or longitude is None) and radius is not None:
+            raise ValueError("Latitude and longitude are required when using radius")
+
+        columns = "data"
+        if radius is not None:
+            # Narrow down with the bounding box index, then check exact distances.
+            min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius)
+            where = [*where, "latitude BETWEEN ? AND ?", "longitude BETWEEN ? AND ?"]
+            args = [*args, min_lat, max_lat, min_lon, max_lon]
+            columns = "data, latitude, longitude"
+
+        sql = f"SELECT {columns} FROM {table}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order_by}"
+
+        if radius is None:
+            if limit is not None:
+                sql += " LIMIT ? OFFSET ?"
+                args = [*args, limit, offset]
+            elif offset:
+                sql += " LIMIT -1 OFFSET ?"
+                args = [*args, offset]
+            return [json.loads(row["data"]) for row in self._conn.execute(sql, args)]
+
+        rows = (
+            row for row in self._conn.execute(sql, args)
+            if haversine_miles(latitude, longitude, row["latitude"], row["longitude"]) <= radius
+        )
+        results = []
+        for index, row in enumerate(rows):
+            if index < offset:
+                continue
+            if limit is not None and len(results) >= limit:
+                break
+            results.append(json.loads(row["data"]))
+        return results
+
+    def query_listings(
+        self,
+        kind: str,
+        *,
+        address: str | None = None,
+        city: str | None = None,
+        state: str | None = None,
+        zip_code: str | None = None,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        radius: float | None = None,
+        property_type: str | None = None,
+        bedrooms: float | None = None,
+        bathrooms: float | None = None,
+        status: str | None = "Active",
+        days_old: int | None = None,
+        min_price: float | None = None,
+        max_price: float | None = None,
+        limit: int | None = 50,
+        offset: int = 0,
+        lite: bool = False,
+    ) -> list[SaleListing] | list[RentalListing] | list[LiteRecord]:
+        """
+        Search stored listings with the criteria of the listing search endpoints.
+
+        Unlike the API, ``city`` and ``state`` have no default, and ``limit`` is
+        not capped (None returns every match). Results are ordered by listed
+        date, newest first.
+
+        Args:
+            kind: ``"sale"`` or ``"rental"``.
+            address: The full formatted address of the property.
+            city: The name of the city to search in (case-sensitive).
+            state: The 2-character state abbreviation to search in.
+            zip_code: The 5-digit zip code to search in.
+            latitude: The latitude of the search area (use with longitude and radius).
+            longitude: The longitude of the search area (use with latitude and radius).
+            radius: The radius in miles for the search area.
+            property_type: The type of property to filter by.
+            bedrooms: The number of bedrooms to filter by (use 0 for studio).
+            bathrooms: The number of bathrooms to filter by.
+            status: ``"Active"``, ``"Inactive"`` or None for both.
+            days_old: The maximum number of days since the property was listed.
+            min_price: Minimum listing price.
+            max_price: Maximum listing price.
+            limit: The maximum number of listings to return.
+            offset: The index of the first listing to return.
+            lite: Return lite records instead of validated models.
+
+        Returns:
+            Matching listings as models, or lite records when ``lite`` is set.
+        """
+        _check_kind(kind)
+        where = ["kind = ?"]
+        args: list[Any] = [kind]
+        for column, value in (
+            ("formatted_address", address),
+            ("city", city),
+            ("state", state),
+            ("zip_code", zip_code),
+            ("property_type", property_type),
+            ("bedrooms", bedrooms),
+            ("bathrooms", bathrooms),
+        ):
+            if value is not None:
+                where.append(f"{column} = ?")
+                args.append(value)
+        if status is not None:
+            if status not in ("Active", "Inactive"):
+                raise ValueError("Status must be 'Active', 'Inactive' or None")
+            where.append("active = ?")
+            args.append(int(status == "Active"))
+        if days_old is not None:
+            where.append("listed_date >= ?")
+            args.append(_date_cutoff(days_old))
+        if min_price is not None:
+            where.append("price >= ?")
+            args.append(min_price)
+        if max_price is not None:
+            where.append("price <= ?")
+            args.append(max_price)
+
+        records = self._search(
+            "listings",
+            where,
+            args,
+            order_by="listed_date DESC, id",
+            latitude=latitude,
+            longitude=longitude,
+            radius=radius,
+            limit=limit,
+            offset=offset,
+        )
+        model, lite_model = _LISTING_MODELS[kind]
+        if lite:
+            return lite_model.from_records(records)
+        return [model.model_validate(record) for record in records]
+
+    def query_sale_listings(self, **criteria: Any) -> list[SaleListing] | list[LiteSaleListing]:
+        """Search stored sale listings; see ``query_listings`` for the criteria."""
+        return self.query_listings(SALE, **criteria)
+
+    def query_rental_listings(
+        self, **criteria: Any
+    ) -> list[RentalListing] | list[LiteRentalListing]:
+        """Search stored rental listings; see ``query_listings`` for the criteria."""
+        return self.query_listings(RENTAL, **criteria)
+
+    def query_properties(
+        self,
+        *,
+        address: str | None = None,
+        city: str | None = None,
+        state: str | None = None,
+        zip_code: str | None = None,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        radius: float | None = None,
+        property_type: str | None = None,
+        bedrooms: float | None = None,
+        bathrooms: float | None = None,
+        sale_date_range: int | None = None,
+        limit: int | None = 50,
+        offset: int = 0,
+        lite: bool = False,
+    ) -> list[Property] | list[LiteProperty]:
+        """
+        Search stored property records with the criteria of ``search_properties``.
+
+        Args:
+            address: The full formatted address of the property.
+            city: The name of the city to search in (case-sensitive).
+            state: The 2-character state abbreviation to search in.
+            zip_code: The 5-digit zip code to search in.
+            latitude: The latitude of the search area (use with longitude and radius).
+            longitude: The longitude of the search area (use with latitude and radius).
+            radius: The radius in miles for the search area.
+            property_type: The type of property to filter by.
+            bedrooms: The number of bedrooms to filter by.
+            bathrooms: The number of bathrooms to filter by.
+            sale_date_range: Only properties sold within this many days.
+            limit: The maximum number of records to return (None for all).
+            offset: The index of the first record to return.
+            lite: Return LiteProperty records instead of validated models.
+
+        Returns:
+            Matching property records, ordered by ID.
+        """
+        where: list[str] = []
+        args: list[Any] = []
+        for column, value in (
+            ("formatted_address", address),
+            ("city", city),
+            ("state", state),
+            ("zip_code", zip_code),
+            ("property_type", property_type),
+            ("bedrooms", bedrooms),
+            ("bathrooms", bathrooms),
+        ):
+            if value is not None:
+                where.append(f"{column} = ?")
+                args.append(value)
+        if sale_date_range is not None:
+            where.append("last_sold_date >= ?")
+            args.append(_date_cutoff(sale_date_range))
+
+        records = self._search(
+            "properties",
+            where,
+            args,
+            order_by="id",
+            latitude=latitude,
+            longitude=longitude,
+            radius=radius,
+            limit=limit,
+            offset=offset,
+        )
+        if lite:
+            return LiteProperty.from_records(records)
+        return [Property.model_validate(record) for record in records]
+
+    def get_watermark(self, kind: str, market: str) -> datetime | None:
+        """Start time of the last successful sync of a market, or None."""
+        row = self._conn.execute(
+            "SELECT watermark FROM sync_state WHERE kind = ? AND market = ?", (kind, market)
+        ).fetchone()
+        return datetime.fromisoformat(row["watermark"]) if row else None
+
+    def get_full_refresh(self, kind: str, market: str) -> datetime | None:
+        """Start time of the last successful full refresh of a market, or None."""
+        row = self._conn.execute(
+            "SELECT full_refresh FROM sync_state WHERE kind = ? AND market = ?", (kind, market)
+        ).fetchone()
+        return datetime.fromisoformat(row["full_refresh"]) if row and row["full_refresh"] else None
+
+    def set_watermark(
+        self,
+        kind: str,
+        market: str,
+        watermark: datetime,
+        *,
+        full_refresh: bool = False,
+    ) -> None:
+        """
+        Record the start time of a successful sync of a market.
+
+        With ``full_refresh`` set it is also recorded as the last full refresh.
+        """
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO sync_state (kind, market, watermark, full_refresh) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (kind, market) DO UPDATE SET watermark = excluded.watermark, "
+                "full_refresh = COALESCE(excluded.full_refresh, sync_state.full_refresh)",
+                (
+                    kind,
+                    market,
+                    watermark.isoformat(),
+                    watermark.isoformat() if full_refresh else None,
+                ),
+            )
@@ -0,0 +1,354 @@
+"""
+In-process spatial index over fetched RentCast records.
+
+Every record type (properties, sale and rental listings, comparables) carries a
+latitude and longitude. ``SpatialIndex`` buckets records into a fixed grid of
+latitude/longitude cells (the same idea as geohash prefixes) and answers radius
+and k-nearest queries with exact haversine distances. It also remembers which
+cells have been fully covered by earlier API searches, so ``CachedRadiusSearch``
+only goes back to the API for areas that have not been loaded yet.
+"""
+from __future__ import annotations
+
+import heapq
+import math
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator
+
+from ._geo import EARTH_RADIUS_MILES, bounding_box, haversine_miles
+
+# 0.02 degrees is about 1.4 miles of latitude.
+DEFAULT_CELL_SIZE = 0.02
+
+# Recent search areas remembered in full, on top of per-cell coverage.
+_MAX_COVERED_AREAS = 256
+
+_MILES_PER_DEGREE = math.radians(1) * EARTH_RADIUS_MILES
+
+Cell = tuple[int, int]
+
+
+def _coordinates(record: Any) -> tuple[float | None, float | None]:
+    if isinstance(record, dict):
+        return record.get("latitude"), record.get("longitude")
+    return getattr(record, "latitude", None), getattr(record, "longitude", None)
+
+
+def _record_id(record: Any) -> Any:
+    record_id = record.get("id") if isinstance(record, dict) else getattr(record, "id", None)
+    return record_id if record_id is not None else id(record)
+
+
+class SpatialIndex:
+    """
+    Grid-bucketed index of records by location.
+
+    Records can be raw JSON objects, lite records or pydantic models; records
+    without coordinates are ignored. Adding a record with an ID already in the
+    index replaces the previous version.
+
+    Coverage is tracked per cell: a cell is covered once it lies entirely inside
+    the area of an API search whose results were added to the index. The most
+    recent search areas are also kept as circles, so a query inside a single
+    earlier search is covered even where it touches partly covered cells. Keep one
+    index per record type and set of search filters, since coverage for one
+    filter set says nothing about another.
+
+    Example:
+        ```python
+        index = SpatialIndex()
+        index.extend(page.data)
+        nearby = index.within_radius(30.25, -97.75, 2.0)
+        closest = index.nearest(30.25, -97.75, k=10)
+        ```
+    """
+
+    def __init__(
+        self,
+        cell_size: float = DEFAULT_CELL_SIZE,
+        *,
+        coverage_ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            cell_size: Grid cell size in degrees.
+            coverage_ttl: Seconds after which covered areas must be fetched
+                again (None keeps coverage forever).
+            clock: Time source used for coverage expiry.
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be greater than 0")
+        self.cell_size = cell_size
+        self.coverage_ttl = coverage_ttl
+        self._clock = clock
+        self._cells: dict[Cell, dict[Any, tuple[float, float, Any]]] = {}
+        self._locations: dict[Any, Cell] = {}
+        self._covered: dict[Cell, float] = {}
+        self._areas: deque[tuple[float, float, float, float]] = deque(maxlen=_MAX_COVERED_AREAS)
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def _cell(self, latitude: float, longitude: float) -> Cell:
+        return (
+            math.floor(latitude / self.cell_size),
+            math.floor(longitude / self.cell_size),
+        )
+
+    def add(self, record: Any) -> bool:
+        """
+        Add or replace a record.
+
+        Returns:
+            False if the record has no coordinates and was skipped.
+        """
+        latitude, longitude = _coordinates(record)
+        if latitude is None or longitude is None:
+            return False
+        key = _record_id(record)
+        previous = self._locations.get(key)
+        if previous is not None:
+            bucket = self._cells[previous]
+            del bucket[key]
+            if not bucket:
+                del self._cells[previous]
+        cell = self._cell(latitude, longitude)
+        self._cells.setdefault(cell, {})[key] = (latitude, longitude, record)
+        self._locations[key] = cell
+        return True
+
+    def extend(self, records: Iterable[Any]) -> int:
+        """Add several records and return how many were indexed."""
+        return sum(self.add(record) for record in records)
+
+    def clear(self) -> None:
+        """Remove every record and all coverage."""
+        self._cells.clear()
+        self._locations.clear()
+        self._covered.clear()
+        self._areas.clear()
+
+    def _cells_in_box(
+        self, min_lat: float, max_lat: float, min_lon: float, max_lon: float
+    ) -> Iterator[Cell]:
+        low = self._cell(min_lat, min_lon)
+        high = self._cell(max_lat, max_lon)
+        for row in range(low[0], high[0] + 1):
+            for col in range(low[1], high[1] + 1):
+                yield row, col
+
+    def _candidate_cells(self, latitude: float, longitude: float, radius: float) -> Iterable[Cell]:
+        box = bounding_box(latitude, longitude, radius)
+        low = self._cell(box[0], box[2])
+        high = self._cell(box[1], box[3])
+        area = (high[0] - low[0] + 1) * (high[1] - low[1] + 1)
+        if area > len(self._cells):
+            # Cheaper to scan the occupied cells than the whole box.
+            return [
+                cell for cell in self._cells
+                if low[0] <= cell[0] <= high[0] and low[1] <= cell[1] <= high[1]
+            ]
+        return self._cells_in_box(*box)
+
+    def within_radius(
+        self, latitude: float, longitude: float, radius: float
+    ) -> list[tuple[float, Any]]:
+        """
+        Records within ``radius`` miles of a point.
+
+        Returns:
+            ``(distance in miles, record)`` pairs, nearest first.
+        """
+        matches = []
+        for cell in self._candidate_cells(latitude, longitude, radius):
+            for lat, lon, record in self._cells.get(cell, {}).values():
+                distance = haversine_miles(latitude, longitude, lat, lon)
+                if distance <= radius:
+                    matches.append((distance, record))
+        matches.sort(key=lambda match: match[0])
+        return matches
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int,
+        *,
+        max_radius: float | None = None,
+    ) -> list[tuple[float, Any]]:
+        """
+        The ``k`` records closest to a point.
+
+        Cells are searched in growing rings around the point until no unsearched
+        cell can hold anything closer than the k-th match found so far.
+
+        Args:
+            latitude: Latitude of the point.
+            longitude: Longitude of the point.
+            k: Number of records to return.
+            max_radius: Optional distance limit in miles.
+
+        Returns:
+            Up to ``k`` ``(distance in miles, record)`` pairs, nearest first.
+        """
+        if k < 1 or not self._cells:
+            return []
+        center = self._cell(latitude, longitude)
+        # Smallest cell dimension in miles, used to bound distances per ring.
+        cos_lat = max(math.cos(math.radians(latitude)), 1e-6)
+        cell_miles = self.cell_size * _MILES_PER_DEGREE * cos_lat
+        rows = [cell[0] for cell in self._cells]
+        cols = [cell[1] for cell in self._cells]
+        max_ring = max(
+            abs(center[0] - min(rows)), abs(center[0] - max(rows)),
+            abs(center[1] - min(cols)), abs(center[1] - max(cols)),
+        )
+        if max_radius is not None:
+            max_ring = min(max_ring, math.ceil(max_radius / cell_miles) + 1)
+
+        heap: list[tuple[float, int, Any]] = []  # max-heap of the k best (negated)
+        for ring in range(max_ring + 1):
+            # Every point in this ring is at least (ring - 1) cells away.
+            if len(heap) == k and -heap[0][0] <= (ring - 1) * cell_miles:
+                break
+            for cell in self._ring(center, ring):
+                for lat, lon, record in self._cells.get(cell, {}).values():
+                    distance = haversine_miles(latitude, longitude, lat, lon)
+                    if max_radius is not None and distance > max_radius:
+                        continue
+                    entry = (-distance, id(record), record)
+                    if len(heap) < k:
+                        heapq.heappush(heap, entry)
+                    elif distance < -heap[0][0]:
+                        heapq.heapreplace(heap, entry)
+        return sorted(((-neg, record) for neg, _, record in heap), key=lambda m: m[0])
+
+    @staticmethod
+    def _ring(center: Cell, ring: int) -> Iterator[Cell]:
+        row, col = center
+        if ring == 0:
+            yield center
+            return
+        for dc in range(-ring, ring + 1):
+            yield row - ring, col + dc
+            yield row + ring, col + dc
+        for dr in range(-ring + 1, ring):
+            yield row + dr, col - ring
+            yield row + dr, col + ring
+
+    def _cell_distance_range(
+        self, cell: Cell, latitude: float, longitude: float
+    ) -> tuple[float, float]:
+        """Closest and farthest distance from a point to a cell, in miles."""
+        min_lat = cell[0] * self.cell_size
+        min_lon = cell[1] * self.cell_size
+        max_lat = min_lat + self.cell_size
+        max_lon = min_lon + self.cell_size
+        closest = haversine_miles(
+            latitude,
+            longitude,
+            min(max(latitude, min_lat), max_lat),
+            min(max(longitude, min_lon), max_lon),
+        )
+        farthest = max(
+            haversine_miles(latitude, longitude, lat, lon)
+            for lat in (min_lat, max_lat)
+            for lon in (min_lon, max_lon)
+        )
+        return closest, farthest
+
+    def mark_covered(self, latitude: float, longitude: float, radius: float) -> None:
+        """Record that every record within ``radius`` miles of a point is loaded."""
+        now = self._clock()
+        self._areas.append((latitude, longitude, radius, now))
+        for cell in self._cells_in_box(*bounding_box(latitude, longitude, radius)):
+            if self._cell_distance_range(cell, latitude, longitude)[1] <= radius:
+                self._covered[cell] = now
+
+    def is_covered(self, latitude: float, longitude: float, radius: float) -> bool:
+        """Whether a radius search can be answered from the index alone."""
+        cutoff = None if self.coverage_ttl is None else self._clock() - self.coverage_ttl
+        for area_lat, area_lon, area_radius, covered_at in self._areas:
+            if cutoff is not None and covered_at < cutoff:
+                continue
+            if haversine_miles(latitude, longitude, area_lat, area_lon) + radius <= area_radius:
+                return True
+        for cell in self._cells_in_box(*bounding_box(latitude, longitude, radius)):
+            if self._cell_distance_range(cell, latitude, longitude)[0] > radius:
+                continue
+            covered_at = self._covered.get(cell)
+            if covered_at is None or (cutoff is not None and covered_at < cutoff):
+                return False
+        return True
+
+
+class CachedRadiusSearch:
+    """
+    Radius and nearest-neighbour search that calls the API only for new areas.
+
+    ``fetch`` is called with ``latitude``, ``longitude`` and ``radius`` keyword
+    arguments and must return an async iterator over every record in the area,
+    for example
+    ``functools.partial(client.listings.sale.iter_sale_listings, lite=True)``.
+    Its records are added to the index, and the area is marked covered once the
+    iterator is exhausted. A function returning a single page is rejected, as
+    the area would be marked covered with only part of its records loaded.
+
+    Example:
+        ```python
+        search = CachedRadiusSearch(
+            partial(client.listings.sale.iter_sale_listings, city=None, state=None, lite=True)
+        )
+        listings = await search.within_radius(30.25, -97.75, 2.0)  # API call
+        listings = await search.within_radius(30.251, -97.749, 1.5)  # answered locally
+        ```
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., AsyncIterator[Any]],
+        index: SpatialIndex | None = None,
+    ) -> None:
+        self.fetch = fetch
+        self.index = index if index is not None else SpatialIndex()
+        self.hits = 0
+        self.misses = 0
+
+    async def _ensure_covered(self, latitude: float, longitude: float, radius: float) -> None:
+        if self.index.is_covered(latitude, longitude, radius):
+            self.hits += 1
+            return
+        self.misses += 1
+        result = self.fetch(latitude=latitude, longitude=longitude, radius=radius)
+        if not hasattr(result, "__aiter__"):
+            if hasattr(result, "close"):
+                # Do not leave an unawaited coroutine behind.
+                result.close()
+            raise TypeError(
+                "fetch must return an async iterator over every record in the area "
+                f"(e.g. iter_sale_listings), not {type(result).__name__}"
+            )
+        async for record in result:
+            self.index.add(record)
+        self.index.mark_covered(latitude, longitude, radius)
+
+    async def within_radius(
+        self, latitude: float, longitude: float, radius: float
+    ) -> list[Any]:
+        """Records within ``radius`` miles of a point, nearest first."""
+        await self._ensure_covered(latitude, longitude, radius)
+        return [record for _, record in self.index.within_radius(latitude, longitude, radius)]
+
+    async def nearest(
+        self, latitude: float, longitude: float, k: int, radius: float
+    ) -> list[Any]:
+        """The ``k`` records closest to a point, searching up to ``radius`` miles."""
+        await self._ensure_covered(latitude, longitude, radius)
+        return [
+            record
+            for _, record in self.index.nearest(latitude, longitude, k, max_radius=radius)
+        ]
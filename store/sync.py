@@ -0,0 +1,232 @@
+"""
+Incremental listing sync for the RentCast API.
+
+Keeps a ``ListingStore`` in step with RentCast by pulling, per market, only the
+listings added since the previous run (using the ``daysOld`` filter and a
+per-market watermark), upserting changed records by ID and marking listings
+inactive once they disappear from the market. ``daysOld`` filters on the listing
+date, so older listings are re-fetched by periodic full refreshes.
+"""
+from __future__ import annotations
+
+import logging
+import math
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator
+
+from ..client import RentCastClient
+from .listings import LISTING_KINDS, SALE, ListingStore, _check_kind, utcnow
+
+logger = logging.getLogger(__name__)
+
+# Listings are upserted in batches of one API page.
+_BATCH_SIZE = 500
+
+
+class SyncResult:
+    """Summary of a market sync."""
+
+    def __init__(self, kind: str, market: str, *, full_refresh: bool, days_old: int | None) -> None:
+        self.kind = kind
+        self.market = market
+        self.full_refresh = full_refresh
+        self.days_old = days_old
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.deactivated = 0
+
+    @property
+    def fetched(self) -> int:
+        """Number of listings returned by the API during the sync."""
+        return self.inserted + self.updated + self.unchanged
+
+    def __repr__(self) -> str:
+        return (
+            f"SyncResult(kind={self.kind!r}, market={self.market!r}, "
+            f"full_refresh={self.full_refresh}, days_old={self.days_old}, "
+            f"inserted={self.inserted}, updated={self.updated}, "
+            f"unchanged={self.unchanged}, deactivated={self.deactivated})"
+        )
+
+
+class ListingSync:
+    """
+    Incremental sync engine mirroring RentCast listings into a ListingStore.
+
+    The first sync of a market is a full refresh. Later syncs request only
+    listings newer than the market's watermark, plus ``overlap_days`` to cover
+    clock skew and late indexing. Incremental windows filter on the listing
+    date, so a listing older than the window is not fetched again: its closure,
+    price and status changes are picked up by the next full refresh, which runs
+    every ``full_refresh_days``. Listings leave the active set when RentCast
+    reports them inactive, when a listing fetched in the run has a
+    ``lastSeenDate`` more than ``stale_after_days`` behind, or when a full
+    refresh no longer returns them.
+
+    Example:
+        ```python
+        sync = ListingSync(client, ListingStore("listings.db"))
+        result = await sync.sync_market("sale", "austin-tx", city="Austin", state="TX")
+        ```
+    """
+
+    def __init__(
+        self,
+        client: RentCastClient,
+        store: ListingStore,
+        *,
+        overlap_days: int = 1,
+        stale_after_days: int | None = 7,
+        full_refresh_days: int | None = 7,
+        prefetch: int = 4,
+    ) -> None:
+        """
+        Initialize the sync engine.
+
+        Args:
+            client: RentCast client used to fetch listings.
+            store: Store holding the local mirror and watermarks.
+            overlap_days: Extra days added to each incremental window.
+            stale_after_days: Deactivate listings fetched in a run that RentCast
+                has not seen for this many days (None disables the check).
+            full_refresh_days: Days after which the next sync of a market is a
+                full refresh (None only refreshes fully on the first sync or when
+                asked to).
+            prefetch: Page requests kept in flight while paginating.
+        """
+        if overlap_days < 0:
+            raise ValueError("overlap_days must be 0 or greater")
+        if full_refresh_days is not None and full_refresh_days < 1:
+            raise ValueError("full_refresh_days must be at least 1")
+        self.client = client
+        self.store = store
+        self.overlap_days = overlap_days
+        self.stale_after_days = stale_after_days
+        self.full_refresh_days = full_refresh_days
+        self.prefetch = prefetch
+
+    def _iter_listings(self, kind: str, **filters: Any) -> AsyncIterator[Any]:
+        if kind == SALE:
+            return self.client.listings.sale.iter_sale_listings(
+                lite=True, prefetch=self.prefetch, **filters
+            )
+        return self.client.listings.rental.iter_rental_listings(
+            lite=True, prefetch=self.prefetch, **filters
+        )
+
+    async def _pull(self, result: SyncResult, synced_at: Any, **filters: Any) -> None:
+        """Fetch listings and upsert them page by page."""
+        batch: list[dict[str, Any]] = []
+
+        def flush() -> None:
+            counts = self.store.upsert_listings(
+                result.kind, batch, market=result.market, synced_at=synced_at
+            )
+            result.inserted += counts["inserted"]
+            result.updated += counts["updated"]
+            result.unchanged += counts["unchanged"]
+            batch.clear()
+
+        async for listing in self._iter_listings(result.kind, **filters):
+            batch.append(listing.raw)
+            if len(batch) >= _BATCH_SIZE:
+                flush()
+        if batch:
+            flush()
+
+    def _full_refresh_due(self, kind: str, market: str, now: datetime) -> bool:
+        if self.full_refresh_days is None:
+            return False
+        last = self.store.get_full_refresh(kind, market)
+        return last is None or now - last >= timedelta(days=self.full_refresh_days)
+
+    async def sync_market(
+        self,
+        kind: str,
+        market: str,
+        *,
+        full_refresh: bool = False,
+        **filters: Any,
+    ) -> SyncResult:
+        """
+        Bring the local mirror of one market up to date.
+
+        Args:
+            kind: ``"sale"`` or ``"rental"``.
+            market: Stable name for the market, used for its watermark
+                (e.g. ``"austin-tx"`` or a zip code).
+            full_refresh: Re-download every active listing in the market and
+                deactivate the ones no longer returned. Happens automatically on
+                the first sync of a market and every ``full_refresh_days``.
+            **filters: Search criteria defining the market, passed to
+                ``iter_sale_listings``/``iter_rental_listings`` (e.g. ``city``,
+                ``state``, ``zip_code``, ``property_type``).
+
+        Returns:
+            SyncResult with per-run counts.
+        """
+        _check_kind(kind)
+        if "days_old" in filters or "status" in filters:
+            raise ValueError("days_old and status are managed by the sync engine")
+
+        started = utcnow()
+        watermark = self.store.get_watermark(kind, market)
+        full_refresh = (
+            full_refresh
+            or watermark is None
+            or self._full_refresh_due(kind, market, started)
+        )
+
+        days_old = None
+        if not full_refresh:
+            elapsed_days = (started - watermark).total_seconds() / 86400
+            days_old = max(1, math.ceil(elapsed_days)) + self.overlap_days
+
+        result = SyncResult(kind, market, full_refresh=full_refresh, days_old=days_old)
+        if full_refresh:
+            await self._pull(result, started, status="Active", **filters)
+            result.deactivated += self.store.deactivate_missing(kind, market, started)
+        else:
+            await self._pull(result, started, status="Active", days_old=days_old, **filters)
+            # Recent listings that already closed come back as Inactive.
+            await self._pull(result, started, status="Inactive", days_old=days_old, **filters)
+
+        if self.stale_after_days is not None:
+            # Only listings fetched in this run have an up-to-date lastSeenDate.
+            result.deactivated += self.store.deactivate_stale(
+                kind,
+                market,
+                started - timedelta(days=self.stale_after_days),
+                synced_since=started,
+            )
+
+        self.store.set_watermark(kind, market, started, full_refresh=full_refresh)
+        logger.info("Synced %s", result)
+        return result
+
+    async def sync_markets(
+        self,
+        markets: dict[str, dict[str, Any]],
+        kinds: tuple[str, ...] = LISTING_KINDS,
+        *,
+        full_refresh: bool = False,
+    ) -> list[SyncResult]:
+        """
+        Sync several markets one after another.
+
+        Args:
+            markets: Mapping of market name to its search filters.
+            kinds: Listing kinds to sync for every market.
+            full_refresh: Force a full refresh of every market.
+
+        Returns:
+            One SyncResult per market and kind.
+        """
+        results = []
+        for market, filters in markets.items():
+            for kind in kinds:
+                results.append(
+                    await self.sync_market(kind, market, full_refresh=full_refresh, **filters)
+                )
+        return results
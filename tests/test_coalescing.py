@@ -0,0 +1,98 @@
+"""
+Tests for coalescing concurrent identical requests in RentCastClient.
+
+Run from the project root with ``pytest tests``.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+
+import httpx
+
+os.environ.setdefault("RENT_CAST_API_KEY", "test")
+
+from app.core.third_party_integrations.rent_cast._synthetic import property_record  # noqa: E402
+from app.core.third_party_integrations.rent_cast.api._coalesce import SingleFlight  # noqa: E402
+from app.core.third_party_integrations.rent_cast.client import RentCastClient  # noqa: E402
+
+
+class SlowProperties:
+    """Serves a new property record per request after a short delay."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        record = property_record(self.requests)
+        await asyncio.sleep(0.02)
+        if request.url.path.endswith("/random"):
+            return httpx.Response(200, json=[record])
+        return httpx.Response(200, json=record)
+
+
+def gather(api: SlowProperties, call, callers: int = 3) -> list:
+    async def run() -> list:
+        client = RentCastClient(
+            api_key="test",
+            transport=httpx.MockTransport(api.handle),
+            rate_limit=None,
+            cache=None,
+        )
+        try:
+            return await asyncio.gather(*(call(client) for _ in range(callers)))
+        finally:
+            await client.close()
+
+    return asyncio.run(run())
+
+
+def test_concurrent_identical_lookups_share_one_request():
+    api = SlowProperties()
+
+    records = gather(
+        api, lambda client: client.property_record.get_property_by_id("5500-Grand-Lake-Dr")
+    )
+
+    assert api.requests == 1
+    assert len({record.id for record in records}) == 1
+
+
+def test_callers_of_a_shared_request_get_independent_results():
+    api = SlowProperties()
+
+    records = gather(api, lambda client: client._request("GET", "/properties/5500"))
+    bedrooms = records[1]["bedrooms"]
+    records[0]["bedrooms"] = 99
+
+    assert api.requests == 1
+    assert [record["bedrooms"] for record in records[1:]] == [bedrooms, bedrooms]
+
+
+def test_concurrent_random_properties_are_not_coalesced():
+    api = SlowProperties()
+
+    responses = gather(
+        api, lambda client: client.random_properties.get_random_properties(limit=1)
+    )
+
+    assert api.requests == 3
+    assert len({response.properties[0].id for response in responses}) == 3
+
+
+def test_single_flight_clones_for_all_but_the_last_caller():
+    flight = SingleFlight(clone=dict)
+    shared = {"value": 1}
+
+    async def fetch() -> dict:
+        await asyncio.sleep(0)
+        return shared
+
+    async def run() -> list[dict]:
+        return await asyncio.gather(*(flight.do("key", fetch) for _ in range(3)))
+
+    results = asyncio.run(run())
+
+    assert sum(result is shared for result in results) == 1
+    assert all(result == shared for result in results)
@@ -0,0 +1,135 @@
+"""
+Tests for incremental listing sync against a simulated RentCast market.
+
+Run from the project root with ``pytest tests``.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+os.environ.setdefault("RENT_CAST_API_KEY", "test")
+
+from app.core.third_party_integrations.rent_cast.client import RentCastClient  # noqa: E402
+from app.core.third_party_integrations.rent_cast.store import (  # noqa: E402
+    SALE,
+    ListingStore,
+    ListingSync,
+)
+from app.core.third_party_integrations.rent_cast.store import sync as sync_module  # noqa: E402
+
+START = datetime(2026, 1, 1, 3, 0, tzinfo=timezone.utc)
+
+
+class Market:
+    """Sale listings of one market, served the way RentCast filters them."""
+
+    def __init__(self) -> None:
+        self.now = START
+        self.listings: dict[str, dict] = {}
+
+    def add(self, listing_id: str, *, listed: datetime, price: float = 400_000) -> None:
+        self.listings[listing_id] = {
+            "id": listing_id,
+            "formattedAddress": f"{listing_id}, Austin, TX 78704",
+            "city": "Austin",
+            "state": "TX",
+            "zipCode": "78704",
+            "propertyType": "Single Family",
+            "status": "Active",
+            "price": price,
+            "listedDate": listed.isoformat(),
+            "removedDate": None,
+        }
+
+    def close(self, listing_id: str) -> None:
+        listing = self.listings[listing_id]
+        listing["status"] = "Inactive"
+        listing["removedDate"] = listing["lastSeenDate"] = self.now.isoformat()
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        days_old = params.get("daysOld")
+        page = []
+        for listing in self.listings.values():
+            if listing["status"] != params["status"]:
+                continue
+            listed = datetime.fromisoformat(listing["listedDate"])
+            if days_old is not None and listed < self.now - timedelta(days=int(days_old)):
+                continue
+            if listing["status"] == "Active":
+                listing["lastSeenDate"] = self.now.isoformat()
+            page.append(dict(listing))
+        offset, limit = int(params["offset"]), int(params["limit"])
+        return httpx.Response(200, json=page[offset:offset + limit])
+
+
+def nightly_syncs(market: Market, days: int, monkeypatch, on_day=None, **sync_kwargs):
+    """Run one sync per simulated night and return (day, result, active count) tuples."""
+    monkeypatch.setattr(sync_module, "utcnow", lambda: market.now)
+    store = ListingStore()
+    client = RentCastClient(
+        api_key="test",
+        transport=httpx.MockTransport(market.handle),
+        rate_limit=None,
+        cache=None,
+    )
+    sync = ListingSync(client, store, **sync_kwargs)
+    history = []
+
+    async def run() -> None:
+        for day in range(days):
+            market.now = START + timedelta(days=day)
+            if on_day is not None:
+                on_day(day)
+            result = await sync.sync_market(SALE, "austin-tx", city="Austin", state="TX")
+            history.append((day, result, store.count(SALE, "austin-tx", active=True)))
+        await client.close()
+
+    asyncio.run(run())
+    return store, history
+
+
+def test_listing_older_than_stale_window_stays_active(monkeypatch):
+    market = Market()
+    market.add("old-listing", listed=START - timedelta(days=30))
+
+    _, history = nightly_syncs(market, 20, monkeypatch, stale_after_days=7)
+
+    for day, result, active in history:
+        assert result.deactivated == 0, day
+        assert active == 1, day
+
+
+def test_listing_older_than_stale_window_stays_active_without_full_refreshes(monkeypatch):
+    market = Market()
+    market.add("old-listing", listed=START - timedelta(days=30))
+
+    _, history = nightly_syncs(
+        market, 20, monkeypatch, stale_after_days=7, full_refresh_days=None
+    )
+
+    assert [active for _, _, active in history] == [1] * 20
+
+
+def test_full_refresh_picks_up_changes_to_older_listings(monkeypatch):
+    market = Market()
+    market.add("closes", listed=START - timedelta(days=30))
+    market.add("reprices", listed=START - timedelta(days=30), price=500_000)
+
+    def on_day(day: int) -> None:
+        if day == 3:
+            market.close("closes")
+            market.listings["reprices"]["price"] = 450_000
+
+    store, history = nightly_syncs(
+        market, 9, monkeypatch, on_day=on_day, full_refresh_days=7
+    )
+
+    full_refresh_days = [day for day, result, _ in history if result.full_refresh]
+    assert full_refresh_days == [0, 7]
+    assert [active for _, _, active in history] == [2] * 7 + [1] * 2
+    assert store.get_listing(SALE, "reprices")["price"] == 450_000
@@ -0,0 +1,61 @@
+"""
+Tests for the columnar market data time series.
+
+Run from the project root with ``pytest tests``.
+"""
+from __future__ import annotations
+
+import math
+import os
+from array import array
+from datetime import date
+
+os.environ.setdefault("RENT_CAST_API_KEY", "test")
+
+from app.core.third_party_integrations.rent_cast.api.market_data.timeseries import (  # noqa: E402
+    FIELDS,
+    MarketTimeSeries,
+    month_index,
+)
+from app.core.third_party_integrations.rent_cast.models.market_data import (  # noqa: E402
+    MarketDataInterval,
+    MarketDataMetric,
+)
+
+NAN = math.nan
+
+
+def series_with_gaps() -> MarketTimeSeries:
+    """Six months of median rent; March and the whole second quarter lack a value."""
+    values = [2000.0, 2100.0, NAN, NAN, NAN, NAN]
+    counts = [10.0, 12.0, 11.0, NAN, 9.0, NAN]
+    columns = {name: array("d", [NAN] * len(values)) for name in FIELDS}
+    columns["value"] = array("d", values)
+    columns["count"] = array("d", counts)
+    return MarketTimeSeries(
+        MarketDataMetric.MEDIAN_RENT,
+        "Single Family",
+        months=array("i", (month_index(date(2026, month, 1)) for month in range(1, 7))),
+        columns=columns,
+    )
+
+
+def test_to_points_skips_months_without_a_value():
+    points = series_with_gaps().to_points()
+
+    assert [(point.date, point.value, point.count) for point in points] == [
+        (date(2026, 1, 1), 2000.0, 10),
+        (date(2026, 2, 1), 2100.0, 12),
+    ]
+    assert points[0].min is None
+
+
+def test_to_points_after_resampling_periods_with_gaps():
+    quarterly = series_with_gaps().resample(MarketDataInterval.QUARTERLY)
+
+    points = quarterly.to_points()
+
+    assert len(quarterly) == 2
+    assert [(point.date, point.value, point.count) for point in points] == [
+        (date(2026, 1, 1), 2050.0, 33),
+    ]
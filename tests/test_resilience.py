@@ -0,0 +1,182 @@
+"""
+Tests for retries, circuit breakers and deadlines in RentCastClient.
+
+Run from the project root with ``pytest tests``.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+
+import httpx
+import pytest
+
+os.environ.setdefault("RENT_CAST_API_KEY", "test")
+
+from app.core.third_party_integrations.rent_cast._synthetic import property_record  # noqa: E402
+from app.core.third_party_integrations.rent_cast.api._circuit_breaker import (  # noqa: E402
+    CircuitBreakers,
+)
+from app.core.third_party_integrations.rent_cast.api._deadline import deadline  # noqa: E402
+from app.core.third_party_integrations.rent_cast.api._exceptions import (  # noqa: E402
+    RentCastAPIError,
+    RentCastCircuitOpenError,
+    RentCastRateLimitError,
+    RentCastTimeoutError,
+    RentCastValidationError,
+)
+from app.core.third_party_integrations.rent_cast.api._retry import RetryPolicy  # noqa: E402
+from app.core.third_party_integrations.rent_cast.client import RentCastClient  # noqa: E402
+
+FAST_RETRIES = RetryPolicy(max_retries=3, base_delay=0.01, max_delay=0.05, seed=0)
+
+
+class ScriptedAPI:
+    """Answers requests with scripted responses, then with a property record."""
+
+    def __init__(self, *responses: httpx.Response, latency: float = 0.0) -> None:
+        self.responses = list(responses)
+        self.latency = latency
+        self.requests = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.responses:
+            return self.responses.pop(0)
+        return httpx.Response(200, json=property_record(self.requests))
+
+
+def call(api: ScriptedAPI, request, **client_kwargs):
+    """Run ``request(client)`` against the scripted API and return the result."""
+    client_kwargs.setdefault("retry_policy", FAST_RETRIES)
+
+    async def run():
+        client = RentCastClient(
+            api_key="test",
+            transport=httpx.MockTransport(api.handle),
+            rate_limit=None,
+            cache=None,
+            **client_kwargs,
+        )
+        try:
+            return await request(client)
+        finally:
+            await client.close()
+
+    return asyncio.run(run())
+
+
+def get_property(client: RentCastClient):
+    return client._request("GET", "/properties/5500-Grand-Lake-Dr")
+
+
+def test_server_errors_are_retried_until_success():
+    api = ScriptedAPI(httpx.Response(503), httpx.Response(502))
+
+    record = call(api, get_property)
+
+    assert api.requests == 3
+    assert record["propertyId"] == property_record(3)["propertyId"]
+
+
+def test_server_errors_fail_once_retries_run_out():
+    api = ScriptedAPI(*[httpx.Response(500)] * 10)
+
+    with pytest.raises(RentCastAPIError):
+        call(api, get_property)
+
+    assert api.requests == FAST_RETRIES.max_retries + 1
+
+
+def test_client_errors_are_not_retried():
+    api = ScriptedAPI(httpx.Response(400, json={"message": "Invalid address"}))
+
+    with pytest.raises(RentCastValidationError, match="Invalid address"):
+        call(api, get_property)
+
+    assert api.requests == 1
+
+
+def test_rate_limited_request_waits_for_retry_after():
+    api = ScriptedAPI(httpx.Response(429, headers={"Retry-After": "1"}))
+
+    started = time.monotonic()
+    call(api, get_property)
+
+    # Retry-After is capped at the policy's max_delay of 0.05 seconds.
+    assert time.monotonic() - started >= 0.05
+    assert api.requests == 2
+
+
+def test_rate_limit_error_once_retries_run_out():
+    api = ScriptedAPI(*[httpx.Response(429, headers={"Retry-After": "0"})] * 10)
+
+    with pytest.raises(RentCastRateLimitError):
+        call(api, get_property, retry_policy=RetryPolicy(max_retries=1, base_delay=0.01))
+
+    assert api.requests == 2
+
+
+def test_open_breaker_fails_fast_without_a_request():
+    api = ScriptedAPI(*[httpx.Response(500)] * 2)
+    breakers = CircuitBreakers(min_requests=2, open_duration=60.0)
+
+    async def request(client: RentCastClient) -> None:
+        for _ in range(2):
+            with pytest.raises(RentCastAPIError):
+                await get_property(client)
+        with pytest.raises(RentCastCircuitOpenError):
+            await client.property_record.get_property_by_id("5500-Grand-Lake-Dr")
+
+    call(api, request, retry_policy=RetryPolicy(max_retries=0), circuit_breakers=breakers)
+
+    assert api.requests == 2
+    assert breakers["properties"].state == "open"
+
+
+def test_deadline_cuts_a_slow_request_short():
+    api = ScriptedAPI(latency=1.0)
+
+    started = time.monotonic()
+    with pytest.raises(RentCastTimeoutError):
+        call(
+            api,
+            lambda client: client.property_record.get_property_by_id(
+                "5500-Grand-Lake-Dr", deadline=0.05
+            ),
+        )
+
+    assert time.monotonic() - started < 0.5
+
+
+def test_deadline_gives_up_instead_of_sleeping_past_it():
+    api = ScriptedAPI(httpx.Response(503, headers={"Retry-After": "10"}))
+
+    started = time.monotonic()
+    with pytest.raises(RentCastTimeoutError):
+        call(
+            api,
+            lambda client: client._request("GET", "/properties/5500", deadline=0.5),
+            retry_policy=RetryPolicy(max_retries=3, base_delay=0.01, max_delay=30.0),
+        )
+
+    assert api.requests == 1
+    assert time.monotonic() - started < 0.5
+
+
+def test_deadline_scope_spans_several_calls():
+    api = ScriptedAPI(latency=0.1)
+
+    async def request(client: RentCastClient) -> int:
+        done = 0
+        with deadline(0.25):
+            with pytest.raises(RentCastTimeoutError):
+                for _ in range(5):
+                    await get_property(client)
+                    done += 1
+        return done
+
+    assert call(api, request) == 2
@@ -0,0 +1,78 @@
+"""
+Tests for response caching in RentCastClient.
+
+Run from the project root with ``pytest tests``.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+
+import httpx
+
+os.environ.setdefault("RENT_CAST_API_KEY", "test")
+
+from app.core.third_party_integrations.rent_cast._synthetic import property_record  # noqa: E402
+from app.core.third_party_integrations.rent_cast.api._cache import MemoryCache  # noqa: E402
+from app.core.third_party_integrations.rent_cast.client import RentCastClient  # noqa: E402
+
+
+class Properties:
+    """Serves a new property record on every request, counting the requests."""
+
+    def __init__(self) -> None:
+        self.requests: list[str] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url.path)
+        record = property_record(len(self.requests))
+        if request.url.path.endswith("/random"):
+            return httpx.Response(200, json=[record])
+        return httpx.Response(200, json=record)
+
+
+def make_client(api: Properties) -> RentCastClient:
+    return RentCastClient(
+        api_key="test",
+        transport=httpx.MockTransport(api.handle),
+        rate_limit=None,
+        cache=MemoryCache(),
+    )
+
+
+def test_repeated_lookups_are_served_from_the_cache():
+    api = Properties()
+
+    async def run() -> list:
+        client = make_client(api)
+        try:
+            return [
+                await client.property_record.get_property_by_id("5500-Grand-Lake-Dr")
+                for _ in range(3)
+            ]
+        finally:
+            await client.close()
+
+    records = asyncio.run(run())
+
+    assert len(api.requests) == 1
+    assert len({record.id for record in records}) == 1
+
+
+def test_random_properties_are_never_cached():
+    api = Properties()
+
+    async def run() -> list:
+        client = make_client(api)
+        try:
+            return [
+                await client.random_properties.get_random_properties(limit=1)
+                for _ in range(3)
+            ]
+        finally:
+            await client.close()
+
+    responses = asyncio.run(run())
+
+    assert api.requests == ["/v1/properties/random"] * 3
+    assert len({response.properties[0].id for response in responses}) == 3
@@ -0,0 +1,81 @@
+"""
+Tests for answering radius searches from the in-process spatial index.
+
+Run from the project root with ``pytest tests``.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+
+import pytest
+
+os.environ.setdefault("RENT_CAST_API_KEY", "test")
+
+from app.core.third_party_integrations.rent_cast.store import CachedRadiusSearch  # noqa: E402
+
+RECORDS = [
+    {"id": f"listing-{i}", "latitude": 30.25 + i * 0.001, "longitude": -97.75}
+    for i in range(5)
+]
+
+
+class Area:
+    """Fake radius search API counting calls, optionally failing mid-way."""
+
+    def __init__(self, fail_after: int | None = None) -> None:
+        self.calls = 0
+        self.fail_after = fail_after
+
+    async def iterate(self, *, latitude: float, longitude: float, radius: float):
+        self.calls += 1
+        for i, record in enumerate(RECORDS):
+            if self.fail_after is not None and i == self.fail_after:
+                raise ConnectionError("connection reset")
+            yield record
+
+    async def first_page(self, *, latitude: float, longitude: float, radius: float):
+        self.calls += 1
+        return RECORDS[:2]
+
+
+def test_exhausted_iterator_covers_the_area():
+    area = Area()
+    search = CachedRadiusSearch(area.iterate)
+
+    async def run() -> tuple[list, list]:
+        first = await search.within_radius(30.25, -97.75, 2.0)
+        second = await search.within_radius(30.251, -97.75, 1.0)
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert area.calls == 1
+    assert len(first) == len(second) == 5
+    assert (search.hits, search.misses) == (1, 1)
+
+
+def test_interrupted_iterator_leaves_the_area_uncovered():
+    area = Area(fail_after=2)
+    search = CachedRadiusSearch(area.iterate)
+
+    async def run() -> list:
+        with pytest.raises(ConnectionError):
+            await search.within_radius(30.25, -97.75, 2.0)
+        area.fail_after = None
+        return await search.within_radius(30.25, -97.75, 2.0)
+
+    records = asyncio.run(run())
+
+    assert area.calls == 2
+    assert len(records) == 5
+
+
+def test_single_page_fetch_is_rejected():
+    area = Area()
+    search = CachedRadiusSearch(area.first_page)
+
+    with pytest.raises(TypeError, match="async iterator"):
+        asyncio.run(search.within_radius(30.25, -97.75, 2.0))
+
+    assert not search.index.is_covered(30.25, -97.75, 2.0)
@@ -0,0 +1,373 @@
+"""
+Pluggable HTTP transports for running the RentCast client offline.
+
+Any of these transports can be passed to ``RentCastClient`` through the
+``transport`` keyword argument (which is forwarded to ``httpx.AsyncClient``):
+
+* ``RecordingTransport`` forwards requests to the real API and appends every
+  response to a compact JSON-lines cassette (gzip-compressed for ``.gz`` paths).
+* ``ReplayTransport`` serves a recorded cassette, with configurable latency and
+  jitter, without any network access.
+* ``SyntheticTransport`` serves generated, paginated datasets of any size for
+  the listing and property endpoints, optionally injecting 429 and 5xx errors.
+
+Example:
+    ```python
+    client = RentCastClient(
+        api_key="offline",
+        transport=SyntheticTransport(total=100_000, latency=0.05, jitter=0.02),
+    )
+    async for listing in client.listings.sale.iter_sale_listings(state="TX", lite=True):
+        ...
+    ```
+"""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import random
+import re
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import IO, Any, Callable, Iterable
+
+import httpx
+
+from ._synthetic import property_record, rental_listing, sale_listing
+
+# Response headers kept in cassettes; everything else is dropped.
+_RECORDED_HEADERS = ("content-type", "retry-after")
+
+
+def _open_cassette(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return path.open(mode, encoding="utf-8")
+
+
+def _request_key(method: str, path: str, query: Iterable[tuple[str, str]]) -> str:
+    """Identity of a request, independent of query parameter order."""
+    return f"{method.upper()} {path}?{'&'.join(f'{k}={v}' for k, v in sorted(query))}"
+
+
+class CassetteMissError(LookupError):
+    """Raised by ReplayTransport for a request that is not in the cassette."""
+
+
+class Cassette:
+    """
+    Recorded responses, keyed by method, path and query parameters.
+
+    Entries are stored one JSON object per line with the request method, path
+    and query, the response status, selected headers, body and the time the
+    real request took. Request headers, including the API key, are never stored.
+    """
+
+    def __init__(self, entries: Iterable[dict[str, Any]] = ()) -> None:
+        self._entries: dict[str, list[dict[str, Any]]] = {}
+        self._positions: dict[str, int] = {}
+        for entry in entries:
+            self.add(entry)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    @staticmethod
+    def entry_key(entry: dict[str, Any]) -> str:
+        return _request_key(entry["method"], entry["path"], entry["query"])
+
+    def add(self, entry: dict[str, Any]) -> None:
+        """Add a recorded response."""
+        self._entries.setdefault(self.entry_key(entry), []).append(entry)
+
+    def lookup(self, request: httpx.Request) -> dict[str, Any] | None:
+        """
+        Find the recorded response for a request.
+
+        When the same request was recorded several times, successive lookups
+        return the recordings in order and then keep returning the last one.
+        """
+        key = _request_key(request.method, request.url.path, request.url.params.multi_items())
+        entries = self._entries.get(key)
+        if not entries:
+            return None
+        position = self._positions.get(key, 0)
+        self._positions[key] = position + 1
+        return entries[min(position, len(entries) - 1)]
+
+    @classmethod
+    def load(cls, path: str | Path) -> Cassette:
+        """Read a cassette file."""
+        with _open_cassette(Path(path), "r") as f:
+            return cls(json.loads(line) for line in f if line.strip())
+
+    def save(self, path: str | Path) -> None:
+        """Write every entry to a cassette file."""
+        with _open_cassette(Path(path), "w") as f:
+            for entries in self._entries.values():
+                for entry in entries:
+                    f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that sends requests to the real API and records the responses.
+
+    Each response is appended to the cassette file as soon as it arrives, so a
+    partial recording survives an interrupted run.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            path: Cassette file to append to (``.gz`` for gzip compression).
+            transport: Transport used for the real requests (defaults to a
+                standard ``httpx.AsyncHTTPTransport``).
+        """
+        self.path = Path(path)
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self._file = _open_cassette(self.path, "a")
+        self.recorded = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self._transport.handle_async_request(request)
+        body = await response.aread()
+        await response.aclose()
+        elapsed = time.perf_counter() - started
+
+        headers = {
+            name: response.headers[name]
+            for name in _RECORDED_HEADERS
+            if name in response.headers
+        }
+        entry = {
+            "method": request.method,
+            "path": request.url.path,
+            "query": request.url.params.multi_items(),
+            "status": response.status_code,
+            "headers": headers,
+            "body": body.decode("utf-8", errors="replace"),
+            "elapsed": round(elapsed, 4),
+        }
+        self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self.recorded += 1
+        # The body is already decoded, so drop the headers describing the encoding.
+        passthrough = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+        ]
+        return httpx.Response(
+            response.status_code, headers=passthrough, content=body, request=request
+        )
+
+    async def aclose(self) -> None:
+        self._file.close()
+        await self._transport.aclose()
+
+
+class _SimulatedLatency:
+    """Latency of a simulated request: ``latency`` +/- uniform ``jitter`` seconds."""
+
+    def __init__(self, latency: float, jitter: float, seed: int | None) -> None:
+        if latency < 0 or jitter < 0:
+            raise ValueError("latency and jitter must be 0 or greater")
+        self.latency = latency
+        self.jitter = jitter
+        self._rng = random.Random(seed)
+
+    async def wait(self) -> None:
+        delay = self.latency
+        if self.jitter:
+            delay += self._rng.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that serves responses from a cassette.
+
+    Example:
+        ```python
+        transport = ReplayTransport("rentcast.jsonl.gz", latency=0.08, jitter=0.03)
+        client = RentCastClient(api_key="offline", transport=transport)
+        ```
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette | str | Path,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: int | None = None,
+        strict: bool = True,
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            cassette: A Cassette, or the path of a cassette file.
+            latency: Simulated response time in seconds.
+            jitter: Maximum random deviation from ``latency`` in seconds.
+            seed: Seed for the jitter, for reproducible runs.
+            strict: Raise CassetteMissError for unrecorded requests; otherwise
+                answer them with a 404 response.
+        """
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette.load(cassette)
+        self.strict = strict
+        self._latency = _SimulatedLatency(latency, jitter, seed)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self._latency.wait()
+        entry = self.cassette.lookup(request)
+        if entry is None:
+            if self.strict:
+                raise CassetteMissError(f"No recorded response for {request.method} {request.url}")
+            return httpx.Response(
+                404, json={"message": "No recorded response"}, request=request
+            )
+        return httpx.Response(
+            entry["status"],
+            headers=entry["headers"],
+            content=entry["body"].encode("utf-8"),
+            request=request,
+        )
+
+
+# Synthetic endpoints: path pattern, page key (None for single records) and record factory.
+_SYNTHETIC_ROUTES: list[tuple[re.Pattern, str | None, Callable[[int, int], dict[str, Any]]]] = [
+    (re.compile(r"/listings/sale$"), "data", sale_listing),
+    (re.compile(r"/listings/sale/(?P<id>[^/]+)$"), None, sale_listing),
+    (re.compile(r"/listings/rental/long-term$"), "data", rental_listing),
+    (re.compile(r"/listings/rental/long-term/(?P<id>[^/]+)$"), None, rental_listing),
+    (re.compile(r"/properties$"), "properties", property_record),
+    (re.compile(r"/properties/random$"), "properties", property_record),
+    (re.compile(r"/properties/(?P<id>[^/]+)$"), None, property_record),
+]
+
+# Generated record IDs start with the street number, which is 100 + index.
+_ID_INDEX = re.compile(r"^(\d+)-")
+
+
+class SyntheticTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that serves a generated dataset of ``total`` records per endpoint.
+
+    The paginated search endpoints honour ``limit`` and ``offset``, and the
+    by-ID endpoints return the record with that ID. Records are deterministic
+    for a given ``seed`` and mirror the shape of real responses, so parsing and
+    pagination costs are representative. Search filters are ignored.
+    """
+
+    def __init__(
+        self,
+        total: int = 10_000,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: int = 0,
+        throttle_rate: float = 0.0,
+        error_rate: float = 0.0,
+        page_cache_size: int = 64,
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            total: Number of records in each synthetic dataset.
+            latency: Simulated response time in seconds.
+            jitter: Maximum random deviation from ``latency`` in seconds.
+            seed: Seed for the records, the jitter and injected errors.
+            throttle_rate: Share of requests answered with 429 (Retry-After: 1).
+            error_rate: Share of requests answered with 503.
+            page_cache_size: Number of encoded pages kept for reuse.
+        """
+        if total < 0:
+            raise ValueError("total must be 0 or greater")
+        self.total = total
+        self.seed = seed
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.requests = 0
+        self._latency = _SimulatedLatency(latency, jitter, seed)
+        self._rng = random.Random(seed)
+        self._pages: OrderedDict[tuple[str, int, int], bytes] = OrderedDict()
+        self._page_cache_size = page_cache_size
+
+    def _page(
+        self,
+        path: str,
+        key: str,
+        factory: Callable[[int, int], dict[str, Any]],
+        limit: int,
+        offset: int,
+    ) -> bytes:
+        cache_key = (path, limit, offset)
+        body = self._pages.get(cache_key)
+        if body is not None:
+            self._pages.move_to_end(cache_key)
+            return body
+        records = [factory(i, self.seed) for i in range(offset, min(offset + limit, self.total))]
+        body = json.dumps({
+            key: records,
+            "total": self.total,
+            "page": offset // max(1, limit) + 1,
+            "limit": limit,
+            "offset": offset,
+            "hasMore": offset + limit < self.total,
+        }).encode()
+        self._pages[cache_key] = body
+        if len(self._pages) > self._page_cache_size:
+            self._pages.popitem(last=False)
+        return body
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        await self._latency.wait()
+
+        roll = self._rng.random()
+        if roll < self.throttle_rate:
+            return httpx.Response(
+                429,
+                headers={"Retry-After": "1"},
+                json={"message": "Rate limit exceeded"},
+                request=request,
+            )
+        if roll < self.throttle_rate + self.error_rate:
+            return httpx.Response(503, json={"message": "Service unavailable"}, request=request)
+
+        path = request.url.path
+        params = request.url.params
+        for pattern, key, factory in _SYNTHETIC_ROUTES:
+            match = pattern.search(path)
+            if match is None:
+                continue
+            if key is None:
+                index = _ID_INDEX.match(match["id"])
+                if index is None or not 0 <= int(index[1]) - 100 < self.total:
+                    return httpx.Response(404, json={"message": "Not found"}, request=request)
+                record = factory(int(index[1]) - 100, self.seed)
+                return httpx.Response(200, json=record, request=request)
+            limit = int(params.get("limit", 50))
+            offset = int(params.get("offset", 0))
+            if path.endswith("/random"):
+                offset = self._rng.randrange(max(1, self.total - limit + 1))
+            return httpx.Response(
+                200,
+                content=self._page(path, key, factory, limit, offset),
+                headers={"Content-Type": "application/json"},
+                request=request,
+            )
+        return httpx.Response(404, json={"message": "Unknown endpoint"}, request=request)